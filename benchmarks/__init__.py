@@ -0,0 +1 @@
+"""Benchmarks de rendimiento; cada módulo se ejecuta con ``python -m benchmarks.<nombre>``."""
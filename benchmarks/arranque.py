@@ -0,0 +1,93 @@
+"""Tiempo de arranque de ``main.py`` hasta mostrar el menú principal.
+
+Ejecuta la aplicación en un proceso nuevo con una base de datos temporal y
+la opción "0" (salir) en la entrada estándar, y mide:
+
+- ``primera``: primera ejecución (crea el esquema y carga los grupos);
+- ``siguientes``: ejecuciones posteriores sobre la misma base de datos;
+- ``abrir_db`` y ``actualizar_esquema``: en este proceso, abrir la base de
+  datos existente frente a forzar la sincronización completa del esquema.
+
+Termina con error si la mediana de ``siguientes`` supera el presupuesto.
+
+Uso::
+
+    python -m benchmarks.arranque [--repeticiones 10] [--presupuesto-ms 500]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from db.database import Database
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Mediana máxima aceptada para ``siguientes``, en milisegundos
+PRESUPUESTO_MS = 500
+
+
+def ejecutar_main(db_path):
+    """Ejecuta ``main.py`` hasta el menú principal y retorna los segundos transcurridos"""
+    entorno = dict(os.environ, SEMILLEROS_DB=db_path)
+    inicio = time.perf_counter()
+    subprocess.run(
+        [sys.executable, os.path.join(RAIZ, "main.py")],
+        input="0\n", text=True, capture_output=True, check=True, cwd=RAIZ, env=entorno,
+    )
+    return time.perf_counter() - inicio
+
+
+def medir_apertura(db_path, repeticiones):
+    """Mediana de abrir la base de datos con y sin la comprobación rápida del esquema"""
+    abrir, actualizar = [], []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        db = Database(db_path)
+        abrir.append(time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        db.actualizar_esquema()
+        actualizar.append(time.perf_counter() - inicio)
+        db.cerrar()
+    return statistics.median(abrir), statistics.median(actualizar)
+
+
+def medir(repeticiones=10):
+    """Mide el arranque sobre una base de datos temporal
+
+    Returns:
+        dict: medición -> segundos (mediana de ``repeticiones``; la primera ejecución se mide una vez)
+    """
+    directorio = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(directorio, "arranque.db")
+        resultados = {"primera": ejecutar_main(db_path)}
+        resultados["siguientes"] = statistics.median(ejecutar_main(db_path) for _ in range(repeticiones))
+        resultados["abrir_db"], resultados["actualizar_esquema"] = medir_apertura(db_path, repeticiones)
+        return resultados
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide el tiempo de arranque de la aplicación")
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--presupuesto-ms", type=float, default=PRESUPUESTO_MS)
+    args = parser.parse_args(argv)
+
+    resultados = medir(args.repeticiones)
+    for medicion, segundos in resultados.items():
+        print(f"{medicion:<20} {segundos * 1000:>9.1f} ms")
+
+    if resultados["siguientes"] * 1000 > args.presupuesto_ms:
+        print(f"El arranque supera el presupuesto de {args.presupuesto_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
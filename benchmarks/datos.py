@@ -0,0 +1,243 @@
+"""Generador de datos sintéticos reproducibles para los benchmarks.
+
+A partir de una semilla y un número de semilleros genera, siempre igual:
+
+- grupos de investigación (uno por cada 200 semilleros, mínimo 8);
+- semilleros en ambos estados, con objetivo principal y de 1 a 4 objetivos
+  específicos redactados a partir de vocabulario de investigación;
+- de 2 a 5 estudiantes y 1 o 2 tutores por semillero; los tutores salen de
+  un grupo reducido de docentes, así que cada uno acompaña varios semilleros;
+- un entregable para el 70 % de los semilleros, de cualquier tipo y estado.
+
+Las fechas también se derivan de la semilla. Las filas se insertan por
+bloques de semilleros, con IDs explícitos, en una base de datos nueva que
+solo tiene las tablas de las migraciones: los índices, las tablas de
+búsqueda y de resumen y los triggers se crean al final con
+``Database.sincronizar_esquema``, que carga de una vez los datos existentes
+en lugar de mantenerlos fila por fila.
+
+Uso::
+
+    python -m benchmarks.datos destino.db [--semilleros 1000] [--semilla 1]
+"""
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+
+from db.database import Database
+from db.migraciones import Migrador
+from models.entregable import Entregable
+from models.semillero import Semillero
+
+NOMBRES = [
+    "Ana", "Luis", "Camila", "Andrés", "Valentina", "Santiago", "Laura", "Felipe", "Daniela", "Juan",
+    "María", "Carlos", "Sofía", "Diego", "Paula", "Sebastián", "Natalia", "Jorge", "Isabella", "Mateo",
+]
+APELLIDOS = [
+    "Rodríguez", "Gómez", "Martínez", "López", "García", "Pérez", "Sánchez", "Ramírez", "Torres", "Rojas",
+    "Vargas", "Moreno", "Castro", "Ortiz", "Suárez", "Jiménez", "Herrera", "Medina", "Castillo", "Parra",
+]
+AREAS = [
+    "Emprendimiento", "Sostenibilidad", "Ingeniería de procesos", "Tecnologías de información", "Educación",
+    "Humanidades", "Lingüística", "Gestión del conocimiento", "Economía circular", "Salud pública",
+]
+TEMAS = [
+    "energías renovables", "inteligencia artificial", "economía circular", "movilidad urbana",
+    "agricultura de precisión", "gestión del agua", "finanzas sostenibles", "ciudades inteligentes",
+    "analítica de datos", "innovación social", "comercio electrónico", "aprendizaje automático",
+    "transformación digital", "cadenas de suministro", "bienestar laboral", "educación virtual",
+]
+VERBOS = [
+    "Analizar", "Diseñar", "Evaluar", "Desarrollar", "Caracterizar", "Implementar", "Proponer", "Validar",
+    "Documentar", "Comparar",
+]
+OBJETOS = [
+    "un modelo de", "el impacto de", "una metodología para", "indicadores de", "un prototipo de",
+    "las prácticas de", "una estrategia de", "los factores de éxito de",
+]
+CONTEXTOS = [
+    "en pequeñas empresas", "en la ciudad de Bogotá", "en instituciones educativas", "en zonas rurales",
+    "en el sector público", "en comunidades vulnerables", "en la industria manufacturera", "en Colombia",
+]
+
+# Fracción de semilleros con entregable
+PROPORCION_ENTREGABLES = 0.7
+
+INICIO_FECHAS = datetime(2020, 1, 1)
+
+
+def cantidades(semilleros):
+    """Número de grupos y de tutores distintos para ``semilleros`` semilleros"""
+    return {"grupos": max(8, semilleros // 200), "tutores": max(20, semilleros // 10)}
+
+
+class GeneradorDatos:
+    """Genera e inserta los datos sintéticos de una semilla"""
+
+    def __init__(self, semilla=1):
+        self.rng = random.Random(semilla)
+
+    def _nombre(self):
+        return f"{self.rng.choice(NOMBRES)} {self.rng.choice(APELLIDOS)} {self.rng.choice(APELLIDOS)}"
+
+    def _email(self, nombre, numero):
+        usuario = nombre.split()[0].lower()
+        return f"{usuario}.{numero}@universidadean.edu.co"
+
+    def _instante(self, desde=INICIO_FECHAS, dias=5 * 365):
+        """Momento aleatorio en los ``dias`` siguientes a ``desde``"""
+        return desde + timedelta(seconds=self.rng.randrange(dias * 86400), milliseconds=self.rng.randrange(1000))
+
+    @staticmethod
+    def _texto(instante):
+        """Fecha en el formato de ``db.esquema.AHORA``"""
+        return instante.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+    def objetivo(self):
+        """Objetivo de investigación, p. ej. 'Evaluar el impacto de la movilidad urbana en Colombia'"""
+        return (
+            f"{self.rng.choice(VERBOS)} {self.rng.choice(OBJETOS)} {self.rng.choice(TEMAS)} "
+            f"{self.rng.choice(CONTEXTOS)}"
+        )
+
+    def semillero(self, grupos):
+        """Semillero válido (sin ID) para crearlo con ``SemilleroService``"""
+        tema = self.rng.choice(TEMAS)
+        semillero = Semillero(
+            nombre=f"Semillero de {tema} {self.rng.randrange(10 ** 6):06d}",
+            objetivo_principal=self.objetivo(),
+            objetivos_especificos=[self.objetivo() for _ in range(self.rng.randint(1, 4))],
+            grupo_id=self.rng.randint(1, grupos),
+        )
+        semillero.estudiantes = [self._nombre() for _ in range(self.rng.randint(2, 5))]
+        semillero.tutores = [self._nombre() for _ in range(self.rng.randint(1, 2))]
+        return semillero
+
+    def generar(self, ruta, semilleros, lote=10000):
+        """Crea una base de datos con los datos sintéticos
+
+        Args:
+            ruta (str): Archivo de la base de datos; no debe existir
+            semilleros (int): Número de semilleros
+            lote (int): Semilleros insertados por transacción
+
+        Returns:
+            dict: tabla -> filas insertadas
+        """
+        if os.path.exists(ruta):
+            raise ValueError(f"La base de datos {ruta} ya existe")
+
+        db = Database(ruta, perfil="fast", migrar=False)
+        try:
+            Migrador(db, progreso=None).migrar()
+            conteo = self._insertar(db, semilleros, lote)
+            db.sincronizar_esquema()
+            db.execute_query("ANALYZE")
+            # ANALYZE crea sqlite_stat1 y cambia el schema_version: se vuelve a
+            # guardar la huella (sin cambios de DDL) para que abrir la base no
+            # sincronice el esquema otra vez
+            db.sincronizar_esquema()
+        finally:
+            db.cerrar()
+        return conteo
+
+    def _insertar(self, db, semilleros, lote):
+        totales = cantidades(semilleros)
+        rng = self.rng
+
+        grupos = []
+        for numero in range(1, totales["grupos"] + 1):
+            area = AREAS[(numero - 1) % len(AREAS)]
+            grupos.append((
+                numero, f"Grupo de investigación en {area.lower()} {numero}", area,
+                f"COL{numero:07d}", self._nombre(), self._texto(self._instante()),
+            ))
+        db.execute_many(
+            "INSERT INTO grupos_investigacion (id, nombre, campo, identificador, director, actualizado_en) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            grupos,
+        )
+        tutores = [self._nombre() for _ in range(totales["tutores"])]
+
+        conteo = {"grupos_investigacion": len(grupos), "semilleros": 0, "semillero_objetivos": 0,
+                  "investigadores": 0, "entregables": 0}
+        investigador_id = entregable_id = 0
+        for inicio in range(1, semilleros + 1, lote):
+            filas_semilleros, objetivos, investigadores, entregables = [], [], [], []
+            for semillero_id in range(inicio, min(inicio + lote, semilleros + 1)):
+                tema = rng.choice(TEMAS)
+                creado_en = self._instante()
+                actualizado_en = self._texto(self._instante(creado_en, 365))
+                filas_semilleros.append((
+                    semillero_id, f"Semillero de {tema} {semillero_id}", self.objetivo(),
+                    rng.randint(1, len(grupos)), rng.choice(Semillero.ESTADOS), self._texto(creado_en),
+                    actualizado_en,
+                ))
+                for posicion in range(rng.randint(1, 4)):
+                    objetivos.append((semillero_id, posicion, self.objetivo()))
+
+                for _ in range(rng.randint(2, 5)):
+                    investigador_id += 1
+                    nombre = self._nombre()
+                    investigadores.append((
+                        investigador_id, nombre, "estudiante", f"{rng.randrange(10 ** 9, 10 ** 10)}",
+                        self._email(nombre, investigador_id), semillero_id, actualizado_en,
+                    ))
+                for tutor in rng.sample(range(len(tutores)), rng.randint(1, 2)):
+                    investigador_id += 1
+                    investigadores.append((
+                        investigador_id, tutores[tutor], "tutor", None, self._email(tutores[tutor], tutor),
+                        semillero_id, actualizado_en,
+                    ))
+
+                if rng.random() < PROPORCION_ENTREGABLES:
+                    entregable_id += 1
+                    tipo = rng.choice(Entregable.TIPOS_VALIDOS)
+                    entregables.append((
+                        entregable_id, f"{tipo}: {tema}", self.objetivo(), tipo, semillero_id,
+                        self._texto(self._instante())[:10], rng.choice(Entregable.ESTADOS), actualizado_en,
+                    ))
+
+            with db.transaction():
+                db.execute_many(
+                    "INSERT INTO semilleros (semillero_id, nombre, objetivo_principal, grupo_id, status, "
+                    "creado_en, actualizado_en) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    filas_semilleros,
+                )
+                db.execute_many(
+                    "INSERT INTO semillero_objetivos (semillero_id, posicion, objetivo) VALUES (?, ?, ?)",
+                    objetivos,
+                )
+                db.execute_many(
+                    "INSERT INTO investigadores (id, nombre, tipo, identificacion, email, semillero_id, "
+                    "actualizado_en) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    investigadores,
+                )
+                if entregables:
+                    db.execute_many(
+                        "INSERT INTO entregables (id, titulo, descripcion, tipo, semillero_id, fecha_entrega, "
+                        "estado, actualizado_en) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        entregables,
+                    )
+            conteo["semilleros"] += len(filas_semilleros)
+            conteo["semillero_objetivos"] += len(objetivos)
+            conteo["investigadores"] += len(investigadores)
+            conteo["entregables"] += len(entregables)
+        return conteo
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera una base de datos sintética para benchmarks")
+    parser.add_argument("destino", help="Archivo de base de datos (no debe existir)")
+    parser.add_argument("--semilleros", type=int, default=1000)
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    conteo = GeneradorDatos(args.semilla).generar(args.destino, args.semilleros)
+    for tabla, filas in conteo.items():
+        print(f"{tabla:<22} {filas:>10,}")
+
+
+if __name__ == "__main__":
+    main()
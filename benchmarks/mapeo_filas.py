@@ -0,0 +1,86 @@
+"""Materialización de filas: acceso por nombre en ``sqlite3.Row`` frente al mapeador compilado.
+
+Compara, sobre la misma consulta de grupos:
+
+- ``row``: filas ``sqlite3.Row`` y ``Grupo(id=fila['id'], ...)`` (la forma anterior);
+- ``mapeador``: filas como tuplas convertidas con ``Database.consultar_modelos``.
+
+Uso::
+
+    python -m benchmarks.mapeo_filas [--filas 100000] [--repeticiones 5]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from db.database import Database
+from models.grupo import Grupo
+
+QUERY = "SELECT id, nombre, campo, identificador, director FROM grupos_investigacion"
+
+
+def por_nombre(db):
+    return [
+        Grupo(
+            id=fila['id'],
+            nombre=fila['nombre'],
+            campo=fila['campo'],
+            identificador=fila['identificador'],
+            director=fila['director']
+        )
+        for fila in db.execute_query(QUERY, fetch='all')
+    ]
+
+
+def con_mapeador(db):
+    return db.consultar_modelos(QUERY, clase=Grupo)
+
+
+def mejor_tiempo(funcion, db, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(db)
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+def medir(filas=100000, repeticiones=5):
+    """Mide ambas rutas sobre una base temporal con ``filas`` grupos
+
+    Returns:
+        dict: ruta -> segundos (mejor de ``repeticiones``)
+    """
+    directorio = tempfile.mkdtemp()
+    try:
+        db = Database(os.path.join(directorio, "bench.db"), perfil="fast")
+        db.execute_many(
+            "INSERT INTO grupos_investigacion (nombre, campo, identificador, director) VALUES (?, ?, ?, ?)",
+            [(f"Grupo {i}", "Ingeniería", f"COL{i:07d}", f"Director {i}") for i in range(filas)]
+        )
+        resultados = {
+            "row": mejor_tiempo(por_nombre, db, repeticiones),
+            "mapeador": mejor_tiempo(con_mapeador, db, repeticiones),
+        }
+        db.cerrar()
+        return resultados
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara la materialización de filas en modelos")
+    parser.add_argument("--filas", type=int, default=100000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    resultados = medir(args.filas, args.repeticiones)
+    for ruta, segundos in resultados.items():
+        print(f"{ruta:<10} {segundos * 1000:>9.1f} ms  ({args.filas / segundos:,.0f} filas/s)")
+    print(f"Aceleración: {resultados['row'] / resultados['mapeador']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
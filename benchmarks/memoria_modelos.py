@@ -0,0 +1,98 @@
+"""Memoria por instancia de los modelos con ``__slots__`` frente a clases con ``__dict__``.
+
+La versión "con __dict__" de cada modelo es una clase equivalente sin
+``__slots__`` que ejecuta el mismo ``__init__``, es decir, la distribución que
+tenían los modelos antes de usar slots.
+
+Uso::
+
+    python -m benchmarks.memoria_modelos [--instancias 100000]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from models.entregable import Entregable
+from models.grupo import Grupo
+from models.investigador import Investigador
+from models.semillero import Semillero
+
+# modelo -> función que crea la i-ésima instancia con datos típicos
+FABRICAS = {
+    Grupo: lambda clase, i: clase(
+        id=i, nombre=f"Grupo {i}", campo="Ingeniería", identificador=f"COL{i:07d}", director="Director"
+    ),
+    Semillero: lambda clase, i: clase(
+        id=i, nombre=f"Semillero {i}", objetivo_principal="Objetivo principal",
+        objetivos_especificos=["Objetivo 1", "Objetivo 2"], grupo_id=1, status="activo"
+    ),
+    Investigador: lambda clase, i: clase(
+        id=i, nombre=f"Investigador {i}", tipo="estudiante", email=f"inv{i}@test.com", semillero_id=1
+    ),
+    Entregable: lambda clase, i: clase(
+        id=i, titulo=f"Entregable {i}", descripcion="Descripción", tipo="Prototipo",
+        semillero_id=1, fecha_entrega="2025-01-01"
+    ),
+}
+
+
+def clase_con_dict(modelo):
+    """Crea una clase equivalente a ``modelo`` que guarda sus atributos en ``__dict__``"""
+    return type(f"{modelo.__name__}ConDict", (), {"__init__": modelo.__init__})
+
+
+def bytes_por_instancia(clase, fabrica, instancias):
+    """Mide con tracemalloc la memoria retenida por ``instancias`` objetos
+
+    Incluye los textos propios de cada instancia, que son iguales en ambas
+    versiones, así que la diferencia es el costo del ``__dict__``.
+
+    Returns:
+        float: Bytes por instancia
+    """
+    # Precalentar: la primera instancia crea cachés internas del intérprete
+    fabrica(clase, 0)
+    gc.collect()
+
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    objetos = [fabrica(clase, i) for i in range(instancias)]
+    despues, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del objetos
+    return (despues - antes) / instancias
+
+
+def medir(instancias=100000):
+    """Mide todos los modelos
+
+    Returns:
+        dict: nombre del modelo -> {"slots": bytes, "dict": bytes, "ahorro": fracción}
+    """
+    resultados = {}
+    for modelo, fabrica in FABRICAS.items():
+        con_slots = bytes_por_instancia(modelo, fabrica, instancias)
+        con_dict = bytes_por_instancia(clase_con_dict(modelo), fabrica, instancias)
+        resultados[modelo.__name__] = {
+            "slots": con_slots,
+            "dict": con_dict,
+            "ahorro": 1 - con_slots / con_dict,
+        }
+    return resultados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memoria por instancia de los modelos")
+    parser.add_argument("--instancias", type=int, default=100000, help="Instancias creadas por modelo")
+    args = parser.parse_args(argv)
+
+    print(f"{'MODELO':<14} {'__slots__':>12} {'__dict__':>12} {'AHORRO':>8}")
+    for nombre, resultado in medir(args.instancias).items():
+        print(f"{nombre:<14} {resultado['slots']:>10.0f} B {resultado['dict']:>10.0f} B "
+              f"{resultado['ahorro']:>7.0%}")
+    print(f"(bytes por instancia, incluidos sus textos propios; {args.instancias} instancias por modelo)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+"""Tiempos de los métodos públicos de los servicios sobre datos sintéticos.
+
+Genera (o reutiliza) una base de datos con ``benchmarks.datos`` en la escala
+indicada, la copia a un archivo de trabajo (los casos que escriben no
+alteran la base generada) y mide cada caso de ``CASOS``: uno por método
+público de ``GrupoService``, ``SemilleroService`` y ``EntregableService``.
+
+Cada caso tiene una preparación, que no se mide, y una llamada medida. Por
+ejemplo, ``SemilleroService.eliminar_semillero`` crea antes un semillero
+sin entregable, y las consultas de ``GrupoService`` vacían la caché para
+medir la consulta y no la caché. Los IDs se eligen al azar con la semilla,
+así que dos ejecuciones con la misma semilla hacen las mismas llamadas.
+
+Los resultados se guardan en JSON (mínimo, mediana y máximo por caso, más
+los datos del entorno) y se pueden comparar con una ejecución anterior: el
+programa termina con error si la mediana de algún caso empeora más que la
+tolerancia (y más de ``DIFERENCIA_MINIMA_MS``)::
+
+    python -m benchmarks.servicios --escala 1k --datos /tmp/semilleros-bench
+    python -m benchmarks.servicios --escala 1k --datos /tmp/semilleros-bench \\
+        --comparar benchmarks/resultados/servicios_1k_20260101-120000.json
+
+Las escalas son el número de semilleros; con ellos crecen los objetivos, los
+investigadores (unos 5 por semillero), los entregables y los grupos.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.datos import GeneradorDatos
+from db.database import Database
+from models.entregable import Entregable
+from models.grupo import Grupo
+from models.semillero import Semillero
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+
+ESCALAS = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resultados")
+
+# Aumento relativo de la mediana a partir del cual un caso cuenta como regresión
+TOLERANCIA = 0.2
+# Aumento absoluto mínimo (ms) para contar como regresión: por debajo, es ruido de medición
+DIFERENCIA_MINIMA_MS = 0.05
+
+# nombre 'Clase.metodo' -> función (contexto) que prepara y retorna la llamada a medir
+CASOS = {}
+
+
+def caso(nombre):
+    """Registra una función de preparación en ``CASOS``"""
+    def registrar(preparar):
+        CASOS[nombre] = preparar
+        return preparar
+
+    return registrar
+
+
+class Contexto:
+    """Base de datos, servicios y datos conocidos que comparten los casos"""
+
+    def __init__(self, db, semilla=1):
+        self.db = db
+        self.rng = random.Random(semilla)
+        # Otra semilla que la de los datos, para no repetir sus nombres
+        self.generador = GeneradorDatos(semilla + 1)
+        self.grupos = GrupoService(db)
+        self.semilleros = SemilleroService(db)
+        self.entregables = EntregableService(db)
+        self.total_grupos = db.execute_query("SELECT MAX(id) FROM grupos_investigacion", fetch='one')[0]
+        self.total_semilleros = db.execute_query("SELECT MAX(semillero_id) FROM semilleros", fetch='one')[0]
+        self.total_entregables = db.execute_query("SELECT MAX(id) FROM entregables", fetch='one')[0] or 0
+        self._creados = 0
+
+    def grupo_id(self):
+        return self.rng.randint(1, self.total_grupos)
+
+    def semillero_id(self):
+        return self.rng.randint(1, self.total_semilleros)
+
+    def entregable_id(self):
+        return self.rng.randint(1, self.total_entregables)
+
+    def nuevo_semillero(self):
+        """Crea (sin medir) un semillero sin entregable y retorna su ID"""
+        semillero_id, errores = self.semilleros.crear_semillero(self.generador.semillero(self.total_grupos))
+        if errores:
+            raise ValueError(f"No se pudo crear el semillero: {errores}")
+        return semillero_id
+
+    def nuevo_identificador(self):
+        self._creados += 1
+        return f"BEN{self._creados:07d}"
+
+    def palabra(self):
+        """Palabra de un objetivo existente, para las búsquedas de texto"""
+        objetivo = self.db.execute_query(
+            "SELECT objetivo_principal FROM semilleros WHERE semillero_id = ?", (self.semillero_id(),), fetch='one'
+        )[0]
+        return self.rng.choice([palabra for palabra in objetivo.split() if len(palabra) > 4])
+
+
+# GrupoService: las consultas se miden con la caché vacía
+
+@caso("GrupoService.crear_grupo")
+def _crear_grupo(ctx):
+    grupo = Grupo(
+        nombre=f"Grupo de benchmark {ctx.nuevo_identificador()}", campo="Benchmarks",
+        identificador=ctx.nuevo_identificador(), director="Director de benchmark",
+    )
+    return lambda: ctx.grupos.crear_grupo(grupo)
+
+
+@caso("GrupoService.obtener_semilleros")
+def _obtener_semilleros(ctx):
+    return ctx.grupos.obtener_semilleros
+
+
+@caso("GrupoService.obtener_todos")
+def _grupos_obtener_todos(ctx):
+    ctx.grupos.invalidar_cache()
+    return ctx.grupos.obtener_todos
+
+
+@caso("GrupoService.iter_todos")
+def _grupos_iter_todos(ctx):
+    return lambda: sum(1 for _ in ctx.grupos.iter_todos())
+
+
+@caso("GrupoService.obtener_pagina")
+def _grupos_obtener_pagina(ctx):
+    _, cursor = ctx.grupos.obtener_pagina(tamano=5)
+    return lambda: ctx.grupos.obtener_pagina(cursor=cursor)
+
+
+@caso("GrupoService.obtener_por_id")
+def _grupos_obtener_por_id(ctx):
+    ctx.grupos.invalidar_cache()
+    grupo_id = ctx.grupo_id()
+    return lambda: ctx.grupos.obtener_por_id(grupo_id)
+
+
+@caso("GrupoService.obtener_por_identificador")
+def _obtener_por_identificador(ctx):
+    ctx.grupos.invalidar_cache()
+    identificador = ctx.db.execute_query(
+        "SELECT identificador FROM grupos_investigacion WHERE id = ?", (ctx.grupo_id(),), fetch='one'
+    )[0]
+    return lambda: ctx.grupos.obtener_por_identificador(identificador)
+
+
+@caso("GrupoService.cargar_datos_iniciales")
+def _cargar_datos_iniciales(ctx):
+    # Con grupos existentes solo comprueba que no haga falta cargarlos
+    return ctx.grupos.cargar_datos_iniciales
+
+
+@caso("GrupoService.obtener_lineas_investigacion")
+def _obtener_lineas_investigacion(ctx):
+    grupo_id = ctx.grupo_id()
+    return lambda: ctx.grupos.obtener_lineas_investigacion(grupo_id)
+
+
+@caso("GrupoService.invalidar_cache")
+def _invalidar_cache(ctx):
+    ctx.grupos.obtener_todos()
+    return ctx.grupos.invalidar_cache
+
+
+# SemilleroService
+
+@caso("SemilleroService.crear_semillero")
+def _crear_semillero(ctx):
+    semillero = ctx.generador.semillero(ctx.total_grupos)
+    return lambda: ctx.semilleros.crear_semillero(semillero)
+
+
+@caso("SemilleroService.editar_semillero")
+def _editar_semillero(ctx):
+    semillero_id = ctx.semillero_id()
+    argumentos = (
+        semillero_id, f"Semillero editado {semillero_id}", ctx.generador.objetivo(),
+        [ctx.generador.objetivo() for _ in range(3)], ctx.grupo_id(), "activo",
+    )
+    return lambda: ctx.semilleros.editar_semillero(*argumentos)
+
+
+@caso("SemilleroService.eliminar_semillero")
+def _eliminar_semillero(ctx):
+    semillero_id = ctx.nuevo_semillero()
+    return lambda: ctx.semilleros.eliminar_semillero(semillero_id)
+
+
+@caso("SemilleroService.obtener_todos")
+def _semilleros_obtener_todos(ctx):
+    return ctx.semilleros.obtener_todos
+
+
+@caso("SemilleroService.iter_todos")
+def _semilleros_iter_todos(ctx):
+    return lambda: sum(1 for _ in ctx.semilleros.iter_todos())
+
+
+@caso("SemilleroService.obtener_pagina")
+def _semilleros_obtener_pagina(ctx):
+    _, cursor = ctx.semilleros.obtener_pagina()
+    return lambda: ctx.semilleros.obtener_pagina(cursor=cursor, prefetch=Semillero.RELACIONES)
+
+
+@caso("SemilleroService.buscar")
+def _semilleros_buscar(ctx):
+    texto = ctx.palabra()
+    return lambda: ctx.semilleros.buscar(texto)
+
+
+@caso("SemilleroService.obtener_por_id")
+def _semilleros_obtener_por_id(ctx):
+    semillero_id = ctx.semillero_id()
+    return lambda: ctx.semilleros.obtener_por_id(semillero_id, prefetch=Semillero.RELACIONES)
+
+
+@caso("SemilleroService.cambiar_status")
+def _cambiar_status(ctx):
+    semillero_id = ctx.semillero_id()
+    status = ctx.rng.choice(Semillero.ESTADOS)
+    return lambda: ctx.semilleros.cambiar_status(semillero_id, status)
+
+
+@caso("SemilleroService.obtener_por_grupo")
+def _obtener_por_grupo(ctx):
+    grupo_id = ctx.grupo_id()
+    return lambda: ctx.semilleros.obtener_por_grupo(grupo_id)
+
+
+@caso("SemilleroService.obtener_por_objetivo")
+def _obtener_por_objetivo(ctx):
+    objetivo = ctx.db.execute_query(
+        "SELECT objetivo FROM semillero_objetivos WHERE semillero_id = ? LIMIT 1", (ctx.semillero_id(),),
+        fetch='one',
+    )[0]
+    return lambda: ctx.semilleros.obtener_por_objetivo(objetivo)
+
+
+@caso("SemilleroService.filtrar")
+def _filtrar(ctx):
+    grupo_id = ctx.grupo_id()
+    return lambda: ctx.semilleros.filtrar(status="pendiente", grupo_id=grupo_id, orden="creado_en", limite=50)
+
+
+@caso("SemilleroService.prefetch")
+def _prefetch(ctx):
+    semilleros, _ = ctx.semilleros.obtener_pagina(tamano=200)
+    return lambda: ctx.semilleros.prefetch(semilleros)
+
+
+# EntregableService
+
+@caso("EntregableService.crear_entregable")
+def _crear_entregable(ctx):
+    entregable = Entregable(
+        titulo="Entregable de benchmark", descripcion=ctx.generador.objetivo(),
+        tipo=ctx.rng.choice(Entregable.TIPOS_VALIDOS), semillero_id=ctx.nuevo_semillero(),
+    )
+    return lambda: ctx.entregables.crear_entregable(entregable)
+
+
+@caso("EntregableService.obtener_por_semillero")
+def _obtener_por_semillero(ctx):
+    semillero_id = ctx.semillero_id()
+    return lambda: ctx.entregables.obtener_por_semillero(semillero_id)
+
+
+@caso("EntregableService.obtener_pagina")
+def _entregables_obtener_pagina(ctx):
+    _, cursor = ctx.entregables.obtener_pagina()
+    return lambda: ctx.entregables.obtener_pagina(cursor=cursor)
+
+
+@caso("EntregableService.buscar")
+def _entregables_buscar(ctx):
+    texto = ctx.palabra()
+    return lambda: ctx.entregables.buscar(texto)
+
+
+@caso("EntregableService.cambiar_estado")
+def _cambiar_estado(ctx):
+    entregable_id = ctx.entregable_id()
+    estado = ctx.rng.choice(Entregable.ESTADOS)
+    return lambda: ctx.entregables.cambiar_estado(entregable_id, estado)
+
+
+def ejecutar(db, repeticiones=5, casos=None, semilla=1, progreso=None):
+    """Mide los casos sobre ``db``
+
+    Args:
+        db (Database): Base de datos generada con ``benchmarks.datos`` (se modifica)
+        repeticiones (int): Mediciones por caso, cada una con su preparación
+        casos (iterable, optional): Nombres de ``CASOS``; por defecto todos
+        semilla (int): Semilla de los IDs y datos elegidos en la preparación
+        progreso (callable, optional): Función (nombre, resultado) tras cada caso
+
+    Returns:
+        dict: nombre -> {"min_ms", "mediana_ms", "max_ms", "repeticiones"}
+    """
+    nombres = list(CASOS) if casos is None else list(casos)
+    desconocidos = [nombre for nombre in nombres if nombre not in CASOS]
+    if desconocidos:
+        raise ValueError(f"Casos no válidos: {', '.join(desconocidos)}")
+
+    ctx = Contexto(db, semilla)
+    resultados = {}
+    for nombre in nombres:
+        tiempos = []
+        for _ in range(repeticiones):
+            llamada = CASOS[nombre](ctx)
+            inicio = time.perf_counter()
+            llamada()
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+        resultados[nombre] = {
+            "min_ms": round(min(tiempos), 4),
+            "mediana_ms": round(statistics.median(tiempos), 4),
+            "max_ms": round(max(tiempos), 4),
+            "repeticiones": repeticiones,
+        }
+        if progreso:
+            progreso(nombre, resultados[nombre])
+    return resultados
+
+
+def preparar_datos(semilleros, semilla=1, directorio=None):
+    """Retorna la ruta de la base de datos sintética, generándola si no existe en ``directorio``
+
+    Args:
+        semilleros (int): Número de semilleros
+        semilla (int): Semilla del generador
+        directorio (str, optional): Dónde guardar la base generada para reutilizarla;
+            por defecto un directorio temporal
+
+    Returns:
+        str: Ruta de la base de datos
+    """
+    directorio = directorio or tempfile.mkdtemp()
+    os.makedirs(directorio, exist_ok=True)
+    ruta = os.path.join(directorio, f"datos_{semilleros}_{semilla}.db")
+    if not os.path.exists(ruta):
+        GeneradorDatos(semilla).generar(ruta, semilleros)
+    return ruta
+
+
+def medir(semilleros, semilla=1, repeticiones=5, casos=None, directorio=None, progreso=None):
+    """Mide los casos sobre una copia de la base de datos sintética
+
+    Returns:
+        dict: {"entorno": {...}, "casos": resultado de ``ejecutar``}
+    """
+    origen = preparar_datos(semilleros, semilla, directorio)
+    trabajo = tempfile.mkdtemp()
+    try:
+        ruta = os.path.join(trabajo, "servicios.db")
+        shutil.copyfile(origen, ruta)
+        db = Database(ruta)
+        try:
+            filas = {
+                tabla: db.execute_query(f"SELECT COUNT(*) FROM {tabla}", fetch='one')[0]
+                for tabla in ("grupos_investigacion", "semilleros", "semillero_objetivos", "investigadores",
+                              "entregables")
+            }
+            resultados = ejecutar(db, repeticiones, casos, semilla, progreso)
+        finally:
+            db.cerrar()
+    finally:
+        shutil.rmtree(trabajo, ignore_errors=True)
+
+    return {
+        "entorno": {
+            "fecha": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            "semilleros": semilleros,
+            "semilla": semilla,
+            "filas": filas,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "plataforma": platform.platform(),
+        },
+        "casos": resultados,
+    }
+
+
+def comparar(actual, base, tolerancia=TOLERANCIA, diferencia_minima_ms=DIFERENCIA_MINIMA_MS):
+    """Compara la mediana de cada caso con la de una ejecución anterior
+
+    Args:
+        actual (dict): Resultado de ``medir``
+        base (dict): Resultado anterior (misma escala)
+        tolerancia (float): Aumento relativo aceptado, p. ej. 0.2 = 20 %
+        diferencia_minima_ms (float): Aumento absoluto por debajo del cual no hay regresión
+
+    Returns:
+        list: (nombre, mediana base ms, mediana actual ms, cambio relativo, es regresión)
+        de los casos presentes en ambas ejecuciones
+    """
+    filas = []
+    for nombre, resultado in actual["casos"].items():
+        anterior = base["casos"].get(nombre)
+        if anterior is None:
+            continue
+        antes, ahora = anterior["mediana_ms"], resultado["mediana_ms"]
+        cambio = (ahora - antes) / antes if antes else 0.0
+        filas.append((nombre, antes, ahora, cambio, cambio > tolerancia and ahora - antes > diferencia_minima_ms))
+    return filas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide los métodos de los servicios sobre datos sintéticos")
+    escala = parser.add_mutually_exclusive_group()
+    escala.add_argument("--escala", choices=list(ESCALAS), default="1k")
+    escala.add_argument("--semilleros", type=int, help="Número de semilleros (en lugar de --escala)")
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--casos", nargs="+", help="Casos a medir ('Clase.metodo'); por defecto todos")
+    parser.add_argument("--datos", help="Directorio donde guardar y reutilizar las bases generadas")
+    parser.add_argument("--salida", help="Archivo JSON de resultados (por defecto en benchmarks/resultados)")
+    parser.add_argument("--comparar", help="Resultados anteriores con los que comparar")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    args = parser.parse_args(argv)
+
+    semilleros = args.semilleros or ESCALAS[args.escala]
+    etiqueta = args.escala if args.semilleros is None else str(args.semilleros)
+
+    def mostrar(nombre, resultado):
+        print(f"{resultado['mediana_ms']:>12.3f} {resultado['min_ms']:>12.3f} {resultado['max_ms']:>12.3f}  {nombre}")
+
+    print(f"{'mediana ms':>12} {'mín. ms':>12} {'máx. ms':>12}  caso ({semilleros:,} semilleros)")
+    datos = medir(semilleros, args.semilla, args.repeticiones, args.casos, args.datos, mostrar)
+
+    salida = args.salida
+    if salida is None:
+        os.makedirs(RESULTADOS, exist_ok=True)
+        fecha = datetime.now().strftime("%Y%m%d-%H%M%S")
+        salida = os.path.join(RESULTADOS, f"servicios_{etiqueta}_{fecha}.json")
+    with open(salida, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, ensure_ascii=False, indent=2)
+    print(f"\nResultados guardados en {salida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        if base["entorno"]["semilleros"] != semilleros:
+            print(f"Aviso: la ejecución base tiene {base['entorno']['semilleros']:,} semilleros")
+
+        filas = comparar(datos, base, args.tolerancia)
+        print(f"\n{'base ms':>12} {'actual ms':>12} {'cambio':>8}  caso")
+        for nombre, antes, ahora, cambio, regresion in filas:
+            marca = "  REGRESIÓN" if regresion else ""
+            print(f"{antes:>12.3f} {ahora:>12.3f} {cambio:>+8.0%}  {nombre}{marca}")
+        regresiones = sum(1 for fila in filas if fila[4])
+        if regresiones:
+            print(f"\n{regresiones} caso(s) más de {args.tolerancia:.0%} más lentos que la base")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""Resultados de consulta organizados por columnas, para reportes y agregaciones.
+
+Cada columna se guarda de forma compacta según su contenido:
+
+- enteros: ``array('q')``; reales: ``array('d')`` (los NULL se marcan aparte);
+- texto: codificado con diccionario, un ``array('i')`` de códigos más la
+  lista de valores distintos (el código -1 es NULL). Contar o filtrar por
+  tipo, estado o grupo trabaja sobre enteros en lugar de comparar textos;
+- cualquier otra mezcla de tipos: una lista de Python.
+
+Las agrupaciones usan ``collections.Counter`` sobre los códigos y los filtros
+``itertools.compress``, ambos implementados en C, de modo que no se crea un
+objeto por fila. NumPy es opcional: ``a_numpy`` entrega una columna como
+``numpy.ndarray`` sin copiar los datos numéricos.
+
+Ejemplo::
+
+    resultado = db.consultar_columnas("SELECT tipo, estado, semillero_id FROM entregables")
+    pendientes = resultado.filtrar(estado="pendiente")
+    pendientes.contar_por("tipo")      # {"Prototipo": 12, ...}
+"""
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import itemgetter
+
+# Tipos de columna
+ENTERO, REAL, TEXTO, OBJETO, NULO = "entero", "real", "texto", "objeto", "nulo"
+
+
+class _Columna:
+    """Datos de una columna y cómo interpretarlos"""
+
+    __slots__ = ("tipo", "datos", "nulos", "valores", "indice")
+
+    def __init__(self, tipo, datos, nulos=None, valores=None):
+        self.tipo = tipo
+        self.datos = datos        # array o list
+        self.nulos = nulos        # bytearray (1 = NULL) para columnas numéricas con nulos
+        self.valores = valores    # valores distintos de una columna de texto
+        self.indice = None        # valor -> código, solo mientras se construye
+
+    def __len__(self):
+        return len(self.datos)
+
+    def decodificar(self):
+        """Retorna los valores de la columna como lista de Python"""
+        if self.tipo == TEXTO:
+            valores = self.valores
+            return [None if codigo < 0 else valores[codigo] for codigo in self.datos]
+        if self.tipo in (ENTERO, REAL) and self.nulos is not None:
+            return [None if nulo else valor for valor, nulo in zip(self.datos, self.nulos)]
+        if self.tipo == NULO:
+            return [None] * len(self.datos)
+        return list(self.datos)
+
+    def claves(self):
+        """Secuencia comparable por igualdad para agrupar (códigos en el texto)"""
+        if self.tipo == TEXTO or (self.tipo in (ENTERO, REAL) and self.nulos is None):
+            return self.datos
+        return self.decodificar()
+
+    def clave_a_valor(self, clave):
+        if self.tipo == TEXTO:
+            return None if clave < 0 else self.valores[clave]
+        return clave
+
+    def seleccionar(self, mascara):
+        """Nueva columna con las filas cuya posición es verdadera en ``mascara``"""
+        if isinstance(self.datos, array):
+            datos = array(self.datos.typecode, compress(self.datos, mascara))
+        else:
+            datos = list(compress(self.datos, mascara))
+        nulos = bytearray(compress(self.nulos, mascara)) if self.nulos is not None else None
+        if nulos is not None and not any(nulos):
+            nulos = None
+        return _Columna(self.tipo, datos, nulos, self.valores)
+
+
+class _Codigos(dict):
+    """Diccionario valor -> código que asigna el siguiente código a cada valor nuevo"""
+
+    def __init__(self, valores):
+        super().__init__({None: -1})
+        self.valores = valores
+
+    def __missing__(self, valor):
+        codigo = self[valor] = len(self.valores)
+        self.valores.append(valor)
+        return codigo
+
+
+class _ConstructorColumna:
+    """Acumula los valores de una columna eligiendo la representación más compacta"""
+
+    def __init__(self):
+        self.columna = _Columna(NULO, [])
+
+    def agregar(self, valores):
+        if not self._agregar_rapido(valores):
+            self._agregar_uno_a_uno(valores)
+
+    def _agregar_rapido(self, valores):
+        """Agrega un bloque sin recorrerlo en Python cuando su tipo es homogéneo
+
+        Returns:
+            bool: False si el bloque requiere el recorrido valor por valor
+        """
+        columna = self.columna
+        if columna.tipo == TEXTO:
+            if not set(map(type, valores)) <= {str, type(None)}:
+                return False
+            columna.datos.extend(map(columna.indice.__getitem__, valores))
+            return True
+        if columna.tipo in (ENTERO, REAL):
+            try:
+                # Se convierte aparte para no dejar el arreglo a medias si falla
+                bloque = array(columna.datos.typecode, valores)
+            except TypeError:  # NULL, o un real en una columna de enteros
+                return False
+            columna.datos.extend(bloque)
+            if columna.nulos is not None:
+                columna.nulos.extend(bytes(len(bloque)))
+            return True
+        return False
+
+    def _agregar_uno_a_uno(self, valores):
+        columna = self.columna
+        for posicion, valor in enumerate(valores):
+            tipo = columna.tipo
+            if valor is None:
+                self._agregar_nulo()
+            elif tipo == TEXTO and type(valor) is str:
+                columna.datos.append(columna.indice[valor])
+            elif tipo == ENTERO and type(valor) is int:
+                columna.datos.append(valor)
+                if columna.nulos is not None:
+                    columna.nulos.append(0)
+            elif tipo == REAL and type(valor) in (int, float):
+                columna.datos.append(float(valor))
+                if columna.nulos is not None:
+                    columna.nulos.append(0)
+            elif tipo == OBJETO:
+                columna.datos.append(valor)
+            else:
+                # Con el tipo ya definido, el resto del bloque puede ir por la vía rápida
+                self._cambiar_tipo(valor)
+                self.agregar(valores[posicion + 1:])
+                return
+
+    def _agregar_nulo(self):
+        columna = self.columna
+        if columna.tipo == TEXTO:
+            columna.datos.append(-1)
+        elif columna.tipo in (ENTERO, REAL):
+            if columna.nulos is None:
+                columna.nulos = bytearray(len(columna.datos))
+            columna.datos.append(0)
+            columna.nulos.append(1)
+        else:
+            columna.datos.append(None)
+
+    def _cambiar_tipo(self, valor):
+        """Convierte la columna al tipo que admite ``valor`` y lo agrega"""
+        anterior = self.columna
+        valores = anterior.decodificar()
+
+        if anterior.tipo == NULO:
+            tipo = {int: ENTERO, float: REAL, str: TEXTO}.get(type(valor), OBJETO)
+        elif anterior.tipo == ENTERO and type(valor) is float:
+            tipo = REAL
+        else:
+            tipo = OBJETO
+
+        if tipo == ENTERO:
+            nueva = _Columna(ENTERO, array("q"))
+        elif tipo == REAL:
+            nueva = _Columna(REAL, array("d"))
+        elif tipo == TEXTO:
+            nueva = _Columna(TEXTO, array("i"), valores=[])
+            nueva.indice = _Codigos(nueva.valores)
+        else:
+            nueva = _Columna(OBJETO, [])
+
+        self.columna = nueva
+        self.agregar(valores)
+        self.agregar((valor,))
+
+    def terminar(self):
+        self.columna.indice = None
+        return self.columna
+
+
+class ResultadoColumnar:
+    """Resultado de una consulta con sus datos organizados por columna"""
+
+    def __init__(self, columnas, datos, filas, origen=None, seleccion=None):
+        self.columnas = list(columnas)
+        self._datos = datos  # nombre -> _Columna
+        self._filas = filas
+        # Tras un filtro, las columnas se extraen de ``origen`` al usarse por primera vez
+        self._origen = origen
+        self._seleccion = seleccion
+
+    @classmethod
+    def desde_lotes(cls, lotes):
+        """Construye el resultado a partir de bloques (columnas, lista de tuplas)
+
+        Args:
+            lotes (iterable): Bloques como los de ``Database.execute_query(fetch='lotes')``
+
+        Returns:
+            ResultadoColumnar: Resultado con todas las filas de los bloques
+        """
+        columnas = ()
+        constructores = []
+        filas = 0
+        for columnas, bloque in lotes:
+            if not constructores:
+                constructores = [_ConstructorColumna() for _ in columnas]
+            # map(itemgetter) por columna es mucho más rápido que transponer con zip(*bloque)
+            for posicion, constructor in enumerate(constructores):
+                constructor.agregar(list(map(itemgetter(posicion), bloque)))
+            filas += len(bloque)
+
+        datos = {
+            nombre: (constructores[posicion].terminar() if constructores else _Columna(NULO, []))
+            for posicion, nombre in enumerate(columnas)
+        }
+        return cls(columnas, datos, filas)
+
+    def __len__(self):
+        return self._filas
+
+    def _columna(self, nombre):
+        columna = self._datos.get(nombre)
+        if columna is None:
+            if nombre not in self.columnas:
+                raise KeyError(f"Columna inexistente: {nombre}. Columnas: {', '.join(self.columnas)}")
+            columna = self._datos[nombre] = self._origen._columna(nombre).seleccionar(self._seleccion)
+        return columna
+
+    def tipo(self, nombre):
+        """Tipo de almacenamiento de una columna ('entero', 'real', 'texto', 'objeto' o 'nulo')"""
+        return self._columna(nombre).tipo
+
+    def valores(self, nombre):
+        """Valores de una columna como lista de Python (None para NULL)"""
+        return self._columna(nombre).decodificar()
+
+    def distintos(self, nombre):
+        """Valores distintos de una columna, en orden de aparición"""
+        columna = self._columna(nombre)
+        if columna.tipo == TEXTO:
+            return list(columna.valores)
+        return list(dict.fromkeys(columna.decodificar()))
+
+    def filas(self):
+        """Recorre el resultado como tuplas, en el orden de la consulta"""
+        return zip(*(self._columna(nombre).decodificar() for nombre in self.columnas))
+
+    def mascara(self, nombre, condicion):
+        """Calcula qué filas cumplen una condición sobre una columna
+
+        Args:
+            nombre (str): Columna
+            condicion: Valor (igualdad), lista/tupla/conjunto (pertenencia) o
+                función que recibe el valor y retorna bool
+
+        Returns:
+            list: Un booleano por fila
+        """
+        columna = self._columna(nombre)
+
+        if callable(condicion):
+            if columna.tipo == TEXTO:
+                # La función se evalúa una vez por valor distinto, no por fila
+                aceptados = {codigo for codigo, valor in enumerate(columna.valores) if condicion(valor)}
+                if condicion(None):
+                    aceptados.add(-1)
+                return [codigo in aceptados for codigo in columna.datos]
+            return [bool(condicion(valor)) for valor in columna.decodificar()]
+
+        buscados = set(condicion) if isinstance(condicion, (list, tuple, set, frozenset)) else {condicion}
+        if columna.tipo == TEXTO:
+            codigos = {codigo for codigo, valor in enumerate(columna.valores) if valor in buscados}
+            if None in buscados:
+                codigos.add(-1)
+            if len(codigos) == 1:
+                codigo, = codigos
+                return list(map(codigo.__eq__, columna.datos))
+            return list(map(codigos.__contains__, columna.datos))
+        return list(map(buscados.__contains__, columna.claves()))
+
+    def donde(self, mascara):
+        """Nuevo resultado con las filas seleccionadas por una máscara de booleanos
+
+        Solo se copian las columnas que el nuevo resultado llegue a usar.
+        """
+        mascara = bytes(map(bool, mascara))
+        return ResultadoColumnar(self.columnas, {}, mascara.count(1), origen=self, seleccion=mascara)
+
+    def filtrar(self, **condiciones):
+        """Filtra por una o varias columnas (todas las condiciones deben cumplirse)
+
+        Ejemplo::
+
+            resultado.filtrar(estado="pendiente", tipo=["Prototipo", "Working paper"])
+
+        Returns:
+            ResultadoColumnar: Resultado con las filas que cumplen las condiciones
+        """
+        mascara = None
+        for nombre, condicion in condiciones.items():
+            actual = self.mascara(nombre, condicion)
+            mascara = actual if mascara is None else list(map(min, mascara, actual))
+        if mascara is None:
+            return self
+        return self.donde(mascara)
+
+    def _agrupar(self, nombres):
+        """Retorna (claves por fila, función que decodifica una clave)"""
+        columnas = [self._columna(nombre) for nombre in nombres]
+        if len(columnas) == 1:
+            columna = columnas[0]
+            return columna.claves(), columna.clave_a_valor
+        claves = zip(*(columna.claves() for columna in columnas))
+
+        def decodificar(clave):
+            return tuple(columna.clave_a_valor(parte) for columna, parte in zip(columnas, clave))
+        return claves, decodificar
+
+    def contar_por(self, *nombres):
+        """Cuenta las filas por cada combinación de valores de las columnas
+
+        Returns:
+            dict: valor (o tupla de valores con varias columnas) -> número de filas
+        """
+        claves, decodificar = self._agrupar(nombres)
+        return {decodificar(clave): total for clave, total in Counter(claves).items()}
+
+    def sumar_por(self, columna_valor, *nombres):
+        """Suma una columna numérica por cada combinación de valores de las columnas
+
+        Los NULL no suman. Retorna un diccionario como ``contar_por``.
+        """
+        valores = self._columna(columna_valor).decodificar()
+        claves, decodificar = self._agrupar(nombres)
+        sumas = {}
+        for clave, valor in zip(claves, valores):
+            if valor is not None:
+                sumas[clave] = sumas.get(clave, 0) + valor
+            else:
+                sumas.setdefault(clave, 0)
+        return {decodificar(clave): total for clave, total in sumas.items()}
+
+    def a_numpy(self, nombre):
+        """Entrega una columna como ``numpy.ndarray`` (requiere NumPy)
+
+        Las columnas numéricas sin NULL comparten memoria con el resultado;
+        las de texto se entregan como arreglo de objetos.
+
+        Raises:
+            ImportError: Si NumPy no está instalado
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("a_numpy requiere NumPy: pip install numpy") from None
+
+        columna = self._columna(nombre)
+        if columna.tipo == ENTERO and columna.nulos is None:
+            return numpy.frombuffer(columna.datos, dtype=numpy.int64)
+        if columna.tipo == REAL and columna.nulos is None:
+            return numpy.frombuffer(columna.datos, dtype=numpy.float64)
+        if columna.tipo in (ENTERO, REAL):
+            datos = numpy.array(columna.datos, dtype=numpy.float64)
+            datos[numpy.frombuffer(bytes(columna.nulos), dtype=numpy.uint8).astype(bool)] = numpy.nan
+            return datos
+        return numpy.array(columna.decodificar(), dtype=object)
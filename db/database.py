@@ -1,131 +1,454 @@
 import sqlite3
 import os
-import json
 import re  # Añadido para usar re.search en el método execute_query
+import threading
+import time
+from contextlib import contextmanager
+
+from db.esquema import (
+    INDICES, METADATOS, RESUMENES, TABLAS_BUSQUEDA, TRIGGERS, huella_esquema, sql_conteo_resumen,
+    sql_indice, sql_resumen
+)
+from db.columnar import ResultadoColumnar
+from db.mapeo import compilar, normalizar_campos
+from db.migraciones import VERSION_ACTUAL, Migrador
+from db.perfiles import PERFIL_POR_DEFECTO, resolver_perfil
+from db.pool import PoolConexiones
 
 
 class Database:
     """Gestión de conexión y operaciones con SQLite"""
 
-    def __init__(self, db_path="db/semilleros.db"):
+    def __init__(self, db_path="db/semilleros.db", pool_size=5, perfil=None, pragmas=None, migrar=True):
+        """
+        Args:
+            db_path (str): Ruta del archivo de base de datos
+            pool_size (int): Número máximo de conexiones del pool; al menos 2,
+                porque los recorridos con fetch='iter' (p. ej. ``iter_todos``)
+                mantienen una conexión prestada mientras se cargan relaciones
+                con otra
+            perfil (str, optional): Perfil de rendimiento ('durable', 'fast',
+                'readonly-analytics'). Por defecto se toma de la variable de
+                entorno SEMILLEROS_DB_PERFIL o se usa 'durable'
+            pragmas (dict, optional): PRAGMAs que sobrescriben los del perfil
+            migrar (bool): Aplicar las migraciones pendientes y sincronizar
+                índices y triggers al abrir, si el esquema no está al día
+                (ver ``esquema_al_dia`` y ``actualizar_esquema``). Con un perfil
+                de solo lectura (``query_only``) no se escribe nada: solo se
+                exige que las migraciones ya estén aplicadas
+
+        Raises:
+            ValueError: Si ``pool_size`` es menor que 2, o si el perfil es de solo
+                lectura y la base de datos es nueva o tiene migraciones pendientes
+        """
+        if pool_size < 2:
+            raise ValueError(
+                f"pool_size debe ser al menos 2 (se recibió {pool_size}): los recorridos por lotes "
+                f"usan una conexión para leer y otra para cargar relaciones"
+            )
         self.db_path = db_path
-        self._crear_estructura()
-        self._verificar_estructura()  # Añadimos verificación adicional
+        self.perfil = perfil or os.environ.get("SEMILLEROS_DB_PERFIL") or PERFIL_POR_DEFECTO
+        self.pragmas = resolver_perfil(self.perfil, pragmas)
+        self.pool = PoolConexiones(db_path, tamano=pool_size, inicializar=self._configurar_conexion)
+        self._local = threading.local()  # Transacción en curso de cada hilo
+        self._mapeadores = {}  # (consulta, clase, campos) -> Mapeador
+        self.esquema_actualizado = False  # True si al abrir se migró o sincronizó el esquema
+        self.instrumentacion = None  # Ver ``instrumentar``
+        self.solo_lectura = str(self.pragmas.get("query_only", "OFF")).upper() in ("ON", "1", "TRUE", "YES")
+        if migrar and not self.esquema_al_dia():
+            if self.solo_lectura:
+                # Los índices o triggers desactualizados no impiden leer; las tablas sí
+                self._exigir_version_actual()
+            else:
+                self.actualizar_esquema()
 
-    def _get_connection(self):
-        """Abre la conexión y activa claves foráneas."""
-        conn = sqlite3.connect(self.db_path)   # ← conexión directa, no recurse aquí
+    def _configurar_conexion(self, conn):
+        """Configura cada conexión nueva del pool: claves foráneas, perfil y filas por nombre."""
         conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        for nombre, valor in self.pragmas.items():
+            conn.execute(f"PRAGMA {nombre} = {valor}")
+        conn.row_factory = sqlite3.Row  # Para poder acceder por nombre de columna
 
-    def _crear_estructura(self):
-        """Crea la estructura de la base de datos si no existe"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+    def configuracion_efectiva(self):
+        """Consulta los PRAGMAs realmente vigentes en una conexión del pool
 
-        # Tabla de grupos de investigación
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS grupos_investigacion (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT NOT NULL,
-            facultad TEXT,
-            area_conocimiento TEXT,
-            director TEXT,
-            campo TEXT,
-            identificador TEXT
-        )
-        ''')
-
-        # Tabla de semilleros
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS semilleros (
-            semillero_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT NOT NULL,
-            objetivo_principal TEXT,
-            objetivos_especificos TEXT,
-            grupo_id INTEGER,
-            status TEXT DEFAULT 'pendiente',
-            FOREIGN KEY (grupo_id) REFERENCES grupos_investigacion(id)
-        )
-        ''')
-
-        # Tabla de investigadores
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS investigadores (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT NOT NULL,
-            tipo TEXT NOT NULL,
-            identificacion TEXT,
-            programa TEXT,
-            email TEXT,
-            semillero_id INTEGER,
-            FOREIGN KEY (semillero_id) REFERENCES semilleros(semillero_id)
-        );       
-        ''')
-
-        # Tabla de relación entre semilleros e investigadores
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS semillero_investigador (
-            semillero_id INTEGER,
-            investigador_id INTEGER,
-            rol TEXT,
-            PRIMARY KEY (semillero_id, investigador_id),
-            FOREIGN KEY (semillero_id) REFERENCES semilleros(semillero_id),
-            FOREIGN KEY (investigador_id) REFERENCES investigadores(id)
-        )
-        ''')
-
-        # Tabla de entregables
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS entregables (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            titulo TEXT NOT NULL,
-            descripcion TEXT,
-            tipo TEXT NOT NULL,
-            semillero_id INTEGER NOT NULL,
-            fecha_entrega TEXT,
-            estado TEXT DEFAULT 'pendiente',
-            FOREIGN KEY (semillero_id) REFERENCES semilleros(semillero_id)
-        )
-        ''')
-
-        conn.commit()
-        conn.close()
-
-    def _verificar_estructura(self):
-        """Verifica y actualiza la estructura de la base de datos si es necesario"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        SQLite puede ignorar un valor (por ejemplo, WAL no aplica en bases en
+        memoria), por lo que se lee lo que la conexión reporta en lugar de
+        devolver lo solicitado.
 
-        # Verificar si existe la columna objetivo_principal en la tabla semilleros
-        cursor.execute("PRAGMA table_info(semilleros)")
-        columnas = [info[1] for info in cursor.fetchall()]
+        Returns:
+            dict: Perfil, PRAGMAs solicitados y valores efectivos
+        """
+        efectiva = {}
+        with self._conexion() as conn:
+            for nombre in ["foreign_keys"] + list(self.pragmas):
+                efectiva[nombre] = conn.execute(f"PRAGMA {nombre}").fetchone()[0]
+
+        return {
+            "perfil": self.perfil,
+            "solicitada": dict(self.pragmas),
+            "efectiva": efectiva,
+        }
+
+    def _get_connection(self):
+        """Presta una conexión del pool; debe devolverse con ``self.pool.devolver``."""
+        return self.pool.obtener()
+
+    def cerrar(self):
+        """Cierra las conexiones abiertas del pool"""
+        self.pool.cerrar()
 
-        # Si no existe la columna, añadirla
-        if 'objetivo_principal' not in columnas:
+    def respaldar(self, destino):
+        """Copia la base de datos a otro archivo con la API de respaldo de SQLite
+
+        La copia es consistente aunque otros hilos o procesos escriban mientras
+        tanto, así que sirve como instantánea para procesos de solo lectura.
+
+        Args:
+            destino (str): Ruta del archivo de destino (se sobrescribe)
+        """
+        with self._conexion() as conn:
+            copia = sqlite3.connect(destino)
             try:
-                cursor.execute('ALTER TABLE semilleros ADD COLUMN objetivo_principal TEXT NOT NULL DEFAULT ""')
+                conn.backup(copia)
+            finally:
+                copia.close()
+
+    @contextmanager
+    def _conexion(self):
+        """Usa la conexión de la transacción en curso del hilo o presta una del pool."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+        else:
+            with self.pool.conexion() as conn:
+                yield conn
+
+    def en_transaccion(self):
+        """Indica si el hilo actual tiene una transacción abierta"""
+        return getattr(self._local, "conn", None) is not None
+
+    @contextmanager
+    def transaction(self):
+        """Agrupa varias escrituras en una unidad atómica con un solo commit
+
+        Todas las llamadas a ``execute_query`` y ``execute_many`` hechas desde
+        el mismo hilo dentro del bloque usan la misma conexión y se confirman
+        juntas al salir. Si ocurre una excepción se revierte todo. Las
+        transacciones anidadas se implementan con SAVEPOINT, de modo que un
+        error en el bloque interno solo revierte ese bloque.
+
+        Ejemplo::
+
+            with db.transaction():
+                semillero_id = db.execute_query(insert_semillero, params)
+                db.execute_many(insert_investigadores, filas)
+
+        Yields:
+            sqlite3.Connection: Conexión de la transacción
+        """
+        conn = getattr(self._local, "conn", None)
+
+        if conn is None:
+            conn = self.pool.obtener()
+            self._local.conn = conn
+            self._local.nivel = 0
+            try:
+                # IMMEDIATE toma el bloqueo de escritura al inicio y evita
+                # fallar a mitad de la transacción por otro escritor
+                conn.execute("BEGIN IMMEDIATE")
+                yield conn
                 conn.commit()
-                print("Base de datos actualizada: añadida columna objetivo_principal a la tabla semilleros")
-            except sqlite3.Error as e:
-                print(f"Error al actualizar la estructura de la base de datos: {e}")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            finally:
+                self._local.conn = None
+                self.pool.devolver(conn)
+        else:
+            self._local.nivel += 1
+            savepoint = f"sp_{self._local.nivel}"
+            conn.execute(f"SAVEPOINT {savepoint}")
+            try:
+                yield conn
+                conn.execute(f"RELEASE {savepoint}")
+            except BaseException:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+                raise
+            finally:
+                self._local.nivel -= 1
+
+    def instrumentar(self, umbral_lento=0.1, max_lentas=100):
+        """Activa el registro de estadísticas y consultas lentas (ver ``db.instrumentacion``)
+
+        Args:
+            umbral_lento (float, optional): Segundos a partir de los cuales se
+                guarda la consulta con su plan; None = no guardar
+            max_lentas (int): Consultas lentas que se conservan
+
+        Returns:
+            Instrumentacion: Registro activo, también en ``self.instrumentacion``
+        """
+        from db.instrumentacion import Instrumentacion
+
+        self.instrumentacion = Instrumentacion(umbral_lento=umbral_lento, max_lentas=max_lentas)
+        return self.instrumentacion
+
+    def desinstrumentar(self):
+        """Desactiva la instrumentación y retorna el registro que estaba activo"""
+        instrumentacion, self.instrumentacion = self.instrumentacion, None
+        return instrumentacion
+
+    def esquema_al_dia(self):
+        """Indica si la base de datos ya está en la última versión y sincronizada con ``db.esquema``
+
+        Es la comprobación del arranque: dos lecturas de la cabecera y una de
+        ``metadatos``, sin DDL. Cualquier DDL posterior a la última
+        sincronización (por ejemplo, un trigger eliminado a mano) cambia
+        PRAGMA schema_version, y entonces la base de datos no está al día.
+
+        Returns:
+            bool: True si no hace falta ``actualizar_esquema``
+        """
+        conn = self._get_connection()
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != VERSION_ACTUAL:
+                return False
+            fila = conn.execute("SELECT valor FROM metadatos WHERE clave = 'huella_esquema'").fetchone()
+            version_esquema = conn.execute("PRAGMA schema_version").fetchone()[0]
+        except sqlite3.OperationalError:
+            # Base de datos anterior a la tabla de metadatos
+            return False
+        finally:
+            self.pool.devolver(conn)
+        return fila is not None and fila[0] == f"{huella_esquema()}:{version_esquema}"
+
+    def _exigir_version_actual(self):
+        """Falla con un mensaje claro si las migraciones no están aplicadas (modo solo lectura)"""
+        with self._conexion() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != VERSION_ACTUAL:
+            self.cerrar()
+            raise ValueError(
+                f"La base de datos {self.db_path} está en la versión {version} del esquema y se requiere la "
+                f"{VERSION_ACTUAL}; el perfil '{self.perfil}' es de solo lectura. Ábrala una vez con un "
+                f"perfil de escritura (p. ej. 'durable') para aplicar las migraciones"
+            )
+
+    def actualizar_esquema(self, tamano_lote=1000):
+        """Aplica las migraciones pendientes y sincroniza los objetos derivados
+
+        Args:
+            tamano_lote (int): Filas por transacción en los rellenos de datos
+        """
+        Migrador(self, tamano_lote=tamano_lote).migrar()
+        self.sincronizar_esquema()
+        self.esquema_actualizado = True
+
+    def sincronizar_esquema(self):
+        """Crea los índices, las tablas de búsqueda y de resumen y los triggers declarados en el esquema
 
-        conn.close()
+        Al terminar guarda en ``metadatos`` la huella del esquema declarado y
+        el PRAGMA schema_version resultante, que ``esquema_al_dia`` compara
+        en las siguientes aperturas. Si algún índice no se pudo crear, la huella
+        se borra para reintentarlo en la siguiente apertura.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute(METADATOS)
+
+            fallidos = []
+            for nombre in INDICES:
+                try:
+                    cursor.execute(sql_indice(nombre))
+                except sqlite3.IntegrityError as e:
+                    # Un índice único no se puede crear si ya hay datos duplicados
+                    print(f"No se pudo crear el índice {nombre}: {e}")
+                    fallidos.append(nombre)
+
+            for nombre, (ddl, carga_inicial, ranking) in TABLAS_BUSQUEDA.items():
+                existe = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (nombre,)
+                ).fetchone()
+                if not existe:
+                    cursor.execute(ddl)
+                    cursor.execute(f"INSERT INTO {nombre} ({nombre}, rank) VALUES ('rank', '{ranking}')")
+                    cursor.execute(carga_inicial)
+
+            for nombre in RESUMENES:
+                existe = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (nombre,)
+                ).fetchone()
+                if not existe:
+                    # Se llena en la misma transacción en que se crean sus triggers
+                    cursor.execute(sql_resumen(nombre))
+                    cursor.execute(f"INSERT INTO {nombre} {sql_conteo_resumen(nombre)}")
+
+            existentes = {
+                fila['name']: fila['sql']
+                for fila in cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'")
+            }
+            for nombre, ddl in TRIGGERS.items():
+                actual = existentes.get(nombre)
+                if actual is not None and self._normalizar_ddl(actual) == self._normalizar_ddl(ddl):
+                    continue
+                if actual is not None:
+                    # La definición cambió en el esquema: se reemplaza el trigger
+                    cursor.execute(f"DROP TRIGGER {nombre}")
+                cursor.execute(ddl)
+
+            if fallidos:
+                # El esquema no está completo: sin huella, esquema_al_dia es False
+                cursor.execute("DELETE FROM metadatos WHERE clave = 'huella_esquema'")
+            else:
+                version_esquema = cursor.execute("PRAGMA schema_version").fetchone()[0]
+                cursor.execute(
+                    "INSERT OR REPLACE INTO metadatos (clave, valor) VALUES ('huella_esquema', ?)",
+                    (f"{huella_esquema()}:{version_esquema}",)
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.devolver(conn)
+
+    @staticmethod
+    def _normalizar_ddl(ddl):
+        """Normaliza una sentencia CREATE para compararla con la guardada en sqlite_master"""
+        return " ".join(ddl.replace("IF NOT EXISTS ", "").split())
 
-    def execute_query(self, query, params=None, fetch=None):
+    def execute_query(self, query, params=None, fetch=None, tamano_lote=500, tiempo_maximo=None):
         """Ejecuta una consulta SQL y opcionalmente devuelve resultados
 
                 Args:
                     query (str): Consulta SQL a ejecutar
                     params (tuple, optional): Parámetros para la consulta
-                    fetch (str, optional): Tipo de fetch a realizar ('one', 'all', None)
+                    fetch (str, optional): Tipo de fetch a realizar ('one', 'all',
+                        'iter', 'lotes', 'tuplas', 'rowcount' o None para obtener
+                        el ID de la última fila insertada)
+                    tamano_lote (int): Filas leídas por cada fetchmany con
+                        fetch='iter' o fetch='lotes'
+                    tiempo_maximo (float, optional): Segundos tras los cuales se
+                        interrumpe la consulta con TimeoutError (no aplica a
+                        fetch='iter' ni fetch='lotes')
 
                 Returns:
-                    Resultados de la consulta según el parámetro fetch
+                    Resultados de la consulta según el parámetro fetch. Con
+                    fetch='tuplas' retorna (nombres de columnas, filas como
+                    tuplas). Con fetch='iter' retorna un generador de filas que mantiene
+                    prestada una conexión del pool hasta agotarse o cerrarse.
+                    Con fetch='lotes' el generador entrega (nombres de columnas,
+                    lista de tuplas) por cada fetchmany.
                 """
-        conn = self._get_connection()
-        conn.row_factory = sqlite3.Row  # Para poder acceder por nombre de columna
+        if fetch == 'iter':
+            return self._iterar(query, params, tamano_lote)
+        if fetch == 'lotes':
+            return self._iterar_lotes(query, params, tamano_lote)
+
+        with self._conexion() as conn:
+            instrumentacion = self.instrumentacion
+            if instrumentacion is None and tiempo_maximo is None:
+                return self._ejecutar(conn, query, params, fetch)
+
+            inicio = time.perf_counter()
+            if tiempo_maximo is None:
+                resultado = self._ejecutar(conn, query, params, fetch)
+            else:
+                with self._limite_tiempo(conn, tiempo_maximo):
+                    resultado = self._ejecutar(conn, query, params, fetch)
+            if instrumentacion is not None:
+                instrumentacion.registrar(
+                    conn, query, params, time.perf_counter() - inicio, self._contar_filas(resultado, fetch)
+                )
+            return resultado
+
+    @staticmethod
+    def _contar_filas(resultado, fetch):
+        """Filas leídas (o afectadas, con fetch='rowcount') según el tipo de fetch"""
+        if fetch == 'one':
+            return 0 if resultado is None else 1
+        if fetch == 'all':
+            return len(resultado)
+        if fetch == 'tuplas':
+            return len(resultado[1])
+        if fetch == 'rowcount':
+            return max(resultado, 0)
+        return 0
+
+    @staticmethod
+    @contextmanager
+    def _limite_tiempo(conn, segundos):
+        """Interrumpe la sentencia en curso de ``conn`` si tarda más de ``segundos``"""
+        limite = time.monotonic() + segundos
+        # SQLite llama al manejador cada N instrucciones de su máquina virtual;
+        # si retorna un valor verdadero, la sentencia termina con "interrupted"
+        conn.set_progress_handler(lambda: time.monotonic() > limite, 1000)
+        try:
+            yield
+        except sqlite3.OperationalError as e:
+            if "interrupted" in str(e):
+                raise TimeoutError(f"La consulta superó el tiempo máximo de {segundos} s") from e
+            raise
+        finally:
+            conn.set_progress_handler(None, 0)
+
+    def _iterar(self, query, params, tamano_lote):
+        """Generador que lee las filas de una consulta en bloques con fetchmany
+
+        Con instrumentación, la duración registrada abarca toda la iteración,
+        incluido el tiempo que el consumidor tarda entre bloques.
+        """
+        with self._conexion() as conn:
+            cursor = conn.cursor()
+            inicio, leidas = time.perf_counter(), 0
+            try:
+                cursor.execute(query, params or ())
+                while True:
+                    filas = cursor.fetchmany(tamano_lote)
+                    if not filas:
+                        break
+                    leidas += len(filas)
+                    yield from filas
+            finally:
+                cursor.close()
+                if self.instrumentacion is not None:
+                    self.instrumentacion.registrar(conn, query, params, time.perf_counter() - inicio, leidas)
+
+    def _iterar_lotes(self, query, params, tamano_lote):
+        """Generador de bloques de filas como tuplas, junto con los nombres de las columnas"""
+        with self._conexion() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            inicio, leidas = time.perf_counter(), 0
+            try:
+                cursor.execute(query, params or ())
+                columnas = tuple(columna[0] for columna in cursor.description or ())
+                entregado = False
+                while True:
+                    filas = cursor.fetchmany(tamano_lote)
+                    if not filas:
+                        break
+                    entregado = True
+                    leidas += len(filas)
+                    yield columnas, filas
+                if not entregado:
+                    # Sin filas también se informan las columnas
+                    yield columnas, []
+            finally:
+                cursor.close()
+                if self.instrumentacion is not None:
+                    self.instrumentacion.registrar(conn, query, params, time.perf_counter() - inicio, leidas)
+
+    def _ejecutar(self, conn, query, params, fetch):
+        """Ejecuta la consulta sobre una conexión ya obtenida"""
         cursor = conn.cursor()
+        if fetch == 'tuplas':
+            cursor.row_factory = None  # Las tuplas se crean más rápido que sqlite3.Row
 
         try:
             if params:
@@ -138,8 +461,11 @@ class Database:
                 result = cursor.fetchone()
             elif fetch == 'all':
                 result = cursor.fetchall()
+            elif fetch == 'tuplas':
+                result = (tuple(columna[0] for columna in cursor.description), cursor.fetchall())
+            elif fetch == 'rowcount':
+                result = cursor.rowcount  # Número de filas afectadas
             else:
-                conn.commit()
                 result = cursor.lastrowid  # Retornar el ID de la última fila insertada
 
         except sqlite3.OperationalError as e:
@@ -167,64 +493,69 @@ class Database:
                     for col in columnas:
                         print(f"- {col[1]} ({col[2]})")
             raise
-        finally:
-            conn.close()
 
         return result
 
-    def execute_many(self, query, params_list):
-        """Ejecuta una consulta SQL múltiple veces con diferentes parámetros
+    def consultar_modelos(self, query, params=None, clase=None, campos=None, uno=False):
+        """Ejecuta una consulta y convierte cada fila en un objeto de ``clase``
+
+        Las filas se leen como tuplas y se convierten con un mapeador por
+        posición (ver ``db.mapeo``) que se compila la primera vez que se usa
+        la combinación de consulta y clase.
 
         Args:
             query (str): Consulta SQL a ejecutar
-            params_list (list): Lista de tuplas con parámetros
-        """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.executemany(query, params_list)
-        conn.commit()
-
-        conn.close()
+            params (tuple, optional): Parámetros para la consulta
+            clase (type): Clase del modelo
+            campos (dict, optional): Renombres de columnas, p. ej. {"semillero_id": "id"}
+            uno (bool): Retornar solo el primer objeto (o None)
 
-    def crear_semillero(self, semillero):
-        """Crea un nuevo semillero en la base de datos
+        Returns:
+            list | object: Objetos construidos, o el primero si ``uno`` es True
+        """
+        columnas, filas = self.execute_query(query, params, fetch='tuplas')
 
-            Args:
-                semillero (Semillero): Objeto Semillero a crear
+        clave = (query, clase, normalizar_campos(campos))
+        mapeador = self._mapeadores.get(clave)
+        if mapeador is None or mapeador.columnas != columnas:
+            mapeador = self._mapeadores[clave] = compilar(clase, columnas, clave[2])
 
-            Returns:
-                int: ID del semillero creado o None si hay errores
-            """
-        # Validar que cumpla con los requisitos
-        errores = semillero.validar()
-        if errores:
-            return None, errores
+        if uno:
+            return mapeador.uno(filas[0]) if filas else None
+        return mapeador.todos(filas)
 
-        # Insertar el semillero en la base de datos
-        # Incluimos la columna objetivos_especificos que existe en la tabla
-        query = """
-                INSERT INTO semilleros 
-                (nombre, objetivo_principal, objetivos_especificos, grupo_id, status) 
-                VALUES (?, ?, ?, ?, ?)
-            """
+    def consultar_columnas(self, query, params=None, tamano_lote=5000):
+        """Ejecuta una consulta y retorna el resultado organizado por columnas
 
-        params = (
-            semillero.nombre,
-            semillero.objetivo_principal,
-            semillero.objetivos_especificos,  # Añadido este campo que faltaba
-            semillero.grupo_id,
-            semillero.status
-        )
+        Pensado para reportes: en lugar de un objeto por fila, cada columna
+        se guarda en un ``array.array`` (números) o codificada con
+        diccionario (texto), y el resultado ofrece filtros y agrupaciones
+        sobre esas columnas. Ver ``db.columnar``.
 
-        # Corregido: self.db debería ser self porque ya estamos en la clase Database
-        semillero_id = self.execute_query(query, params)
+        Args:
+            query (str): Consulta SQL a ejecutar
+            params (tuple, optional): Parámetros para la consulta
+            tamano_lote (int): Filas leídas por cada fetchmany
 
-        # Si se creó correctamente, añadir los investigadores
-        if semillero_id:
-            self._guardar_investigadores(semillero_id, semillero.estudiantes, "estudiante")
-            self._guardar_investigadores(semillero_id, semillero.tutores, "tutor")
+        Returns:
+            ResultadoColumnar: Resultado de la consulta
+        """
+        return ResultadoColumnar.desde_lotes(self.execute_query(query, params, fetch='lotes', tamano_lote=tamano_lote))
 
-            return semillero_id, []
+    def execute_many(self, query, params_list):
+        """Ejecuta una consulta SQL múltiple veces con diferentes parámetros
 
-        return None, ["Error al crear el semillero en la base de datos"]
+        Args:
+            query (str): Consulta SQL a ejecutar
+            params_list (list): Lista de tuplas con parámetros
+        """
+        # Las conexiones del pool están en modo autocommit: agrupar todas las
+        # filas en una transacción evita un commit por fila. Dentro de una
+        # transacción ya abierta se convierte en un savepoint.
+        with self.transaction() as conn:
+            if self.instrumentacion is None:
+                conn.executemany(query, params_list)
+                return
+            inicio = time.perf_counter()
+            cursor = conn.executemany(query, params_list)
+            self.instrumentacion.registrar(conn, query, None, time.perf_counter() - inicio, max(cursor.rowcount, 0))
@@ -0,0 +1,413 @@
+"""Declaración del esquema de la base de datos: tablas, columnas, índices y triggers."""
+import zlib
+
+# Tablas en orden de creación (las referenciadas por claves foráneas primero)
+TABLAS = {
+    # Tabla de grupos de investigación
+    "grupos_investigacion": '''
+        CREATE TABLE IF NOT EXISTS grupos_investigacion (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            facultad TEXT,
+            area_conocimiento TEXT,
+            director TEXT,
+            campo TEXT,
+            identificador TEXT
+        )
+    ''',
+
+    # Tabla de semilleros
+    "semilleros": '''
+        CREATE TABLE IF NOT EXISTS semilleros (
+            semillero_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            objetivo_principal TEXT,
+            objetivos_especificos TEXT,
+            grupo_id INTEGER,
+            status TEXT DEFAULT 'pendiente',
+            FOREIGN KEY (grupo_id) REFERENCES grupos_investigacion(id)
+        )
+    ''',
+
+    # Tabla de investigadores
+    "investigadores": '''
+        CREATE TABLE IF NOT EXISTS investigadores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            tipo TEXT NOT NULL,
+            identificacion TEXT,
+            programa TEXT,
+            email TEXT,
+            semillero_id INTEGER,
+            FOREIGN KEY (semillero_id) REFERENCES semilleros(semillero_id)
+        )
+    ''',
+
+    # Tabla de relación entre semilleros e investigadores
+    "semillero_investigador": '''
+        CREATE TABLE IF NOT EXISTS semillero_investigador (
+            semillero_id INTEGER,
+            investigador_id INTEGER,
+            rol TEXT,
+            PRIMARY KEY (semillero_id, investigador_id),
+            FOREIGN KEY (semillero_id) REFERENCES semilleros(semillero_id),
+            FOREIGN KEY (investigador_id) REFERENCES investigadores(id)
+        )
+    ''',
+
+    # Objetivos específicos de cada semillero, en su orden original
+    # (antes se guardaban como JSON en semilleros.objetivos_especificos)
+    "semillero_objetivos": '''
+        CREATE TABLE IF NOT EXISTS semillero_objetivos (
+            semillero_id INTEGER NOT NULL,
+            posicion INTEGER NOT NULL,
+            objetivo TEXT NOT NULL COLLATE NOCASE,
+            PRIMARY KEY (semillero_id, posicion),
+            FOREIGN KEY (semillero_id) REFERENCES semilleros(semillero_id)
+        ) WITHOUT ROWID
+    ''',
+
+    # Tabla de entregables
+    "entregables": '''
+        CREATE TABLE IF NOT EXISTS entregables (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            titulo TEXT NOT NULL,
+            descripcion TEXT,
+            tipo TEXT NOT NULL,
+            semillero_id INTEGER NOT NULL,
+            fecha_entrega TEXT,
+            estado TEXT DEFAULT 'pendiente',
+            FOREIGN KEY (semillero_id) REFERENCES semilleros(semillero_id)
+        )
+    ''',
+}
+
+# Columna de la clave primaria de cada tabla principal
+CLAVES_PRIMARIAS = {
+    "grupos_investigacion": "id",
+    "semilleros": "semillero_id",
+    "investigadores": "id",
+    "entregables": "id",
+}
+
+# Expresión SQL de la marca de tiempo (UTC, con milisegundos y ordenable como texto)
+AHORA = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+# Tablas cuyo trigger de inserción también marca ``creado_en``
+TABLAS_CON_CREADO_EN = {"semilleros"}
+
+# Índices de las rutas de búsqueda de los servicios.
+# nombre -> (tabla, columnas, único)
+INDICES = {
+    # SemilleroService.obtener_por_grupo (filtra por grupo y ordena por nombre)
+    "idx_semilleros_grupo_nombre": ("semilleros", "grupo_id, nombre", False),
+    # SemilleroService.filtrar por estado (y grupo), ordenado por nombre; parciales, ver INDICES_PARCIALES
+    "idx_semilleros_activos": ("semilleros", "grupo_id, nombre", False),
+    "idx_semilleros_pendientes": ("semilleros", "grupo_id, nombre", False),
+    # SemilleroService.filtrar por fecha de creación
+    "idx_semilleros_creado_en": ("semilleros", "creado_en", False),
+    # SemilleroService.filtrar por tutor (parcial, solo tutores)
+    "idx_investigadores_tutores": ("investigadores", "nombre COLLATE NOCASE, semillero_id", False),
+    # SemilleroService._cargar_investigadores (filtra por semillero y ordena por tipo, nombre)
+    "idx_investigadores_semillero": ("investigadores", "semillero_id, tipo, nombre", False),
+    # EntregableService.obtener_por_semillero y crear_entregable
+    "idx_entregables_semillero": ("entregables", "semillero_id", False),
+    # Listados ordenados y paginación por cursor (el rowid desempata)
+    "idx_semilleros_nombre": ("semilleros", "nombre", False),
+    "idx_grupos_nombre": ("grupos_investigacion", "nombre", False),
+    "idx_entregables_titulo": ("entregables", "titulo", False),
+    # Reconstrucción y verificación de resumen_entregables: agrupa recorriendo solo el índice
+    "idx_entregables_tipo_estado": ("entregables", "tipo, estado", False),
+    # SemilleroService.obtener_por_objetivo (la clave primaria completa el índice)
+    "idx_semillero_objetivos_objetivo": ("semillero_objetivos", "objetivo", False),
+    # Verificación de clave foránea al borrar investigadores
+    "idx_semillero_investigador_investigador": ("semillero_investigador", "investigador_id", False),
+    # GrupoService.obtener_por_identificador; el identificador es único por grupo
+    "uq_grupos_identificador": ("grupos_investigacion", "identificador", True),
+}
+# Condición de los índices parciales: solo incluyen las filas que la cumplen.
+# SQLite los usa cuando la consulta repite la condición con los mismos literales.
+INDICES_PARCIALES = {
+    "idx_semilleros_activos": "status = 'activo'",
+    "idx_semilleros_pendientes": "status = 'pendiente'",
+    "idx_investigadores_tutores": "tipo = 'tutor'",
+}
+# Exportación incremental ("modificados desde")
+for _tabla in CLAVES_PRIMARIAS:
+    INDICES[f"idx_{_tabla}_actualizado_en"] = (_tabla, "actualizado_en", False)
+
+
+def _triggers_actualizado_en():
+    """Triggers que mantienen ``actualizado_en`` en inserciones y modificaciones
+
+    El UPDATE interno no vuelve a disparar el trigger (recursive_triggers está
+    desactivado por defecto) y la condición WHEN respeta un valor explícito.
+    """
+    triggers = {}
+    for tabla, clave in CLAVES_PRIMARIAS.items():
+        if tabla in TABLAS_CON_CREADO_EN:
+            # Ambas marcas en un solo UPDATE, para no disparar trg_{tabla}_modificado
+            triggers[f"trg_{tabla}_insertado"] = f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{tabla}_insertado
+                AFTER INSERT ON {tabla}
+                FOR EACH ROW WHEN NEW.actualizado_en IS NULL OR NEW.creado_en IS NULL
+                BEGIN
+                    UPDATE {tabla}
+                    SET actualizado_en = IFNULL(NEW.actualizado_en, {AHORA}),
+                        creado_en = IFNULL(NEW.creado_en, {AHORA})
+                    WHERE {clave} = NEW.{clave};
+                END
+            """
+        else:
+            triggers[f"trg_{tabla}_insertado"] = f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{tabla}_insertado
+                AFTER INSERT ON {tabla}
+                FOR EACH ROW WHEN NEW.actualizado_en IS NULL
+                BEGIN
+                    UPDATE {tabla} SET actualizado_en = {AHORA} WHERE {clave} = NEW.{clave};
+                END
+            """
+        triggers[f"trg_{tabla}_modificado"] = f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{tabla}_modificado
+            AFTER UPDATE ON {tabla}
+            FOR EACH ROW WHEN NEW.actualizado_en IS OLD.actualizado_en
+            BEGIN
+                UPDATE {tabla} SET actualizado_en = {AHORA} WHERE {clave} = NEW.{clave};
+            END
+        """
+    return triggers
+
+
+TRIGGERS = _triggers_actualizado_en()
+
+
+def _objetivos_como_texto(semillero_id):
+    """Expresión SQL que une en texto plano los objetivos específicos de un semillero"""
+    return (
+        f"(SELECT group_concat(objetivo, ' ') FROM semillero_objetivos "
+        f"WHERE semillero_id = {semillero_id})"
+    )
+
+
+# Índices de búsqueda de texto completo (FTS5). Son tablas con contenido
+# propio cuyo rowid es el ID de la fila indexada, mantenidas por triggers.
+# nombre -> (DDL, carga inicial, configuración del ranking)
+TABLAS_BUSQUEDA = {
+    "semilleros_fts": (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS semilleros_fts USING fts5(
+            nombre, objetivo_principal, objetivos_especificos,
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """,
+        f"""
+        INSERT INTO semilleros_fts (rowid, nombre, objetivo_principal, objetivos_especificos)
+        SELECT semillero_id, nombre, objetivo_principal, {_objetivos_como_texto('semilleros.semillero_id')}
+        FROM semilleros
+        """,
+        # El nombre pesa más que el objetivo principal y este más que los específicos
+        "bm25(10.0, 5.0, 2.0)",
+    ),
+    "entregables_fts": (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS entregables_fts USING fts5(
+            titulo, descripcion,
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """,
+        """
+        INSERT INTO entregables_fts (rowid, titulo, descripcion)
+        SELECT id, titulo, descripcion FROM entregables
+        """,
+        "bm25(10.0, 1.0)",
+    ),
+}
+
+TRIGGERS.update({
+    "trg_semilleros_fts_insertado": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_semilleros_fts_insertado
+        AFTER INSERT ON semilleros
+        BEGIN
+            INSERT INTO semilleros_fts (rowid, nombre, objetivo_principal, objetivos_especificos)
+            VALUES (NEW.semillero_id, NEW.nombre, NEW.objetivo_principal,
+                    {_objetivos_como_texto('NEW.semillero_id')});
+        END
+    """,
+    "trg_semilleros_fts_modificado": """
+        CREATE TRIGGER IF NOT EXISTS trg_semilleros_fts_modificado
+        AFTER UPDATE OF nombre, objetivo_principal ON semilleros
+        BEGIN
+            UPDATE semilleros_fts
+            SET nombre = NEW.nombre, objetivo_principal = NEW.objetivo_principal
+            WHERE rowid = NEW.semillero_id;
+        END
+    """,
+    "trg_semilleros_fts_eliminado": """
+        CREATE TRIGGER IF NOT EXISTS trg_semilleros_fts_eliminado
+        AFTER DELETE ON semilleros
+        BEGIN
+            DELETE FROM semilleros_fts WHERE rowid = OLD.semillero_id;
+        END
+    """,
+})
+
+# Los objetivos específicos del índice se recalculan cuando cambia cualquiera de ellos
+for _nombre, _evento, _fila in (
+    ("insertado", "INSERT", "NEW"), ("modificado", "UPDATE", "NEW"), ("eliminado", "DELETE", "OLD")
+):
+    TRIGGERS[f"trg_semillero_objetivos_fts_{_nombre}"] = f"""
+        CREATE TRIGGER IF NOT EXISTS trg_semillero_objetivos_fts_{_nombre}
+        AFTER {_evento} ON semillero_objetivos
+        BEGIN
+            UPDATE semilleros_fts
+            SET objetivos_especificos = {_objetivos_como_texto(f'{_fila}.semillero_id')}
+            WHERE rowid = {_fila}.semillero_id;
+        END
+    """
+
+TRIGGERS.update({
+    "trg_entregables_fts_insertado": """
+        CREATE TRIGGER IF NOT EXISTS trg_entregables_fts_insertado
+        AFTER INSERT ON entregables
+        BEGIN
+            INSERT INTO entregables_fts (rowid, titulo, descripcion)
+            VALUES (NEW.id, NEW.titulo, NEW.descripcion);
+        END
+    """,
+    "trg_entregables_fts_modificado": """
+        CREATE TRIGGER IF NOT EXISTS trg_entregables_fts_modificado
+        AFTER UPDATE OF titulo, descripcion ON entregables
+        BEGIN
+            UPDATE entregables_fts SET titulo = NEW.titulo, descripcion = NEW.descripcion
+            WHERE rowid = NEW.id;
+        END
+    """,
+    "trg_entregables_fts_eliminado": """
+        CREATE TRIGGER IF NOT EXISTS trg_entregables_fts_eliminado
+        AFTER DELETE ON entregables
+        BEGIN
+            DELETE FROM entregables_fts WHERE rowid = OLD.id;
+        END
+    """,
+})
+
+# Tablas de resumen: conteos por combinación de claves, mantenidos por
+# triggers, para leer contadores sin recorrer las tablas de origen. La clave
+# primaria no admite NULL, así que los NULL se guardan con un valor de reemplazo.
+# nombre -> (tabla de origen, ((columna, tipo, valor para NULL), ...))
+RESUMENES = {
+    "resumen_semilleros": ("semilleros", (("grupo_id", "INTEGER", "0"), ("status", "TEXT", "''"))),
+    "resumen_investigadores": ("investigadores", (("semillero_id", "INTEGER", "0"), ("tipo", "TEXT", "''"))),
+    "resumen_entregables": ("entregables", (("tipo", "TEXT", "''"), ("estado", "TEXT", "''"))),
+}
+
+
+def sql_resumen(nombre):
+    """Genera la sentencia CREATE TABLE de una tabla de resumen declarada en ``RESUMENES``"""
+    _, claves = RESUMENES[nombre]
+    columnas = ", ".join(f"{columna} {tipo} NOT NULL" for columna, tipo, _ in claves)
+    primaria = ", ".join(columna for columna, _, _ in claves)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {nombre} ({columnas}, cantidad INTEGER NOT NULL, "
+        f"PRIMARY KEY ({primaria})) WITHOUT ROWID"
+    )
+
+
+def sql_conteo_resumen(nombre):
+    """Consulta que calcula desde la tabla de origen las filas que debería tener un resumen"""
+    tabla, claves = RESUMENES[nombre]
+    columnas = ", ".join(columna for columna, _, _ in claves)
+    expresiones = ", ".join(f"IFNULL({columna}, {nulo}) AS {columna}" for columna, _, nulo in claves)
+    # El GROUP BY interno sigue las columnas originales para poder recorrer un
+    # índice; el externo junta los grupos NULL con los de su valor de reemplazo
+    return (
+        f"SELECT {columnas}, SUM(cantidad) FROM ("
+        f"SELECT {expresiones}, COUNT(*) AS cantidad FROM {tabla} GROUP BY {columnas}"
+        f") GROUP BY {columnas}"
+    )
+
+
+def _triggers_resumen(nombre):
+    """Triggers que suman y restan en el resumen al insertar, borrar o cambiar claves"""
+    tabla, claves = RESUMENES[nombre]
+    columnas = ", ".join(columna for columna, _, _ in claves)
+
+    def sumar(fila):
+        valores = ", ".join(f"IFNULL({fila}.{columna}, {nulo})" for columna, _, nulo in claves)
+        return (
+            f"INSERT INTO {nombre} ({columnas}, cantidad) VALUES ({valores}, 1) "
+            f"ON CONFLICT ({columnas}) DO UPDATE SET cantidad = cantidad + 1;"
+        )
+
+    def restar(fila):
+        condicion = " AND ".join(f"{columna} = IFNULL({fila}.{columna}, {nulo})" for columna, _, nulo in claves)
+        return (
+            f"UPDATE {nombre} SET cantidad = cantidad - 1 WHERE {condicion}; "
+            f"DELETE FROM {nombre} WHERE {condicion} AND cantidad <= 0;"
+        )
+
+    cambio = " OR ".join(f"OLD.{columna} IS NOT NEW.{columna}" for columna, _, _ in claves)
+    return {
+        f"trg_{nombre}_insertado": f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{nombre}_insertado
+            AFTER INSERT ON {tabla}
+            BEGIN
+                {sumar("NEW")}
+            END
+        """,
+        f"trg_{nombre}_eliminado": f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{nombre}_eliminado
+            AFTER DELETE ON {tabla}
+            BEGIN
+                {restar("OLD")}
+            END
+        """,
+        f"trg_{nombre}_modificado": f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{nombre}_modificado
+            AFTER UPDATE OF {columnas} ON {tabla}
+            FOR EACH ROW WHEN {cambio}
+            BEGIN
+                {restar("OLD")}
+                {sumar("NEW")}
+            END
+        """,
+    }
+
+
+for _resumen in RESUMENES:
+    TRIGGERS.update(_triggers_resumen(_resumen))
+
+# Estado de la base de datos que no forma parte de los datos de la aplicación.
+# ``huella_esquema`` guarda la huella de los objetos derivados y el
+# PRAGMA schema_version de la última sincronización (ver Database.actualizar_esquema).
+METADATOS = """
+    CREATE TABLE IF NOT EXISTS metadatos (
+        clave TEXT PRIMARY KEY,
+        valor TEXT
+    ) WITHOUT ROWID
+"""
+
+
+def sql_indice(nombre):
+    """Genera la sentencia CREATE INDEX de un índice declarado en ``INDICES``"""
+    tabla, columnas, unico = INDICES[nombre]
+    tipo = "UNIQUE INDEX" if unico else "INDEX"
+    sql = f"CREATE {tipo} IF NOT EXISTS {nombre} ON {tabla} ({columnas})"
+    if nombre in INDICES_PARCIALES:
+        sql += f" WHERE {INDICES_PARCIALES[nombre]}"
+    return sql
+
+
+def huella_esquema():
+    """Huella (CRC-32) de las sentencias de los objetos derivados declarados
+
+    Cambia cuando se agrega, elimina o modifica un índice, una tabla de
+    búsqueda o de resumen o un trigger, y así indica que la base de datos
+    debe volver a sincronizarse.
+    """
+    sentencias = [METADATOS]
+    sentencias += [sql_indice(nombre) for nombre in INDICES]
+    sentencias += [" ".join(declaracion) for declaracion in TABLAS_BUSQUEDA.values()]
+    sentencias += [sql_resumen(nombre) for nombre in RESUMENES]
+    sentencias += list(TRIGGERS.values())
+    return format(zlib.crc32("\n".join(sentencias).encode("utf-8")), "08x")
@@ -0,0 +1,261 @@
+"""Instrumentación de las consultas ejecutadas por ``Database``.
+
+Con la instrumentación activa (``Database.instrumentar``), cada sentencia
+registra su duración, las filas leídas o afectadas y el método que la
+originó fuera del paquete ``db`` (normalmente un método de un servicio).
+Por cada sentencia, con los espacios normalizados, se acumulan:
+
+- cantidad de ejecuciones, tiempo total y máximo;
+- histograma de latencias (``LIMITES_MS``);
+- filas en total;
+- cantidad de ejecuciones por método llamador.
+
+Las sentencias que superan ``umbral_lento`` se guardan además en un registro
+de consultas lentas con sus parámetros y su ``EXPLAIN QUERY PLAN``. Los
+observadores (``agregar_observador``) reciben cada ejecución, por ejemplo
+para enviarla a otro sistema de monitoreo.
+
+Sin instrumentación, ``Database`` solo comprueba un atributo por consulta.
+
+Para ver un volcado guardado con ``volcar``::
+
+    python -m db.instrumentacion volcado.json [--limite 20] [--orden total|cantidad|maximo|filas]
+"""
+import contextlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+from bisect import bisect_left
+from collections import Counter, deque
+from datetime import datetime, timezone
+
+# Límites superiores (ms) de los intervalos del histograma; el último es abierto
+LIMITES_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+# Marcos que no cuentan como llamador: el paquete db, los administradores de
+# contexto y las envolturas de services.trazas (sin importarlo: depende de db)
+_DB = os.path.dirname(os.path.abspath(__file__))
+_IGNORADOS = (
+    _DB,
+    os.path.abspath(contextlib.__file__),
+    os.path.join(os.path.dirname(_DB), "services", "trazas.py"),
+)
+
+ORDENES = {
+    "total": lambda estadistica: estadistica["total_ms"],
+    "cantidad": lambda estadistica: estadistica["cantidad"],
+    "maximo": lambda estadistica: estadistica["maximo_ms"],
+    "filas": lambda estadistica: estadistica["filas"],
+}
+
+
+def _llamador():
+    """Retorna 'modulo.Clase.metodo' del primer marco fuera de ``db``, de contextlib y de las trazas"""
+    marco = sys._getframe(2)
+    while marco is not None:
+        archivo = marco.f_code.co_filename
+        if not archivo.startswith(_IGNORADOS):
+            return f"{marco.f_globals.get('__name__', '?')}.{marco.f_code.co_qualname}"
+        marco = marco.f_back
+    return "?"
+
+
+class _Estadistica:
+    """Acumulados de una sentencia"""
+
+    __slots__ = ("cantidad", "total", "maximo", "filas", "histograma", "llamadores")
+
+    def __init__(self):
+        self.cantidad = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.filas = 0
+        self.histograma = [0] * (len(LIMITES_MS) + 1)
+        self.llamadores = Counter()
+
+
+class Instrumentacion:
+    """Estadísticas por sentencia, registro de consultas lentas y observadores"""
+
+    def __init__(self, umbral_lento=0.1, max_lentas=100):
+        """
+        Args:
+            umbral_lento (float, optional): Segundos a partir de los cuales una
+                consulta se guarda en el registro de lentas; None = no guardar
+            max_lentas (int): Consultas lentas que se conservan (las más recientes)
+        """
+        self.umbral_lento = umbral_lento
+        self._lock = threading.Lock()
+        self._estadisticas = {}  # sentencia normalizada -> _Estadistica
+        self._lentas = deque(maxlen=max_lentas)
+        self._observadores = []
+
+    def agregar_observador(self, observador):
+        """Registra una función (sql, segundos, filas, llamador) llamada tras cada consulta"""
+        self._observadores.append(observador)
+
+    def quitar_observador(self, observador):
+        self._observadores.remove(observador)
+
+    def registrar(self, conn, query, params, segundos, filas):
+        """Registra una ejecución; lo llama ``Database`` con la conexión todavía prestada
+
+        Args:
+            conn (sqlite3.Connection): Conexión en la que se ejecutó la consulta
+            query (str): Sentencia SQL
+            params (tuple, optional): Parámetros de la sentencia
+            segundos (float): Duración de la ejecución
+            filas (int): Filas leídas o afectadas
+        """
+        sql = " ".join(query.split())
+        llamador = _llamador()
+        milisegundos = segundos * 1000
+        intervalo = bisect_left(LIMITES_MS, milisegundos)
+
+        with self._lock:
+            estadistica = self._estadisticas.get(sql)
+            if estadistica is None:
+                estadistica = self._estadisticas[sql] = _Estadistica()
+            estadistica.cantidad += 1
+            estadistica.total += segundos
+            estadistica.maximo = max(estadistica.maximo, segundos)
+            estadistica.filas += filas
+            estadistica.histograma[intervalo] += 1
+            estadistica.llamadores[llamador] += 1
+
+        if self.umbral_lento is not None and segundos >= self.umbral_lento:
+            lenta = {
+                "momento": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+                "sql": sql,
+                "parametros": params if isinstance(params, dict) else list(params or ()),
+                "milisegundos": round(milisegundos, 3),
+                "filas": filas,
+                "llamador": llamador,
+                "plan": self._plan(conn, query, params),
+            }
+            with self._lock:
+                self._lentas.append(lenta)
+
+        for observador in self._observadores:
+            observador(sql, segundos, filas, llamador)
+
+    @staticmethod
+    def _plan(conn, query, params):
+        """Líneas de EXPLAIN QUERY PLAN, sangradas según su nivel, o None si no aplica"""
+        try:
+            filas = conn.execute(f"EXPLAIN QUERY PLAN {query}", params or ()).fetchall()
+        except sqlite3.Error:
+            return None  # PRAGMA, DDL o varias sentencias
+        niveles = {}
+        lineas = []
+        for nodo, padre, _, detalle in filas:
+            niveles[nodo] = niveles.get(padre, -1) + 1
+            lineas.append("  " * niveles[nodo] + detalle)
+        return lineas or None
+
+    def estadisticas(self, orden="total"):
+        """Retorna las estadísticas por sentencia, de mayor a menor según ``orden``
+
+        Args:
+            orden (str): 'total', 'cantidad', 'maximo' o 'filas'
+
+        Returns:
+            list: Diccionarios con sql, cantidad, total_ms, promedio_ms,
+            maximo_ms, filas, histograma ({"<=1ms": n, ...}) y llamadores
+        """
+        if orden not in ORDENES:
+            raise ValueError(f"Orden no válido: {orden}. Debe ser uno de: {', '.join(ORDENES)}")
+
+        etiquetas = [f"<={limite}ms" for limite in LIMITES_MS] + [f">{LIMITES_MS[-1]}ms"]
+        with self._lock:
+            resultado = [
+                {
+                    "sql": sql,
+                    "cantidad": estadistica.cantidad,
+                    "total_ms": round(estadistica.total * 1000, 3),
+                    "promedio_ms": round(estadistica.total * 1000 / estadistica.cantidad, 3),
+                    "maximo_ms": round(estadistica.maximo * 1000, 3),
+                    "filas": estadistica.filas,
+                    "histograma": {
+                        etiqueta: cantidad
+                        for etiqueta, cantidad in zip(etiquetas, estadistica.histograma) if cantidad
+                    },
+                    "llamadores": dict(estadistica.llamadores.most_common()),
+                }
+                for sql, estadistica in self._estadisticas.items()
+            ]
+        resultado.sort(key=ORDENES[orden], reverse=True)
+        return resultado
+
+    def lentas(self):
+        """Retorna las consultas lentas registradas, de la más antigua a la más reciente"""
+        with self._lock:
+            return list(self._lentas)
+
+    def reiniciar(self):
+        """Descarta las estadísticas y el registro de consultas lentas"""
+        with self._lock:
+            self._estadisticas.clear()
+            self._lentas.clear()
+
+    def volcar(self, ruta=None):
+        """Retorna las estadísticas y las consultas lentas y, si se indica, las guarda como JSON
+
+        Args:
+            ruta (str, optional): Archivo de destino
+
+        Returns:
+            dict: {"generado_en", "umbral_lento_ms", "consultas", "lentas"}
+        """
+        datos = {
+            "generado_en": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            "umbral_lento_ms": None if self.umbral_lento is None else self.umbral_lento * 1000,
+            "consultas": self.estadisticas(),
+            "lentas": self.lentas(),
+        }
+        if ruta:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                # default=repr para parámetros que JSON no representa (p. ej. bytes)
+                json.dump(datos, archivo, ensure_ascii=False, indent=2, default=repr)
+        return datos
+
+
+def formatear(datos, limite=20, orden="total"):
+    """Texto legible de un volcado: las sentencias principales y las consultas lentas"""
+    consultas = sorted(datos["consultas"], key=ORDENES[orden], reverse=True)[:limite]
+    lineas = [f"Volcado generado en {datos['generado_en']} (UTC)", ""]
+    lineas.append(f"{'cantidad':>9} {'total ms':>11} {'prom. ms':>9} {'máx. ms':>9} {'filas':>9}  sentencia")
+    for consulta in consultas:
+        lineas.append(
+            f"{consulta['cantidad']:>9} {consulta['total_ms']:>11.1f} {consulta['promedio_ms']:>9.2f} "
+            f"{consulta['maximo_ms']:>9.2f} {consulta['filas']:>9}  {consulta['sql'][:100]}"
+        )
+        for llamador, cantidad in list(consulta["llamadores"].items())[:3]:
+            lineas.append(f"{'':>51}  <- {llamador} ({cantidad})")
+
+    if datos["lentas"]:
+        lineas += ["", f"Consultas lentas (>= {datos['umbral_lento_ms']} ms):"]
+        for lenta in datos["lentas"]:
+            lineas.append(f"- {lenta['momento']}  {lenta['milisegundos']:.1f} ms  {lenta['llamador']}")
+            lineas.append(f"  {lenta['sql'][:200]}")
+            lineas += [f"    {linea}" for linea in lenta["plan"] or ()]
+    return "\n".join(lineas)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Muestra un volcado de la instrumentación de consultas")
+    parser.add_argument("volcado", help="Archivo JSON generado con Instrumentacion.volcar")
+    parser.add_argument("--limite", type=int, default=20, help="Sentencias que se muestran")
+    parser.add_argument("--orden", choices=list(ORDENES), default="total")
+    args = parser.parse_args(argv)
+
+    with open(args.volcado, encoding="utf-8") as archivo:
+        print(formatear(json.load(archivo), args.limite, args.orden))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Conversión de filas de consulta a objetos de modelo por posición de columna.
+
+Para cada clase y lista de columnas se genera (una sola vez) una función que
+desempaqueta cada fila por posición y llama al constructor con argumentos por
+nombre, en lugar de buscar cada campo por nombre en ``sqlite3.Row``. Funciona
+con tuplas y con ``sqlite3.Row``.
+
+Ejemplo::
+
+    mapeador = compilar(Grupo, ("id", "nombre", "campo"))
+    grupos = mapeador.todos(filas)
+
+Las columnas se asignan así:
+
+- si coinciden con un parámetro del constructor, se pasan al constructor;
+- si no, y la clase tiene ese atributo (por ejemplo ``grupo_nombre``), se
+  asignan después de construir el objeto;
+- en otro caso se ignoran.
+
+``campos`` permite renombrar columnas (``{"semillero_id": "id"}``) o
+ignorarlas explícitamente (``{"actualizado_en": None}``).
+"""
+import keyword
+from functools import lru_cache
+
+
+class Mapeador:
+    """Par de funciones compiladas para una clase y una lista de columnas"""
+
+    __slots__ = ("clase", "columnas", "uno", "todos")
+
+    def __init__(self, clase, columnas, uno, todos):
+        self.clase = clase
+        self.columnas = columnas
+        self.uno = uno        # fila -> objeto
+        self.todos = todos    # iterable de filas -> lista de objetos
+
+
+def _parametros(clase):
+    # inspect tarda en importarse y solo hace falta al compilar un mapeador
+    import inspect
+
+    firma = inspect.signature(clase.__init__)
+    return {
+        nombre for nombre, parametro in firma.parameters.items()
+        if nombre != "self" and parametro.kind in (parametro.POSITIONAL_OR_KEYWORD, parametro.KEYWORD_ONLY)
+    }
+
+
+@lru_cache(maxsize=512)
+def compilar(clase, columnas, campos=()):
+    """Genera el mapeador de filas con ``columnas`` a objetos de ``clase``
+
+    Args:
+        clase (type): Clase del modelo
+        columnas (tuple): Nombres de las columnas en el orden del resultado
+        campos (tuple): Pares (columna, atributo o None) que renombran o descartan columnas
+
+    Returns:
+        Mapeador: Funciones ``uno(fila)`` y ``todos(filas)``
+    """
+    renombres = dict(campos)
+    parametros = _parametros(clase)
+
+    variables = [f"c{posicion}" for posicion in range(len(columnas))]
+    argumentos, asignaciones = [], []
+    for variable, columna in zip(variables, columnas):
+        destino = renombres.get(columna, columna)
+        if destino is None:
+            continue
+        if not destino.isidentifier() or keyword.iskeyword(destino):
+            raise ValueError(f"Nombre de campo no válido: {destino!r}")
+        if destino in parametros:
+            argumentos.append(f"{destino}={variable}")
+        elif hasattr(clase, destino):
+            asignaciones.append(f"objeto.{destino} = {variable}")
+
+    desempaque = ", ".join(variables) + ("," if len(variables) == 1 else "")
+    construccion = f"_clase({', '.join(argumentos)})"
+
+    if asignaciones:
+        cuerpo = "\n".join(f"        {linea}" for linea in asignaciones)
+        codigo = (
+            f"def todos(filas):\n"
+            f"    resultado = []\n"
+            f"    agregar = resultado.append\n"
+            f"    for {desempaque} in filas:\n"
+            f"        objeto = {construccion}\n"
+            f"{cuerpo}\n"
+            f"        agregar(objeto)\n"
+            f"    return resultado\n"
+        )
+    else:
+        codigo = (
+            f"def todos(filas):\n"
+            f"    return [{construccion} for {desempaque} in filas]\n"
+        )
+
+    espacio = {"_clase": clase}
+    exec(compile(codigo, f"<mapeo {clase.__name__}>", "exec"), espacio)
+    todos = espacio["todos"]
+
+    def uno(fila):
+        return todos((fila,))[0]
+
+    return Mapeador(clase, columnas, uno, todos)
+
+
+def normalizar_campos(campos):
+    """Convierte un diccionario de campos en la tupla ordenada que usa ``compilar``"""
+    return tuple(sorted(campos.items())) if campos else ()
+
+
+def mapear(filas, clase, campos=None):
+    """Convierte filas ``sqlite3.Row`` en objetos, compilando el mapeador según sus columnas
+
+    Args:
+        filas (list): Filas sqlite3.Row de una misma consulta
+        clase (type): Clase del modelo
+        campos (dict, optional): Renombres de columnas (ver ``compilar``)
+
+    Returns:
+        list: Objetos de ``clase``
+    """
+    if not filas:
+        return []
+    return compilar(clase, tuple(filas[0].keys()), normalizar_campos(campos)).todos(filas)
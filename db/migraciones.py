@@ -0,0 +1,334 @@
+"""Migraciones del esquema, numeradas y registradas en ``PRAGMA user_version``.
+
+Cada migración tiene un número de versión y una lista de pasos:
+
+- ``Sql``: sentencias idempotentes (``CREATE ... IF NOT EXISTS``) en una transacción.
+- ``AgregarColumna``: ``ALTER TABLE ... ADD COLUMN`` si la columna no existe.
+  En SQLite no reescribe la tabla, así que el bloqueo es breve.
+- ``Relleno``: modificación de datos por lotes de claves, cada lote en su
+  propia transacción. Entre lotes otros procesos pueden escribir, y como el
+  relleno solo procesa las filas que aún cumplen su condición, si se
+  interrumpe continúa donde quedó.
+
+La versión de la base de datos se actualiza al terminar cada migración. Como
+todos los pasos son idempotentes, una migración interrumpida se repite
+completa en la siguiente apertura sin duplicar trabajo.
+
+Los índices, tablas de búsqueda, resúmenes y triggers no son migraciones:
+se declaran en ``db.esquema`` y ``Database`` los sincroniza al abrir.
+
+Para cambiar el esquema se agrega una migración al final de ``MIGRACIONES``
+con el siguiente número; las existentes no se modifican.
+
+Uso desde la línea de comandos::
+
+    python -m db.migraciones [--db db/semilleros.db] [--simular] [--lote 1000] [--pausa 0.05]
+"""
+import time
+
+from db.esquema import AHORA, CLAVES_PRIMARIAS, TABLAS
+
+
+class Sql:
+    """Paso con sentencias idempotentes que se ejecutan en una sola transacción"""
+
+    def __init__(self, descripcion, *sentencias):
+        self.descripcion = descripcion
+        self.sentencias = sentencias
+
+    def simular(self, db):
+        return self.descripcion
+
+    def ejecutar(self, migrador, migracion):
+        with migrador.db.transaction():
+            for sentencia in self.sentencias:
+                migrador.db.execute_query(sentencia)
+
+
+class AgregarColumna:
+    """Paso que agrega una columna a una tabla si todavía no la tiene"""
+
+    def __init__(self, tabla, columna, definicion):
+        self.tabla = tabla
+        self.columna = columna
+        self.definicion = definicion
+        self.descripcion = f"Agregar la columna {tabla}.{columna}"
+
+    def pendiente(self, db):
+        columnas = db.execute_query(f"PRAGMA table_info({self.tabla})", fetch='all')
+        return self.columna not in [columna[1] for columna in columnas]
+
+    def simular(self, db):
+        return self.descripcion if self.pendiente(db) else f"{self.descripcion} (ya existe)"
+
+    def ejecutar(self, migrador, migracion):
+        if self.pendiente(migrador.db):
+            migrador.db.execute_query(
+                f"ALTER TABLE {self.tabla} ADD COLUMN {self.columna} {self.definicion}"
+            )
+
+
+class Relleno:
+    """Paso que modifica datos por lotes de claves
+
+    Las sentencias reciben dos parámetros, el inicio (inclusivo) y el fin
+    (exclusivo) del rango de claves del lote, y deben hacer que las filas
+    del rango dejen de cumplir ``condicion``.
+    """
+
+    def __init__(self, descripcion, tabla, clave, condicion, *sentencias):
+        """
+        Args:
+            descripcion (str): Texto para el progreso y la simulación
+            tabla (str): Tabla que se recorre
+            clave (str): Columna entera única por la que se forman los lotes
+            condicion (str): Filtro SQL de las filas que faltan por procesar
+            *sentencias (str): Sentencias con parámetros (desde, hasta)
+        """
+        self.descripcion = descripcion
+        self.tabla = tabla
+        self.clave = clave
+        self.condicion = condicion
+        self.sentencias = sentencias
+
+    def pendientes(self, db):
+        query = f"SELECT COUNT(*) FROM {self.tabla} WHERE {self.condicion}"
+        return db.execute_query(query, fetch='one')[0]
+
+    def simular(self, db):
+        return f"{self.descripcion} ({self.pendientes(db)} filas pendientes)"
+
+    def ejecutar(self, migrador, migracion):
+        db = migrador.db
+        total = self.pendientes(db)
+        if not total:
+            return
+
+        siguiente = f"SELECT MIN({self.clave}) FROM {self.tabla} WHERE {self.condicion} AND {self.clave} >= ?"
+        # Clave de la primera fila pendiente después del lote: fin exclusivo del lote
+        fin_lote = (
+            f"SELECT {self.clave} FROM {self.tabla} WHERE {self.condicion} AND {self.clave} >= ? "
+            f"ORDER BY {self.clave} LIMIT 1 OFFSET ?"
+        )
+        en_rango = (
+            f"SELECT COUNT(*) FROM {self.tabla} "
+            f"WHERE {self.condicion} AND {self.clave} >= ? AND {self.clave} < ?"
+        )
+
+        hechos = 0
+        migrador.informar(migracion, self, hechos, total)
+        desde = db.execute_query(siguiente, (-2 ** 63,), fetch='one')[0]
+        while desde is not None:
+            hasta = db.execute_query(fin_lote, (desde, migrador.tamano_lote), fetch='one')
+            if hasta is None:
+                limite = db.execute_query(f"SELECT MAX({self.clave}) FROM {self.tabla}", fetch='one')[0] + 1
+            else:
+                limite = hasta[0]
+
+            with db.transaction():
+                hechos += db.execute_query(en_rango, (desde, limite), fetch='one')[0]
+                for sentencia in self.sentencias:
+                    db.execute_query(sentencia, (desde, limite))
+            migrador.informar(migracion, self, min(hechos, total), total)
+
+            if hasta is None:
+                break
+            if migrador.pausa:
+                # Deja pasar a otros escritores entre lotes
+                time.sleep(migrador.pausa)
+            desde = db.execute_query(siguiente, (limite,), fetch='one')[0]
+
+
+class Migracion:
+    """Versión del esquema y pasos para llegar a ella desde la anterior"""
+
+    def __init__(self, version, descripcion, pasos):
+        self.version = version
+        self.descripcion = descripcion
+        self.pasos = pasos
+
+
+# Traslado de los objetivos guardados como JSON en semilleros.objetivos_especificos
+# a semillero_objetivos. Un valor que no es un arreglo JSON se conserva como
+# un único objetivo.
+COPIAR_OBJETIVOS_JSON = """
+    INSERT INTO semillero_objetivos (semillero_id, posicion, objetivo)
+    SELECT s.semillero_id, j.key, j.value
+    FROM semilleros s, json_each(
+        CASE
+            WHEN NOT json_valid(s.objetivos_especificos) THEN json_array(s.objetivos_especificos)
+            WHEN json_type(s.objetivos_especificos) = 'array' THEN s.objetivos_especificos
+            ELSE json_array(s.objetivos_especificos)
+        END
+    ) j
+    WHERE s.semillero_id >= ? AND s.semillero_id < ?
+      AND s.objetivos_especificos IS NOT NULL
+      AND j.value IS NOT NULL AND trim(j.value) <> ''
+"""
+VACIAR_OBJETIVOS_JSON = """
+    UPDATE semilleros SET objetivos_especificos = NULL
+    WHERE semillero_id >= ? AND semillero_id < ? AND objetivos_especificos IS NOT NULL
+"""
+
+
+def _marcar_actualizado_en(tabla, clave):
+    return Relleno(
+        f"Marcar {tabla}.actualizado_en en las filas existentes",
+        tabla, clave, "actualizado_en IS NULL",
+        f"UPDATE {tabla} SET actualizado_en = {AHORA} "
+        f"WHERE {clave} >= ? AND {clave} < ? AND actualizado_en IS NULL",
+    )
+
+
+MIGRACIONES = [
+    Migracion(1, "Esquema inicial", [
+        Sql(
+            "Crear las tablas principales",
+            *(TABLAS[tabla] for tabla in (
+                "grupos_investigacion", "semilleros", "investigadores", "semillero_investigador", "entregables"
+            )),
+        ),
+        # Las primeras versiones creaban semilleros sin objetivo principal
+        AgregarColumna("semilleros", "objetivo_principal", 'TEXT NOT NULL DEFAULT ""'),
+    ]),
+    Migracion(2, "Marca de modificación para exportaciones incrementales", [
+        AgregarColumna(tabla, "actualizado_en", "TEXT") for tabla in CLAVES_PRIMARIAS
+    ] + [
+        _marcar_actualizado_en(tabla, clave) for tabla, clave in CLAVES_PRIMARIAS.items()
+    ]),
+    Migracion(3, "Objetivos específicos en su propia tabla", [
+        Sql("Crear la tabla semillero_objetivos", TABLAS["semillero_objetivos"]),
+        Relleno(
+            "Trasladar los objetivos específicos guardados como JSON",
+            "semilleros", "semillero_id", "objetivos_especificos IS NOT NULL",
+            COPIAR_OBJETIVOS_JSON, VACIAR_OBJETIVOS_JSON,
+        ),
+    ]),
+    Migracion(4, "Fecha de creación de los semilleros", [
+        AgregarColumna("semilleros", "creado_en", "TEXT"),
+        # La fecha real de creación se desconoce; la última modificación es la mejor aproximación
+        Relleno(
+            "Estimar semilleros.creado_en en los semilleros existentes",
+            "semilleros", "semillero_id", "creado_en IS NULL",
+            f"UPDATE semilleros SET creado_en = IFNULL(actualizado_en, {AHORA}) "
+            f"WHERE semillero_id >= ? AND semillero_id < ? AND creado_en IS NULL",
+        ),
+    ]),
+]
+
+VERSION_ACTUAL = MIGRACIONES[-1].version
+
+
+def informar_consola(migracion, paso, hechos, total):
+    """Muestra el avance de los rellenos en la consola"""
+    if hechos == 0:
+        print(f"Actualizando base de datos (versión {migracion.version}): {paso.descripcion}...")
+    else:
+        print(f"\r  {hechos}/{total} filas ({hechos * 100 // total}%)", end="\n" if hechos >= total else "", flush=True)
+
+
+class Migrador:
+    """Aplica las migraciones pendientes de una base de datos"""
+
+    def __init__(self, db, migraciones=None, tamano_lote=1000, pausa=0, progreso=informar_consola):
+        """
+        Args:
+            db (Database): Base de datos a migrar
+            migraciones (list, optional): Migraciones en orden; por defecto ``MIGRACIONES``
+            tamano_lote (int): Filas por transacción en los rellenos
+            pausa (float): Segundos de espera entre lotes de un relleno
+            progreso (callable, optional): Función (migracion, paso, hechos, total)
+                llamada al empezar un relleno y después de cada lote
+        """
+        self.db = db
+        self.migraciones = MIGRACIONES if migraciones is None else migraciones
+        self.tamano_lote = tamano_lote
+        self.pausa = pausa
+        self.progreso = progreso
+
+    def version(self):
+        """Retorna la versión del esquema registrada en la base de datos"""
+        return self.db.execute_query("PRAGMA user_version", fetch='one')[0]
+
+    def pendientes(self, hasta=None):
+        """Retorna las migraciones posteriores a la versión actual, hasta ``hasta`` inclusive"""
+        version = self.version()
+        return [
+            migracion for migracion in self.migraciones
+            if migracion.version > version and (hasta is None or migracion.version <= hasta)
+        ]
+
+    def informar(self, migracion, paso, hechos, total):
+        if self.progreso is not None:
+            self.progreso(migracion, paso, hechos, total)
+
+    def migrar(self, hasta=None, simular=False):
+        """Aplica en orden las migraciones pendientes
+
+        Args:
+            hasta (int, optional): Última versión a aplicar; por defecto todas
+            simular (bool): Solo describir lo que se haría, sin modificar nada
+
+        Returns:
+            list: (versión, descripción, lista de descripciones de pasos) por
+            cada migración aplicada o, al simular, por cada migración pendiente
+        """
+        resultado = []
+        for migracion in self.pendientes(hasta):
+            if simular:
+                resultado.append((migracion.version, migracion.descripcion, self._simular(migracion)))
+                continue
+
+            for paso in migracion.pasos:
+                paso.ejecutar(self, migracion)
+            # La versión solo avanza cuando todos los pasos terminaron
+            self.db.execute_query(f"PRAGMA user_version = {int(migracion.version)}")
+            resultado.append((migracion.version, migracion.descripcion, [paso.descripcion for paso in migracion.pasos]))
+        return resultado
+
+    def _simular(self, migracion):
+        descripciones = []
+        esquema_cambia = False
+        for paso in migracion.pasos:
+            if isinstance(paso, Relleno) and esquema_cambia:
+                # Las tablas o columnas que usa pueden no existir hasta aplicar los pasos anteriores
+                descripciones.append(f"{paso.descripcion} (filas pendientes tras los pasos anteriores)")
+                continue
+            descripciones.append(paso.simular(self.db))
+            if isinstance(paso, Sql) or (isinstance(paso, AgregarColumna) and paso.pendiente(self.db)):
+                esquema_cambia = True
+        return descripciones
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Aplica las migraciones pendientes del esquema")
+    parser.add_argument("--db", default="db/semilleros.db", help="Ruta de la base de datos")
+    parser.add_argument("--simular", action="store_true", help="Mostrar lo que se haría sin modificar nada")
+    parser.add_argument("--hasta", type=int, help="Última versión a aplicar")
+    parser.add_argument("--lote", type=int, default=1000, help="Filas por transacción en los rellenos")
+    parser.add_argument("--pausa", type=float, default=0, help="Segundos de espera entre lotes")
+    args = parser.parse_args(argv)
+
+    from db.database import Database
+
+    db = Database(args.db, migrar=False)
+    migrador = Migrador(db, tamano_lote=args.lote, pausa=args.pausa)
+    try:
+        print(f"Versión actual del esquema: {migrador.version()} (última: {VERSION_ACTUAL})")
+        aplicadas = migrador.migrar(hasta=args.hasta, simular=args.simular)
+        if not aplicadas:
+            print("No hay migraciones pendientes.")
+        for version, descripcion, pasos in aplicadas:
+            print(f"{'Pendiente' if args.simular else 'Aplicada'} {version}: {descripcion}")
+            for paso in pasos:
+                print(f"  - {paso}")
+        if not args.simular and args.hasta is None:
+            db.sincronizar_esquema()
+    finally:
+        db.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+class PoolConexiones:
+    """Pool de conexiones SQLite reutilizables (semántica préstamo/devolución)
+
+    Las conexiones se crean bajo demanda hasta ``tamano`` y se devuelven al
+    pool al terminar de usarse, de modo que las consultas siguientes
+    reutilizan conexiones ya abiertas (y su caché de páginas) en lugar de
+    abrir una nueva por cada consulta.
+    """
+
+    def __init__(self, db_path, tamano=5, inicializar=None, timeout=30.0,
+                 intervalo_verificacion=30.0):
+        """
+        Args:
+            db_path (str): Ruta del archivo de base de datos
+            tamano (int): Número máximo de conexiones abiertas a la vez
+            inicializar (callable, optional): Función que recibe cada conexión
+                nueva para configurarla (PRAGMAs, row_factory, etc.)
+            timeout (float): Segundos a esperar por una conexión libre
+            intervalo_verificacion (float): Segundos de inactividad tras los
+                cuales una conexión se verifica antes de prestarla
+        """
+        if tamano < 1:
+            raise ValueError("El tamaño del pool debe ser al menos 1")
+
+        self.db_path = db_path
+        self.tamano = tamano
+        self.inicializar = inicializar
+        self.timeout = timeout
+        self.intervalo_verificacion = intervalo_verificacion
+
+        self._libres = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._creadas = 0
+        self._cerrado = False
+
+    def _crear_conexion(self):
+        """Abre una nueva conexión y la configura"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        if self.inicializar:
+            self.inicializar(conn)
+        return conn
+
+    def _esta_sana(self, conn):
+        """Verifica que la conexión siga respondiendo"""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _descartar(self, conn):
+        """Cierra una conexión y libera su lugar en el pool"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._creadas -= 1
+
+    def obtener(self):
+        """Presta una conexión del pool
+
+        Returns:
+            sqlite3.Connection: Conexión lista para usar
+
+        Raises:
+            RuntimeError: Si el pool está cerrado o se agota el tiempo de espera
+        """
+        if self._cerrado:
+            raise RuntimeError("El pool de conexiones está cerrado")
+
+        while True:
+            try:
+                conn, devuelta_en = self._libres.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    puede_crear = self._creadas < self.tamano
+                    if puede_crear:
+                        self._creadas += 1
+                if puede_crear:
+                    try:
+                        return self._crear_conexion()
+                    except Exception:
+                        with self._lock:
+                            self._creadas -= 1
+                        raise
+                try:
+                    conn, devuelta_en = self._libres.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise RuntimeError("No hay conexiones disponibles en el pool")
+
+            # Solo verificar las conexiones que llevan tiempo inactivas
+            if time.monotonic() - devuelta_en < self.intervalo_verificacion or self._esta_sana(conn):
+                return conn
+            self._descartar(conn)
+
+    def devolver(self, conn):
+        """Devuelve una conexión prestada al pool
+
+        Si la conexión quedó con una transacción abierta se revierte, y si
+        está dañada se descarta.
+        """
+        if self._cerrado:
+            self._descartar(conn)
+            return
+
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._descartar(conn)
+            return
+
+        self._libres.put((conn, time.monotonic()))
+
+    @contextmanager
+    def conexion(self):
+        """Context manager que presta una conexión y la devuelve al salir"""
+        conn = self.obtener()
+        try:
+            yield conn
+        finally:
+            self.devolver(conn)
+
+    def verificar(self):
+        """Verifica las conexiones libres y descarta las que no responden
+
+        Returns:
+            int: Número de conexiones descartadas
+        """
+        revisadas = []
+        descartadas = 0
+        while True:
+            try:
+                conn, _ = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            if self._esta_sana(conn):
+                revisadas.append((conn, time.monotonic()))
+            else:
+                self._descartar(conn)
+                descartadas += 1
+
+        for item in revisadas:
+            self._libres.put(item)
+        return descartadas
+
+    def estadisticas(self):
+        """Retorna el estado actual del pool"""
+        return {
+            "tamano": self.tamano,
+            "creadas": self._creadas,
+            "libres": self._libres.qsize(),
+        }
+
+    def cerrar(self):
+        """Cierra todas las conexiones libres; las prestadas se cierran al devolverse"""
+        self._cerrado = True
+        while True:
+            try:
+                conn, _ = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            self._descartar(conn)
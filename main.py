@@ -1,30 +1,51 @@
+import os
+
 from db.database import Database
-from services.grupo_service import GrupoService
-from services.semillero_service import SemilleroService
 from ui.menu import Menu
-from services.entregable_service import EntregableService
 
 
 def main():
     """Función principal del programa"""
     print("Bienvenido al Sistema de Gestión de Grupos y Semilleros de Investigación - Universidad EAN")
 
-    # Inicializar la base de datos y servicios
-    db = Database()
-    grupo_service = GrupoService(db)
-    semillero_service = SemilleroService(db)
-    entregable_service = EntregableService(db)
-
-    # Cargar datos iniciales de grupos
-    grupos_cargados = grupo_service.cargar_datos_iniciales()
-    if grupos_cargados > 0:
-        print(f"Se han cargado {grupos_cargados} grupos de investigación.")
-    else:
-        print("Los datos de grupos ya están cargados en la base de datos.")
-
-    # Iniciar la interfaz de usuario
-    menu = Menu(grupo_service, semillero_service, entregable_service)
-    menu.mostrar_menu()
+    # Inicializar la base de datos; el esquema solo se actualiza si cambió
+    db = Database(os.environ.get("SEMILLEROS_DB", "db/semilleros.db"))
+
+    # Cargar los grupos iniciales si la tabla está vacía, aunque la base de
+    # datos la haya creado otro programa (migraciones, importación, ...)
+    if not db.execute_query("SELECT EXISTS (SELECT 1 FROM grupos_investigacion)", fetch='one')[0]:
+        from services.grupo_service import GrupoService
+
+        grupos_cargados = GrupoService(db).cargar_datos_iniciales()
+        if grupos_cargados > 0:
+            print(f"Se han cargado {grupos_cargados} grupos de investigación.")
+
+    # Con SEMILLEROS_INSTRUMENTAR=volcado.json se registran las consultas y al
+    # salir se guarda el volcado (ver db.instrumentacion); el umbral de las
+    # consultas lentas se toma de SEMILLEROS_CONSULTA_LENTA_MS
+    volcado = os.environ.get("SEMILLEROS_INSTRUMENTAR")
+    if volcado:
+        db.instrumentar(umbral_lento=float(os.environ.get("SEMILLEROS_CONSULTA_LENTA_MS", 100)) / 1000)
+
+    # Con SEMILLEROS_TRAZAS=trazas.json se registran los tiempos de cada
+    # operación de los servicios y al salir se exportan (ver services.trazas)
+    ruta_trazas = os.environ.get("SEMILLEROS_TRAZAS")
+    if ruta_trazas:
+        from services import trazas
+
+        trazas.activar()
+
+    # Iniciar la interfaz de usuario; los servicios se crean al usarse
+    menu = Menu(db)
+    try:
+        menu.mostrar_menu()
+    finally:
+        if volcado:
+            db.instrumentacion.volcar(volcado)
+            print(f"Instrumentación de consultas guardada en {volcado}")
+        if ruta_trazas:
+            spans = trazas.desactivar().exportar(ruta_trazas)
+            print(f"{spans} trazas guardadas en {ruta_trazas}")
 
 
 if __name__ == "__main__":
@@ -11,6 +11,10 @@ class Entregable:
 
     ESTADOS = ["pendiente", "aprobado", "rechazado"]
 
+    # Sin __dict__ por instancia: los listados grandes ocupan mucha menos memoria
+    __slots__ = ("id", "titulo", "descripcion", "tipo", "semillero_id", "fecha_entrega", "estado",
+                 "semillero_nombre")
+
     def __init__(self, id=None, titulo="", descripcion="", tipo="",
                  semillero_id=None, fecha_entrega=None, estado="pendiente"):
         self.id = id
@@ -1,6 +1,9 @@
 class Grupo:
     """Modelo para representar un Grupo de Investigación"""
 
+    # Sin __dict__ por instancia: los listados grandes ocupan mucha menos memoria
+    __slots__ = ("id", "nombre", "campo", "identificador", "director", "semillero_id")
+
     def __init__(self, id=None, nombre="", campo="", identificador="", director="", semillero_id=None):
         self.id = id
         self.nombre = nombre
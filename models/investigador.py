@@ -1,6 +1,9 @@
 class Investigador:
     """Modelo para representar un Investigador (estudiante o tutor)"""
 
+    # Sin __dict__ por instancia: los listados grandes ocupan mucha menos memoria
+    __slots__ = ("id", "nombre", "tipo", "email", "semillero_id")
+
     def __init__(self, id=None, nombre="", tipo="estudiante", email="", semillero_id=None):
         self.id = id
         self.nombre = nombre
@@ -1,12 +1,32 @@
 class Semillero:
-    """Modelo para representar un Semillero de Investigación"""
+    """Modelo para representar un Semillero de Investigación
+
+    Los objetivos, estudiantes y tutores pueden quedar diferidos con
+    ``diferir``: se cargan la primera vez que se accede a ellos, mediante un
+    cargador compartido por todo el conjunto de resultados, de modo que el
+    primer acceso completa todos los semilleros del conjunto con una sola
+    consulta por relación.
+    """
+
+    # Sin __dict__ por instancia: los listados grandes ocupan mucha menos memoria.
+    # __weakref__ permite que el cargador compartido no retenga los semilleros.
+    __slots__ = ("id", "nombre", "objetivo_principal", "_objetivos", "grupo_id", "status",
+                 "_estudiantes", "_tutores", "grupo_nombre", "_cargador", "__weakref__")
+
+    ESTADOS = ["activo", "pendiente"]
+
+    # relación -> atributos internos que la componen
+    RELACIONES = {
+        "objetivos": ("_objetivos",),
+        "investigadores": ("_estudiantes", "_tutores"),
+    }
 
     def __init__(self, id=None, nombre="", objetivo_principal="", objetivos_especificos=None,
                  grupo_id=None, status="pendiente"):
         self.id = id
         self.nombre = nombre
         self.objetivo_principal = objetivo_principal
-        self.objetivos_especificos = objetivos_especificos or []
+        self.objetivos_especificos = objetivos_especificos
         self.grupo_id = grupo_id
         self.status = status  # "activo" o "pendiente"
 
@@ -14,6 +34,58 @@ class Semillero:
         self.estudiantes = []
         self.tutores = []
         self.grupo_nombre = None  # Para mostrar el nombre del grupo asociado
+        self._cargador = None
+
+    def diferir(self, cargador, relaciones=None):
+        """Marca relaciones para cargarse en el primer acceso
+
+        Args:
+            cargador (callable): Función que recibe el nombre de la relación y
+                la carga (en este semillero y en el resto de su conjunto)
+            relaciones (iterable, optional): Nombres de ``RELACIONES``; por defecto todas
+        """
+        self._cargador = cargador
+        for relacion in relaciones or self.RELACIONES:
+            for atributo in self.RELACIONES[relacion]:
+                setattr(self, atributo, None)
+
+    def cargado(self, relacion):
+        """Indica si una relación ya está disponible sin consultar la base de datos"""
+        return all(getattr(self, atributo) is not None for atributo in self.RELACIONES[relacion])
+
+    def _asegurar(self, relacion):
+        if not self.cargado(relacion):
+            self._cargador(relacion)
+
+    @property
+    def objetivos_especificos(self):
+        if self._objetivos is None:
+            self._asegurar("objetivos")
+        return self._objetivos
+
+    @objetivos_especificos.setter
+    def objetivos_especificos(self, valor):
+        self._objetivos = [] if valor is None else valor
+
+    @property
+    def estudiantes(self):
+        if self._estudiantes is None:
+            self._asegurar("investigadores")
+        return self._estudiantes
+
+    @estudiantes.setter
+    def estudiantes(self, valor):
+        self._estudiantes = [] if valor is None else valor
+
+    @property
+    def tutores(self):
+        if self._tutores is None:
+            self._asegurar("investigadores")
+        return self._tutores
+
+    @tutores.setter
+    def tutores(self, valor):
+        self._tutores = [] if valor is None else valor
 
     def __str__(self):
         return f"{self.nombre} - {self.status.upper()}"
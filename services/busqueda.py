@@ -0,0 +1,52 @@
+"""Utilidades para las búsquedas de texto completo (FTS5)."""
+import re
+
+from services.paginacion import validar_tamano
+
+
+def consulta_fts(texto):
+    """Convierte el texto escrito por el usuario en una consulta FTS5 segura
+
+    Cada palabra se busca como prefijo y todas deben aparecer; los operadores
+    y caracteres especiales de FTS5 se descartan.
+
+    Args:
+        texto (str): Texto libre
+
+    Returns:
+        str: Consulta MATCH, o None si el texto no contiene palabras
+    """
+    palabras = re.findall(r"\w+", texto or "")
+    if not palabras:
+        return None
+    return " ".join(f'"{palabra}"*' for palabra in palabras)
+
+
+def buscar(db, query, texto, tamano, pagina):
+    """Ejecuta una búsqueda FTS5 ordenada por relevancia y paginada
+
+    Args:
+        db (Database): Base de datos
+        query (str): Consulta con un parámetro para MATCH, ordenada por rank y
+            sin LIMIT/OFFSET
+        texto (str): Texto libre a buscar
+        tamano (int): Resultados por página
+        pagina (int): Número de página, empezando en 1
+
+    Returns:
+        tuple: (filas, número de la siguiente página o None)
+    """
+    validar_tamano(tamano)
+    if pagina < 1:
+        raise ValueError("La página debe ser mayor o igual a 1")
+
+    consulta = consulta_fts(texto)
+    if consulta is None:
+        return [], None
+
+    filas = db.execute_query(
+        query + " LIMIT ? OFFSET ?", (consulta, tamano + 1, (pagina - 1) * tamano), fetch='all'
+    )
+    if len(filas) > tamano:
+        return filas[:tamano], pagina + 1
+    return filas, None
@@ -0,0 +1,59 @@
+import threading
+import time
+
+
+class CacheTTL:
+    """Caché en memoria con expiración opcional por tiempo (TTL)
+
+    Los valores ``None`` no se guardan, de modo que una búsqueda sin
+    resultado se vuelve a consultar la próxima vez.
+    """
+
+    def __init__(self, ttl=None, reloj=time.monotonic):
+        """
+        Args:
+            ttl (float, optional): Segundos de vigencia de cada entrada; None = sin expiración
+            reloj (callable): Función que retorna el tiempo actual en segundos
+        """
+        self.ttl = ttl
+        self._reloj = reloj
+        self._datos = {}
+        self._lock = threading.Lock()
+
+    def obtener(self, clave, cargar):
+        """Retorna el valor en caché o lo carga y lo guarda
+
+        Args:
+            clave: Clave de la entrada
+            cargar (callable): Función sin argumentos que obtiene el valor si no está en caché
+
+        Returns:
+            El valor en caché o el recién cargado
+        """
+        ahora = self._reloj()
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is not None and (entrada[1] is None or entrada[1] > ahora):
+                return entrada[0]
+
+        valor = cargar()
+        if valor is not None:
+            self.guardar(clave, valor)
+        return valor
+
+    def guardar(self, clave, valor):
+        """Guarda un valor en la caché"""
+        expira = self._reloj() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._datos[clave] = (valor, expira)
+
+    def invalidar(self, clave=None):
+        """Elimina una entrada, o todas si no se indica clave"""
+        with self._lock:
+            if clave is None:
+                self._datos.clear()
+            else:
+                self._datos.pop(clave, None)
+
+    def __len__(self):
+        return len(self._datos)
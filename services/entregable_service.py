@@ -1,7 +1,12 @@
 from datetime import datetime
+from db.mapeo import mapear
 from models.entregable import Entregable
+from services.busqueda import buscar
+from services.paginacion import paginar
+from services.trazas import rastreable
 
 
+@rastreable()
 class EntregableService:
     """Servicio para gestionar entregables de semilleros"""
 
@@ -50,23 +55,55 @@ class EntregableService:
             WHERE e.semillero_id = ?
         """
 
-        result = self.db.execute_query(query, (semillero_id,), fetch='one')
+        return self.db.consultar_modelos(query, (semillero_id,), Entregable, uno=True)
 
-        if not result:
-            return None
+    def obtener_pagina(self, tamano=50, cursor=None, semillero_id=None):
+        """Obtiene una página de entregables ordenados por título (paginación por cursor)
 
-        entregable = Entregable(
-            id=result['id'],
-            titulo=result['titulo'],
-            descripcion=result['descripcion'],
-            tipo=result['tipo'],
-            semillero_id=result['semillero_id'],
-            fecha_entrega=result['fecha_entrega'],
-            estado=result['estado']
-        )
+        Args:
+            tamano (int): Número de entregables por página
+            cursor (str, optional): Cursor retornado por la página anterior
+            semillero_id (int, optional): Limitar a los entregables de un semillero
+
+        Returns:
+            tuple: (lista de Entregable, cursor de la siguiente página o None)
+        """
+        query = """
+            SELECT e.*, s.nombre as semillero_nombre
+            FROM entregables e
+            LEFT JOIN semilleros s ON e.semillero_id = s.semillero_id
+        """
+        condicion, params = None, ()
+        if semillero_id is not None:
+            condicion, params = "e.semillero_id = ?", (semillero_id,)
+
+        orden = [("e.titulo", "titulo"), ("e.id", "id")]
+        filas, siguiente = paginar(self.db, query, orden, tamano, cursor, condicion, params)
+
+        return mapear(filas, Entregable), siguiente
+
+    def buscar(self, texto, tamano=20, pagina=1):
+        """Busca entregables por título y descripción, ordenados por relevancia
+
+        Args:
+            texto (str): Texto a buscar
+            tamano (int): Resultados por página
+            pagina (int): Número de página, empezando en 1
+
+        Returns:
+            tuple: (lista de Entregable, número de la siguiente página o None)
+        """
+        query = """
+            SELECT e.*, s.nombre as semillero_nombre
+            FROM entregables_fts f
+            JOIN entregables e ON e.id = f.rowid
+            LEFT JOIN semilleros s ON e.semillero_id = s.semillero_id
+            WHERE entregables_fts MATCH ?
+            ORDER BY f.rank
+        """
+        filas, siguiente = buscar(self.db, query, texto, tamano, pagina)
 
-        entregable.semillero_nombre = result['semillero_nombre']
-        return entregable
+        return mapear(filas, Entregable), siguiente
 
     def cambiar_estado(self, entregable_id, nuevo_estado):
         """Cambia el estado de un entregable (pendiente, aprobado, rechazado)"""
@@ -0,0 +1,316 @@
+"""Exportación en streaming de toda la base de datos a JSONL, CSV o formato columnar.
+
+Cada entidad (grupos, semilleros, objetivos, investigadores, entregables) se escribe en
+su propio archivo leyendo del cursor por bloques, así que la memoria usada
+depende del tamaño del bloque y no del tamaño de la base de datos.
+
+En modo incremental (``desde``) solo se exportan las filas cuyo
+``actualizado_en`` es igual o posterior a la marca indicada (los objetivos se
+exportan con su semillero, ya que al editarlos se marca el semillero). Los borrados no quedan
+registrados, por lo que periódicamente conviene hacer una exportación completa.
+La marca para la siguiente exportación se guarda en ``manifiesto.json``.
+
+Formato columnar (``.scol``)::
+
+    b"SEMCOL1\\n"
+    uint32 longitud + JSON {"columnas": [...]}
+    por cada bloque de filas:
+        uint32 número de filas (0 marca el final del archivo)
+        por cada columna:
+            1 byte de tipo: b"i" entero, b"f" real, b"t" texto
+            n bytes de nulos (1 = NULL)
+            i/f: n valores int64/float64; t: n+1 offsets uint32 + bytes UTF-8
+
+Todos los enteros se escriben en little-endian.
+
+Uso desde la línea de comandos::
+
+    python -m services.exportacion destino/ [--formato jsonl|csv|columnar] [--desde "2025-01-01 00:00:00"]
+"""
+import argparse
+import csv
+import json
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+
+from db.esquema import AHORA
+
+MODIFICADOS_DESDE = "actualizado_en >= ?"
+
+# entidad -> (consulta, columnas de orden, condición del modo incremental)
+ENTIDADES = {
+    "grupos": (
+        "SELECT id, nombre, facultad, area_conocimiento, director, campo, identificador, actualizado_en "
+        "FROM grupos_investigacion",
+        "id",
+        MODIFICADOS_DESDE,
+    ),
+    "semilleros": (
+        "SELECT semillero_id, nombre, objetivo_principal, grupo_id, status, "
+        "creado_en, actualizado_en FROM semilleros",
+        "semillero_id",
+        MODIFICADOS_DESDE,
+    ),
+    "objetivos": (
+        "SELECT semillero_id, posicion, objetivo FROM semillero_objetivos",
+        "semillero_id, posicion",
+        f"semillero_id IN (SELECT semillero_id FROM semilleros WHERE {MODIFICADOS_DESDE})",
+    ),
+    "investigadores": (
+        "SELECT id, nombre, tipo, identificacion, programa, email, semillero_id, actualizado_en "
+        "FROM investigadores",
+        "id",
+        MODIFICADOS_DESDE,
+    ),
+    "entregables": (
+        "SELECT id, titulo, descripcion, tipo, semillero_id, fecha_entrega, estado, actualizado_en "
+        "FROM entregables",
+        "id",
+        MODIFICADOS_DESDE,
+    ),
+}
+
+EXTENSIONES = {"jsonl": "jsonl", "csv": "csv", "columnar": "scol"}
+MAGIA_COLUMNAR = b"SEMCOL1\n"
+
+
+class Exportador:
+    """Exporta las entidades de la base de datos en streaming"""
+
+    def __init__(self, db, tamano_lote=5000):
+        self.db = db
+        self.tamano_lote = tamano_lote
+
+    def exportar(self, directorio, formato="jsonl", desde=None, entidades=None):
+        """Exporta las entidades a archivos en ``directorio``
+
+        Args:
+            directorio (str): Carpeta de destino (se crea si no existe)
+            formato (str): 'jsonl', 'csv' o 'columnar'
+            desde (str | datetime, optional): Exportar solo filas modificadas después de esta marca (UTC)
+            entidades (list, optional): Subconjunto de ``ENTIDADES``; por defecto todas
+
+        Returns:
+            dict: Manifiesto con las filas exportadas por entidad y la marca para
+            la siguiente exportación incremental
+        """
+        if formato not in EXTENSIONES:
+            raise ValueError(f"Formato no soportado: {formato}. Debe ser uno de: {', '.join(EXTENSIONES)}")
+
+        entidades = entidades or list(ENTIDADES)
+        desconocidas = set(entidades) - set(ENTIDADES)
+        if desconocidas:
+            raise ValueError(f"Entidades no válidas: {', '.join(sorted(desconocidas))}")
+
+        if isinstance(desde, datetime):
+            desde = desde.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+        os.makedirs(directorio, exist_ok=True)
+
+        # La marca se toma antes de leer y la comparación es inclusiva: lo que
+        # cambie durante la exportación se repite en la siguiente en lugar de perderse
+        marca = self.db.execute_query(f"SELECT {AHORA}", fetch='one')[0]
+
+        manifiesto = {"formato": formato, "desde": desde, "hasta": marca, "filas": {}}
+        for entidad in entidades:
+            ruta = os.path.join(directorio, f"{entidad}.{EXTENSIONES[formato]}")
+            manifiesto["filas"][entidad] = self._exportar_entidad(entidad, ruta, formato, desde)
+
+        with open(os.path.join(directorio, "manifiesto.json"), "w", encoding="utf-8") as archivo:
+            json.dump(manifiesto, archivo, ensure_ascii=False, indent=2)
+
+        return manifiesto
+
+    def _bloques(self, entidad, desde):
+        """Genera (columnas, bloque de filas como tuplas) leyendo del cursor"""
+        query, orden, incremental = ENTIDADES[entidad]
+        params = None
+        if desde is not None:
+            query += f" WHERE {incremental}"
+            params = (desde,)
+        query += f" ORDER BY {orden}"
+
+        columnas = None
+        bloque = []
+        for fila in self.db.execute_query(query, params, fetch='iter', tamano_lote=self.tamano_lote):
+            if columnas is None:
+                columnas = list(fila.keys())
+            bloque.append(tuple(fila))
+            if len(bloque) >= self.tamano_lote:
+                yield columnas, bloque
+                bloque = []
+
+        if bloque:
+            yield columnas, bloque
+
+    def _exportar_entidad(self, entidad, ruta, formato, desde):
+        total = 0
+        with ESCRITORES[formato](ruta) as salida:
+            for columnas, bloque in self._bloques(entidad, desde):
+                salida.escribir(columnas, bloque)
+                total += len(bloque)
+        return total
+
+
+class _EscritorJSONL:
+    def __init__(self, ruta):
+        self.archivo = open(ruta, "w", encoding="utf-8")
+
+    def escribir(self, columnas, bloque):
+        lineas = [json.dumps(dict(zip(columnas, fila)), ensure_ascii=False) for fila in bloque]
+        self.archivo.write("\n".join(lineas) + "\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.archivo.close()
+
+
+class _EscritorCSV:
+    def __init__(self, ruta):
+        self.archivo = open(ruta, "w", encoding="utf-8", newline="")
+        self.csv = csv.writer(self.archivo)
+        self.encabezado = False
+
+    def escribir(self, columnas, bloque):
+        if not self.encabezado:
+            self.csv.writerow(columnas)
+            self.encabezado = True
+        self.csv.writerows(bloque)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.archivo.close()
+
+
+def _a_little_endian(valores):
+    if sys.byteorder == "big":
+        valores.byteswap()
+    return valores.tobytes()
+
+
+class _EscritorColumnar:
+    def __init__(self, ruta):
+        self.archivo = open(ruta, "wb")
+        self.archivo.write(MAGIA_COLUMNAR)
+        self.encabezado = False
+
+    def escribir(self, columnas, bloque):
+        if not self.encabezado:
+            cabecera = json.dumps({"columnas": columnas}).encode("utf-8")
+            self.archivo.write(struct.pack("<I", len(cabecera)) + cabecera)
+            self.encabezado = True
+
+        partes = [struct.pack("<I", len(bloque))]
+        for valores in zip(*bloque):
+            partes.extend(self._codificar_columna(valores))
+        self.archivo.write(b"".join(partes))
+
+    @staticmethod
+    def _codificar_columna(valores):
+        nulos = bytes(1 if valor is None else 0 for valor in valores)
+        presentes = [valor for valor in valores if valor is not None]
+
+        if all(isinstance(valor, int) for valor in presentes):
+            datos = array("q", (0 if valor is None else valor for valor in valores))
+            return [b"i", nulos, _a_little_endian(datos)]
+
+        if all(isinstance(valor, (int, float)) for valor in presentes):
+            datos = array("d", (0.0 if valor is None else float(valor) for valor in valores))
+            return [b"f", nulos, _a_little_endian(datos)]
+
+        codificados = [b"" if valor is None else str(valor).encode("utf-8") for valor in valores]
+        offsets = array("I", [0])
+        acumulado = 0
+        for texto in codificados:
+            acumulado += len(texto)
+            offsets.append(acumulado)
+        return [b"t", nulos, _a_little_endian(offsets), b"".join(codificados)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if not self.encabezado:
+            cabecera = json.dumps({"columnas": []}).encode("utf-8")
+            self.archivo.write(struct.pack("<I", len(cabecera)) + cabecera)
+        self.archivo.write(struct.pack("<I", 0))
+        self.archivo.close()
+
+
+# formato -> escritor; cada uno recibe la ruta y luego bloques con escribir(columnas, filas)
+ESCRITORES = {"jsonl": _EscritorJSONL, "csv": _EscritorCSV, "columnar": _EscritorColumnar}
+
+
+def leer_columnar(ruta):
+    """Lee un archivo columnar completo
+
+    Args:
+        ruta (str): Archivo ``.scol`` generado por el exportador
+
+    Returns:
+        dict: nombre de columna -> lista de valores
+    """
+    with open(ruta, "rb") as archivo:
+        if archivo.read(len(MAGIA_COLUMNAR)) != MAGIA_COLUMNAR:
+            raise ValueError("El archivo no tiene formato columnar")
+
+        longitud, = struct.unpack("<I", archivo.read(4))
+        columnas = json.loads(archivo.read(longitud))["columnas"]
+        resultado = {columna: [] for columna in columnas}
+
+        while True:
+            filas, = struct.unpack("<I", archivo.read(4))
+            if filas == 0:
+                break
+            for columna in columnas:
+                tipo = archivo.read(1)
+                nulos = archivo.read(filas)
+                if tipo in (b"i", b"f"):
+                    valores = array("q" if tipo == b"i" else "d")
+                    valores.frombytes(archivo.read(filas * 8))
+                    if sys.byteorder == "big":
+                        valores.byteswap()
+                    valores = list(valores)
+                else:
+                    offsets = array("I")
+                    offsets.frombytes(archivo.read((filas + 1) * 4))
+                    if sys.byteorder == "big":
+                        offsets.byteswap()
+                    datos = archivo.read(offsets[-1])
+                    valores = [datos[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(filas)]
+
+                resultado[columna].extend(
+                    None if nulo else valor for nulo, valor in zip(nulos, valores)
+                )
+
+    return resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta la base de datos de semilleros")
+    parser.add_argument("directorio", help="Carpeta de destino")
+    parser.add_argument("--formato", choices=list(EXTENSIONES), default="jsonl")
+    parser.add_argument("--desde", help="Exportar solo filas modificadas después de esta marca (UTC)")
+    parser.add_argument("--db", default="db/semilleros.db", help="Ruta de la base de datos")
+    args = parser.parse_args(argv)
+
+    from db.database import Database
+
+    db = Database(args.db)
+    manifiesto = Exportador(db).exportar(args.directorio, args.formato, args.desde)
+    db.cerrar()
+
+    for entidad, filas in manifiesto["filas"].items():
+        print(f"{entidad}: {filas} filas")
+    print(f"Marca para la siguiente exportación incremental: {manifiesto['hasta']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""Generación masiva de fichas (hojas de detalle) de los semilleros.
+
+Cada ficha contiene los detalles del semillero y de sus entregables, con el
+mismo contenido que ``Semillero.detalles()`` y ``Entregable.detalles()``,
+en texto plano o HTML. El proceso:
+
+1. Copia la base de datos a una instantánea temporal con la API de respaldo
+   de SQLite, para que todas las fichas reflejen el mismo momento aunque se
+   sigan haciendo cambios.
+2. Divide los semilleros en rangos de IDs y reparte los rangos entre un
+   grupo de procesos. Cada proceso abre la instantánea en solo lectura, lee
+   su rango con una consulta por tabla y escribe sus archivos.
+3. Las fichas se generan con plantillas compiladas una sola vez al importar
+   el módulo (métodos ``str.format`` ya enlazados), sin construir objetos de
+   modelo por semillero.
+
+Uso desde la línea de comandos::
+
+    python -m services.fichas destino/ [--formato txt|html] [--procesos N]
+"""
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+from itertools import groupby
+from operator import itemgetter
+
+SEPARADOR = "=" * 60
+
+_TXT = {
+    "ficha": (
+        f"{SEPARADOR}\nDETALLES DEL SEMILLERO DE INVESTIGACIÓN\n{SEPARADOR}\n"
+        "{semillero}\n{SEPARADOR}\n{entregables}"
+    ).format,
+    "semillero": (
+        "NOMBRE: {nombre}\n"
+        "ESTADO: {estado}\n"
+        "OBJETIVO PRINCIPAL: {objetivo_principal}\n"
+        "GRUPO DE INVESTIGACIÓN: {grupo}\n"
+        "\nOBJETIVOS ESPECÍFICOS:{objetivos}\n"
+        "\nESTUDIANTES:{estudiantes}\n"
+        "\nTUTORES:{tutores}"
+    ).format,
+    "objetivo": "\n  {0}. {1}".format,
+    "persona": "\n  - {0} ({1})".format,
+    "entregable": (
+        "ENTREGABLE\n{SEPARADOR}\n"
+        "TÍTULO: {titulo}\n"
+        "TIPO: {tipo}\n"
+        "ESTADO: {estado}\n"
+        "SEMILLERO: {semillero}\n"
+        "FECHA DE ENTREGA: {fecha_entrega}\n"
+        "\nDESCRIPCIÓN: {descripcion}\n{SEPARADOR}\n"
+    ).format,
+    "sin_entregables": "Sin entregables asignados\n".format,
+}
+
+_HTML = {
+    "ficha": (
+        '<!DOCTYPE html>\n<html lang="es">\n<head><meta charset="utf-8"><title>{titulo}</title></head>\n'
+        "<body>\n<h1>Detalles del semillero de investigación</h1>\n{semillero}\n"
+        "<h2>Entregables</h2>\n{entregables}</body>\n</html>\n"
+    ).format,
+    "semillero": (
+        "<dl>\n"
+        "<dt>Nombre</dt><dd>{nombre}</dd>\n"
+        "<dt>Estado</dt><dd>{estado}</dd>\n"
+        "<dt>Objetivo principal</dt><dd>{objetivo_principal}</dd>\n"
+        "<dt>Grupo de investigación</dt><dd>{grupo}</dd>\n"
+        "</dl>\n"
+        "<h2>Objetivos específicos</h2>\n<ol>{objetivos}</ol>\n"
+        "<h2>Estudiantes</h2>\n<ul>{estudiantes}</ul>\n"
+        "<h2>Tutores</h2>\n<ul>{tutores}</ul>"
+    ).format,
+    "objetivo": "<li>{1}</li>".format,
+    "persona": "<li>{0} ({1})</li>".format,
+    "entregable": (
+        "<dl>\n"
+        "<dt>Título</dt><dd>{titulo}</dd>\n"
+        "<dt>Tipo</dt><dd>{tipo}</dd>\n"
+        "<dt>Estado</dt><dd>{estado}</dd>\n"
+        "<dt>Semillero</dt><dd>{semillero}</dd>\n"
+        "<dt>Fecha de entrega</dt><dd>{fecha_entrega}</dd>\n"
+        "<dt>Descripción</dt><dd>{descripcion}</dd>\n"
+        "</dl>\n"
+    ).format,
+    "sin_entregables": "<p>Sin entregables asignados</p>\n".format,
+}
+
+# formato -> (plantillas, función de escape, extensión)
+FORMATOS = {
+    "txt": (_TXT, str, "txt"),
+    "html": (_HTML, lambda valor: escape(str(valor)), "html"),
+}
+
+_SEMILLEROS = """
+    SELECT s.semillero_id, s.nombre, s.objetivo_principal, s.status, g.nombre
+    FROM semilleros s
+    LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+    WHERE s.semillero_id BETWEEN ? AND ?
+    ORDER BY s.semillero_id
+"""
+_OBJETIVOS = """
+    SELECT semillero_id, objetivo FROM semillero_objetivos
+    WHERE semillero_id BETWEEN ? AND ?
+    ORDER BY semillero_id, posicion
+"""
+_INVESTIGADORES = """
+    SELECT semillero_id, tipo, nombre, email FROM investigadores
+    WHERE semillero_id BETWEEN ? AND ?
+    ORDER BY semillero_id, tipo, nombre
+"""
+_ENTREGABLES = """
+    SELECT semillero_id, titulo, tipo, estado, fecha_entrega, descripcion FROM entregables
+    WHERE semillero_id BETWEEN ? AND ?
+    ORDER BY semillero_id, id
+"""
+
+
+def _agrupar(filas):
+    """Agrupa filas ordenadas por semillero_id (primera columna) en un diccionario"""
+    return {clave: list(grupo) for clave, grupo in groupby(filas, key=itemgetter(0))}
+
+
+def _generar_rango(tarea):
+    """Genera las fichas de los semilleros con ID en [desde, hasta]
+
+    Se ejecuta en los procesos del grupo, así que solo recibe datos
+    serializables y abre su propia conexión de solo lectura a la instantánea.
+
+    Returns:
+        int: Número de fichas escritas
+    """
+    instantanea, desde, hasta, directorio, formato = tarea
+    plantillas, esc, extension = FORMATOS[formato]
+    persona, objetivo = plantillas["persona"], plantillas["objetivo"]
+
+    conn = sqlite3.connect(f"file:{instantanea}?mode=ro", uri=True)
+    try:
+        rango = (desde, hasta)
+        semilleros = conn.execute(_SEMILLEROS, rango).fetchall()
+        objetivos = _agrupar(conn.execute(_OBJETIVOS, rango))
+        investigadores = _agrupar(conn.execute(_INVESTIGADORES, rango))
+        entregables = _agrupar(conn.execute(_ENTREGABLES, rango))
+    finally:
+        conn.close()
+
+    for semillero_id, nombre, objetivo_principal, status, grupo in semilleros:
+        equipo = investigadores.get(semillero_id, ())
+        texto_semillero = plantillas["semillero"](
+            nombre=esc(nombre),
+            estado="ACTIVO" if status == "activo" else "PENDIENTE",
+            objetivo_principal=esc(objetivo_principal),
+            grupo=esc(grupo or "No asignado"),
+            objetivos="".join(
+                objetivo(posicion, esc(texto))
+                for posicion, (_, texto) in enumerate(objetivos.get(semillero_id, ()), 1)
+            ),
+            estudiantes="".join(persona(esc(n), esc(e)) for _, tipo, n, e in equipo if tipo == "estudiante"),
+            tutores="".join(persona(esc(n), esc(e)) for _, tipo, n, e in equipo if tipo == "tutor"),
+        )
+
+        texto_entregables = "".join(
+            plantillas["entregable"](
+                SEPARADOR=SEPARADOR,
+                titulo=esc(titulo),
+                tipo=esc(tipo),
+                estado=esc((estado or "").upper()),
+                semillero=esc(nombre),
+                fecha_entrega=esc(fecha_entrega or "No definida"),
+                descripcion=esc(descripcion),
+            )
+            for _, titulo, tipo, estado, fecha_entrega, descripcion in entregables.get(semillero_id, ())
+        ) or plantillas["sin_entregables"]()
+
+        contenido = plantillas["ficha"](
+            SEPARADOR=SEPARADOR, titulo=esc(nombre), semillero=texto_semillero, entregables=texto_entregables
+        )
+        ruta = os.path.join(directorio, f"semillero_{semillero_id}.{extension}")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+
+    return len(semilleros)
+
+
+class GeneradorFichas:
+    """Genera en paralelo las fichas de todos los semilleros"""
+
+    def __init__(self, db, procesos=None, tamano_lote=500):
+        """
+        Args:
+            db (Database): Base de datos de origen
+            procesos (int, optional): Procesos del grupo; por defecto uno por núcleo.
+                Con 1 todo se genera en el proceso actual
+            tamano_lote (int): Semilleros por tarea
+        """
+        self.db = db
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tamano_lote = tamano_lote
+
+    def _rangos(self, instantanea):
+        """Divide los IDs de la instantánea en rangos [desde, hasta] de ``tamano_lote`` semilleros"""
+        conn = sqlite3.connect(f"file:{instantanea}?mode=ro", uri=True)
+        try:
+            ids = [fila[0] for fila in conn.execute("SELECT semillero_id FROM semilleros ORDER BY semillero_id")]
+        finally:
+            conn.close()
+        return [
+            (ids[inicio], ids[min(inicio + self.tamano_lote, len(ids)) - 1])
+            for inicio in range(0, len(ids), self.tamano_lote)
+        ]
+
+    def generar(self, directorio, formato="txt"):
+        """Genera una ficha por semillero en ``directorio``
+
+        Args:
+            directorio (str): Carpeta de destino (se crea si no existe)
+            formato (str): 'txt' o 'html'
+
+        Returns:
+            int: Número de fichas generadas
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato no soportado: {formato}. Debe ser uno de: {', '.join(FORMATOS)}")
+
+        os.makedirs(directorio, exist_ok=True)
+        temporal = tempfile.mkdtemp(prefix="fichas_")
+        try:
+            instantanea = os.path.join(temporal, "instantanea.db")
+            self.db.respaldar(instantanea)
+
+            tareas = [
+                (instantanea, desde, hasta, directorio, formato)
+                for desde, hasta in self._rangos(instantanea)
+            ]
+            if self.procesos == 1 or len(tareas) <= 1:
+                return sum(map(_generar_rango, tareas))
+
+            with ProcessPoolExecutor(max_workers=min(self.procesos, len(tareas))) as grupo:
+                return sum(grupo.map(_generar_rango, tareas))
+        finally:
+            shutil.rmtree(temporal, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera las fichas de todos los semilleros")
+    parser.add_argument("directorio", help="Carpeta de destino")
+    parser.add_argument("--formato", choices=list(FORMATOS), default="txt")
+    parser.add_argument("--procesos", type=int, help="Número de procesos; por defecto uno por núcleo")
+    parser.add_argument("--db", default="db/semilleros.db", help="Ruta de la base de datos")
+    args = parser.parse_args(argv)
+
+    from db.database import Database
+
+    db = Database(args.db)
+    try:
+        total = GeneradorFichas(db, procesos=args.procesos).generar(args.directorio, args.formato)
+    finally:
+        db.cerrar()
+    print(f"Se generaron {total} fichas en {args.directorio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,30 @@
 from models.grupo import Grupo
+from models.semillero import Semillero
 from db.database import Database
+from db.mapeo import compilar, mapear
+from services.cache import CacheTTL
+from services.paginacion import paginar
+from services.trazas import rastreable
 
 
+@rastreable(internos=("_consultar_todos", "_consultar_por_id", "_consultar_por_identificador"))
 class GrupoService:
-    """Lógica de negocio para grupos de investigación"""
+    """Lógica de negocio para grupos de investigación
 
-    def __init__(self, database=None):
+    Los grupos casi nunca cambian, así que las consultas por ID, por
+    identificador y el listado completo se guardan en una caché en memoria.
+    La caché se invalida al crear grupos; ``cache_ttl`` limita además su
+    vigencia por si otro proceso modifica la base de datos. Los objetos
+    Grupo retornados se comparten entre llamadas y no deben modificarse.
+    """
+
+    def __init__(self, database=None, cache_ttl=None):
         self.db = database or Database()
+        self._cache = CacheTTL(ttl=cache_ttl)
+
+    def invalidar_cache(self):
+        """Descarta todos los grupos en caché"""
+        self._cache.invalidar()
 
     def crear_grupo(self, grupo):
         """Crea un nuevo grupo de investigación en la base de datos"""
@@ -17,86 +35,91 @@ class GrupoService:
         """
         params = (grupo.nombre, grupo.campo, grupo.identificador, grupo.director)
 
-        return self.db.execute_query(query, params)
+        grupo_id = self.db.execute_query(query, params)
+        self.invalidar_cache()
+        return grupo_id
     
     def obtener_semilleros(self):
-        """Obtiene todos los grupos de investigación"""
-        query = "SELECT id, nombre, objetivo_principal, objetivos_especificos, status FROM semilleros ORDER BY nombre"
-        resultados = self.db.execute_query(query, fetch='all')
-
-        grupos = []
-        for resultado in resultados:
-            grupo = Grupo(
-                id=resultado['id'],
-                nombre=resultado['nombre'],
-                campo=resultado['objetivo_principal'],
-                identificador=resultado['objetivos_especificos'],
-                status=resultado['status']
-            )
-            grupos.append(grupo)
-        return grupos
-
-        
+        """Obtiene todos los semilleros (sin objetivos ni investigadores) ordenados por nombre"""
+        query = """
+            SELECT semillero_id, nombre, objetivo_principal, grupo_id, status
+            FROM semilleros ORDER BY nombre
+        """
+        return self.db.consultar_modelos(query, clase=Semillero, campos={"semillero_id": "id"})
 
     def obtener_todos(self):
         """Obtiene todos los grupos de investigación"""
+        grupos = self._cache.obtener(("todos",), self._consultar_todos)
+        return list(grupos)
+
+    def _consultar_todos(self):
+        """Consulta todos los grupos y precarga la caché por ID e identificador"""
         query = "SELECT id, nombre, campo, identificador, director FROM grupos_investigacion ORDER BY nombre"
-        resultados = self.db.execute_query(query, fetch='all')
-
-        grupos = []
-        for resultado in resultados:
-            grupo = Grupo(
-                id=resultado['id'],
-                nombre=resultado['nombre'],
-                campo=resultado['campo'],
-                identificador=resultado['identificador'],
-                director=resultado['director']
-            )
-            grupos.append(grupo)
+        grupos = self.db.consultar_modelos(query, clase=Grupo)
+
+        for grupo in grupos:
+            self._cache.guardar(("id", grupo.id), grupo)
+            if grupo.identificador:
+                self._cache.guardar(("identificador", grupo.identificador), grupo)
 
         return grupos
 
+    def iter_todos(self, tamano_lote=500):
+        """Recorre todos los grupos leyendo del cursor en bloques (sin caché)
+
+        Args:
+            tamano_lote (int): Filas leídas por cada fetchmany
+
+        Yields:
+            Grupo: Grupos ordenados por nombre
+        """
+        query = "SELECT id, nombre, campo, identificador, director FROM grupos_investigacion ORDER BY nombre, id"
+        mapeador = None
+        for resultado in self.db.execute_query(query, fetch='iter', tamano_lote=tamano_lote):
+            if mapeador is None:
+                mapeador = compilar(Grupo, tuple(resultado.keys()))
+            yield mapeador.uno(resultado)
+
+    def obtener_pagina(self, tamano=50, cursor=None):
+        """Obtiene una página de grupos ordenados por nombre (paginación por cursor)
+
+        Args:
+            tamano (int): Número de grupos por página
+            cursor (str, optional): Cursor retornado por la página anterior
+
+        Returns:
+            tuple: (lista de Grupo, cursor de la siguiente página o None)
+        """
+        query = "SELECT id, nombre, campo, identificador, director FROM grupos_investigacion"
+        filas, siguiente = paginar(self.db, query, [("nombre", "nombre"), ("id", "id")], tamano, cursor)
+
+        return mapear(filas, Grupo), siguiente
+
     def obtener_por_id(self, grupo_id):
         """Obtiene un grupo de investigación por su ID"""
+        return self._cache.obtener(("id", grupo_id), lambda: self._consultar_por_id(grupo_id))
+
+    def _consultar_por_id(self, grupo_id):
         query = """
             SELECT g.id, g.nombre, g.campo, g.identificador, g.director
             FROM grupos_investigacion g
             WHERE g.id = ?
         """
-        resultado = self.db.execute_query(query, (grupo_id,), fetch='one')
-
-        if resultado:
-            grupo = Grupo(
-                id=resultado['id'],
-                nombre=resultado['nombre'],
-                campo=resultado['campo'],
-                identificador=resultado['identificador'],
-                director=resultado['director']
-            )
-            return grupo
-
-        return None
+        return self.db.consultar_modelos(query, (grupo_id,), Grupo, uno=True)
     
     def obtener_por_identificador(self, identificador):
         """Obtiene un grupo de investigación por su identificador único"""
+        return self._cache.obtener(
+            ("identificador", identificador), lambda: self._consultar_por_identificador(identificador)
+        )
+
+    def _consultar_por_identificador(self, identificador):
         query = """
             SELECT g.id, g.nombre, g.campo, g.identificador, g.director
             FROM grupos_investigacion g
             WHERE g.identificador = ?
         """
-        resultado = self.db.execute_query(query, (identificador,), fetch='one')
-
-        if resultado:
-            grupo = Grupo(
-                id=resultado['id'],
-                nombre=resultado['nombre'],
-                campo=resultado['campo'],
-                identificador=resultado['identificador'],
-                director=resultado['director']
-            )
-            return grupo
-
-        return None
+        return self.db.consultar_modelos(query, (identificador,), Grupo, uno=True)
 
 
     def cargar_datos_iniciales(self):
@@ -127,6 +150,7 @@ class GrupoService:
                 VALUES (?, ?, ?, ?)
             """
             self.db.execute_many(query, grupos)
+            self.invalidar_cache()
             return len(grupos)
 
         return 0
@@ -0,0 +1,312 @@
+"""Importación masiva de semilleros y sus investigadores desde JSONL o CSV.
+
+Formato JSONL (un semillero por línea)::
+
+    {"nombre": "...", "objetivo_principal": "...",
+     "objetivos_especificos": ["...", "..."],
+     "grupo_id": 1,                      # o "grupo_identificador": "COL0011599"
+     "status": "pendiente",
+     "estudiantes": [{"nombre": "...", "email": "..."}, "Solo nombre"],
+     "tutores": [{"nombre": "...", "email": "..."}]}
+
+Formato CSV: columnas con los mismos nombres. ``objetivos_especificos``,
+``estudiantes`` y ``tutores`` separan sus elementos con ``|`` y cada
+investigador se escribe como ``Nombre, email`` (igual que en el menú).
+
+Uso desde la línea de comandos::
+
+    python -m services.importacion semilleros.jsonl [--formato csv] [--lote 1000]
+"""
+import argparse
+import csv
+import json
+import sqlite3
+
+from models.semillero import Semillero
+from services.grupo_service import GrupoService
+
+CAMPOS_TEXTO = ("nombre", "objetivo_principal", "grupo_identificador")
+CAMPOS_LISTA = ("objetivos_especificos", "estudiantes", "tutores")
+
+
+class ResultadoImportacion:
+    """Resumen de una importación: registros importados y errores por registro"""
+
+    def __init__(self):
+        self.importados = 0
+        self.errores = []  # (número de registro, lista de mensajes)
+
+    @property
+    def rechazados(self):
+        return len(self.errores)
+
+    def __str__(self):
+        return f"Importados: {self.importados} - Rechazados: {self.rechazados}"
+
+
+class ImportadorSemilleros:
+    """Importa semilleros en lotes: cada lote se valida con ``Semillero.validar``
+    y se inserta con ``executemany`` dentro de una sola transacción."""
+
+    QUERY_SEMILLERO = """
+        INSERT INTO semilleros
+        (nombre, objetivo_principal, grupo_id, status)
+        VALUES (?, ?, ?, ?)
+    """
+    QUERY_OBJETIVO = """
+        INSERT INTO semillero_objetivos
+        (semillero_id, posicion, objetivo)
+        VALUES (?, ?, ?)
+    """
+    QUERY_INVESTIGADOR = """
+        INSERT INTO investigadores
+        (nombre, tipo, email, semillero_id)
+        VALUES (?, ?, ?, ?)
+    """
+
+    def __init__(self, db, tamano_lote=1000, grupo_service=None):
+        self.db = db
+        self.tamano_lote = tamano_lote
+        self.grupo_service = grupo_service or GrupoService(db)
+
+    def importar(self, ruta, formato=None, progreso=None):
+        """Importa un archivo de semilleros
+
+        Args:
+            ruta (str): Ruta del archivo
+            formato (str, optional): 'jsonl' o 'csv'; por defecto según la extensión
+            progreso (callable, optional): Función que recibe el ResultadoImportacion
+                después de cada lote
+
+        Returns:
+            ResultadoImportacion: Conteo de importados y errores por registro
+        """
+        formato = formato or ("csv" if ruta.lower().endswith(".csv") else "jsonl")
+        if formato not in ("jsonl", "csv"):
+            raise ValueError(f"Formato no soportado: {formato}")
+
+        resultado = ResultadoImportacion()
+        with open(ruta, encoding="utf-8", newline="") as archivo:
+            registros = self._leer_csv(archivo) if formato == "csv" else self._leer_jsonl(archivo)
+
+            lote = []
+            for numero, registro in registros:
+                semillero, errores = self._preparar(registro)
+                if errores:
+                    resultado.errores.append((numero, errores))
+                    continue
+
+                lote.append((numero, semillero))
+                if len(lote) >= self.tamano_lote:
+                    self._insertar_lote(lote, resultado)
+                    lote = []
+                    if progreso:
+                        progreso(resultado)
+
+            if lote:
+                self._insertar_lote(lote, resultado)
+                if progreso:
+                    progreso(resultado)
+
+        return resultado
+
+    def _leer_jsonl(self, archivo):
+        """Genera (número de línea, registro) por cada línea no vacía"""
+        for numero, linea in enumerate(archivo, 1):
+            linea = linea.strip()
+            if not linea:
+                continue
+            try:
+                yield numero, json.loads(linea)
+            except json.JSONDecodeError as e:
+                yield numero, e
+
+    def _leer_csv(self, archivo):
+        """Genera (número de fila, registro) convirtiendo las columnas con listas"""
+        for numero, fila in enumerate(csv.DictReader(archivo), 2):
+            registro = dict(fila)
+            registro["objetivos_especificos"] = self._partir(fila.get("objetivos_especificos"))
+            for tipo in ("estudiantes", "tutores"):
+                registro[tipo] = [self._investigador_csv(valor) for valor in self._partir(fila.get(tipo))]
+            yield numero, registro
+
+    @staticmethod
+    def _partir(valor):
+        return [parte.strip() for parte in (valor or "").split("|") if parte.strip()]
+
+    @staticmethod
+    def _investigador_csv(valor):
+        partes = valor.split(",")
+        return {"nombre": partes[0].strip(), "email": partes[1].strip() if len(partes) > 1 else ""}
+
+    def _preparar(self, registro):
+        """Convierte un registro en Semillero y lo valida
+
+        Returns:
+            tuple: (Semillero o None, lista de errores)
+        """
+        if isinstance(registro, Exception):
+            return None, [f"JSON inválido: {registro}"]
+        if not isinstance(registro, dict):
+            return None, ["El registro debe ser un objeto"]
+
+        errores = self._validar_tipos(registro)
+        if errores:
+            return None, errores
+
+        grupo_id = registro.get("grupo_id")
+        identificador = registro.get("grupo_identificador")
+        if grupo_id not in (None, ""):
+            try:
+                grupo_id = int(grupo_id)
+            except (TypeError, ValueError):
+                return None, [f"grupo_id no válido: {grupo_id}"]
+            if not self.grupo_service.obtener_por_id(grupo_id):
+                errores.append(f"No existe el grupo con ID {grupo_id}")
+        elif identificador:
+            grupo = self.grupo_service.obtener_por_identificador(identificador)
+            grupo_id = grupo.id if grupo else None
+            if not grupo:
+                errores.append(f"No existe el grupo con identificador {identificador}")
+
+        objetivos = self._lista(registro.get("objetivos_especificos"))
+
+        status = registro.get("status") or "pendiente"
+        if status not in Semillero.ESTADOS:
+            errores.append(f"Status no válido: {status}")
+
+        semillero = Semillero(
+            nombre=(registro.get("nombre") or "").strip(),
+            objetivo_principal=(registro.get("objetivo_principal") or "").strip(),
+            objetivos_especificos=objetivos,
+            grupo_id=grupo_id,
+            status=status
+        )
+        semillero.estudiantes = self._lista(registro.get("estudiantes"))
+        semillero.tutores = self._lista(registro.get("tutores"))
+
+        for tipo in ("estudiantes", "tutores"):
+            for investigador in getattr(semillero, tipo):
+                nombre = investigador.get("nombre") if isinstance(investigador, dict) else investigador
+                if not nombre or not str(nombre).strip():
+                    errores.append(f"Hay {tipo} sin nombre")
+                    break
+
+        errores = semillero.validar() + errores
+        return (None, errores) if errores else (semillero, [])
+
+    @staticmethod
+    def _validar_tipos(registro):
+        """Errores por campos con un tipo distinto al esperado (vacíos o ausentes se aceptan)"""
+        errores = []
+        for campo in CAMPOS_TEXTO:
+            valor = registro.get(campo)
+            if valor is not None and not isinstance(valor, str):
+                errores.append(f"El campo {campo} debe ser texto")
+        for campo in CAMPOS_LISTA:
+            valor = registro.get(campo)
+            if valor is not None and not isinstance(valor, (str, list)):
+                errores.append(f"El campo {campo} debe ser texto o lista")
+        return errores
+
+    @staticmethod
+    def _lista(valor):
+        """Lista de elementos de un campo de ``CAMPOS_LISTA``; un texto es un solo elemento"""
+        if isinstance(valor, str):
+            return [valor] if valor.strip() else []
+        return list(valor or [])
+
+    @staticmethod
+    def _filas_investigadores(semillero, semillero_id):
+        filas = []
+        for tipo, investigadores in (("estudiante", semillero.estudiantes), ("tutor", semillero.tutores)):
+            for inv in investigadores:
+                if isinstance(inv, dict):
+                    filas.append((str(inv.get("nombre", "")).strip(), tipo, inv.get("email", ""), semillero_id))
+                else:
+                    filas.append((str(inv).strip(), tipo, "", semillero_id))
+        return filas
+
+    @staticmethod
+    def _filas_objetivos(semillero, semillero_id):
+        return [(semillero_id, posicion, str(objetivo).strip())
+                for posicion, objetivo in enumerate(semillero.objetivos_especificos)]
+
+    @staticmethod
+    def _fila_semillero(semillero):
+        return (
+            semillero.nombre,
+            semillero.objetivo_principal,
+            semillero.grupo_id,
+            semillero.status
+        )
+
+    def _insertar_lote(self, lote, resultado):
+        """Inserta un lote validado en una transacción; si falla, registro por registro"""
+        try:
+            with self.db.transaction():
+                # Con AUTOINCREMENT y el bloqueo de escritura tomado, los IDs del
+                # lote son consecutivos a partir del último valor de sqlite_sequence
+                ultimo = self._ultimo_id()
+                self.db.execute_many(self.QUERY_SEMILLERO, [self._fila_semillero(s) for _, s in lote])
+                if self._ultimo_id() != ultimo + len(lote):
+                    raise RuntimeError("Los IDs asignados al lote no son consecutivos")
+
+                objetivos = []
+                investigadores = []
+                for posicion, (_, semillero) in enumerate(lote, 1):
+                    objetivos.extend(self._filas_objetivos(semillero, ultimo + posicion))
+                    investigadores.extend(self._filas_investigadores(semillero, ultimo + posicion))
+                self.db.execute_many(self.QUERY_OBJETIVO, objetivos)
+                self.db.execute_many(self.QUERY_INVESTIGADOR, investigadores)
+
+            resultado.importados += len(lote)
+        except (sqlite3.Error, RuntimeError):
+            # Aislar el registro que falla sin descartar el resto del lote
+            for numero, semillero in lote:
+                self._insertar_uno(numero, semillero, resultado)
+
+    def _insertar_uno(self, numero, semillero, resultado):
+        try:
+            with self.db.transaction():
+                semillero_id = self.db.execute_query(self.QUERY_SEMILLERO, self._fila_semillero(semillero))
+                self.db.execute_many(self.QUERY_OBJETIVO, self._filas_objetivos(semillero, semillero_id))
+                self.db.execute_many(self.QUERY_INVESTIGADOR, self._filas_investigadores(semillero, semillero_id))
+            resultado.importados += 1
+        except sqlite3.Error as e:
+            resultado.errores.append((numero, [f"Error de base de datos: {e}"]))
+
+    def _ultimo_id(self):
+        fila = self.db.execute_query(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'semilleros'", fetch='one'
+        )
+        return fila[0] if fila else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importa semilleros desde un archivo JSONL o CSV")
+    parser.add_argument("ruta", help="Archivo a importar")
+    parser.add_argument("--formato", choices=["jsonl", "csv"], help="Formato del archivo (por defecto según la extensión)")
+    parser.add_argument("--lote", type=int, default=1000, help="Semilleros por transacción")
+    parser.add_argument("--db", default="db/semilleros.db", help="Ruta de la base de datos")
+    args = parser.parse_args(argv)
+
+    from db.database import Database
+
+    db = Database(args.db)
+    importador = ImportadorSemilleros(db, tamano_lote=args.lote)
+    resultado = importador.importar(
+        args.ruta, args.formato,
+        progreso=lambda r: print(f"\r{r}", end="", flush=True)
+    )
+    db.cerrar()
+
+    print(f"\r{resultado}")
+    for numero, errores in resultado.errores[:50]:
+        print(f"- Registro {numero}: {'; '.join(errores)}")
+    if resultado.rechazados > 50:
+        print(f"... y {resultado.rechazados - 50} registros rechazados más")
+
+
+if __name__ == "__main__":
+    main()
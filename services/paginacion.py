@@ -0,0 +1,101 @@
+"""Utilidades para paginación por cursor (keyset pagination).
+
+En lugar de OFFSET, cada página continúa desde la clave de ordenamiento de
+la última fila de la página anterior, de modo que el costo de una página no
+depende de cuántas páginas haya antes. El cursor se entrega al cliente como
+una cadena opaca.
+"""
+import base64
+import json
+
+TAMANO_PAGINA_MAXIMO = 1000
+
+
+def codificar_cursor(valores):
+    """Codifica la clave de ordenamiento de la última fila como cursor opaco
+
+    Args:
+        valores (list): Valores de las columnas de ordenamiento
+
+    Returns:
+        str: Cursor en base64 apto para URLs
+    """
+    datos = json.dumps(list(valores), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(datos).decode("ascii")
+
+
+def decodificar_cursor(cursor, columnas):
+    """Decodifica un cursor generado por ``codificar_cursor``
+
+    Args:
+        cursor (str): Cursor recibido del cliente
+        columnas (int): Número de columnas de ordenamiento esperadas
+
+    Returns:
+        list: Valores de las columnas de ordenamiento
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        valores = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError("Cursor de paginación no válido")
+
+    if not isinstance(valores, list) or len(valores) != columnas:
+        raise ValueError("Cursor de paginación no válido")
+    # Solo valores que SQLite acepta como parámetro (un cursor alterado podría traer listas u objetos)
+    if not all(valor is None or isinstance(valor, (str, int, float)) for valor in valores):
+        raise ValueError("Cursor de paginación no válido")
+    return valores
+
+
+def validar_tamano(tamano):
+    """Verifica que el tamaño de página esté entre 1 y ``TAMANO_PAGINA_MAXIMO``"""
+    if not isinstance(tamano, int) or not 1 <= tamano <= TAMANO_PAGINA_MAXIMO:
+        raise ValueError(f"El tamaño de página debe estar entre 1 y {TAMANO_PAGINA_MAXIMO}")
+
+
+def paginar(db, query_base, orden, tamano, cursor, condicion=None, params=()):
+    """Ejecuta una consulta paginada por cursor
+
+    Args:
+        db (Database): Base de datos
+        query_base (str): SELECT ... FROM ... sin WHERE, ORDER BY ni LIMIT
+        orden (list): Pares (columna SQL, nombre en el resultado) que definen
+            el orden; el último debe ser único (el ID) para desempatar
+        tamano (int): Filas por página
+        cursor (str, optional): Cursor de la página anterior; None para la primera
+        condicion (str, optional): Filtro adicional para el WHERE
+        params (tuple): Parámetros de ``condicion``
+
+    Returns:
+        tuple: (filas, siguiente_cursor); siguiente_cursor es None en la última página
+    """
+    validar_tamano(tamano)
+    columnas = [columna for columna, _ in orden]
+    condiciones = [condicion] if condicion else []
+    params = list(params)
+
+    if cursor is not None:
+        valores = decodificar_cursor(cursor, len(columnas))
+        condiciones.append(f"({', '.join(columnas)}) > ({', '.join('?' * len(columnas))})")
+        params.extend(valores)
+
+    query = query_base
+    if condiciones:
+        query += " WHERE " + " AND ".join(condiciones)
+
+    # Se pide una fila extra para saber si hay página siguiente
+    query += f" ORDER BY {', '.join(columnas)} LIMIT ?"
+    params.append(tamano + 1)
+
+    filas = db.execute_query(query, tuple(params), fetch='all')
+
+    siguiente = None
+    if len(filas) > tamano:
+        filas = filas[:tamano]
+        ultima = filas[-1]
+        siguiente = codificar_cursor([ultima[nombre] for _, nombre in orden])
+
+    return filas, siguiente
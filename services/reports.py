@@ -0,0 +1,243 @@
+"""Reportes institucionales calculados con consultas SQL agregadas.
+
+Cada reporte es una sola consulta que SQLite resuelve apoyándose en los
+índices existentes; Python solo recibe las filas ya agregadas. Los conteos
+por grupo, tipo y semillero se leen de las tablas de resumen que mantienen
+los triggers (ver ``services.resumenes``). Los resultados se guardan en una
+caché con vigencia limitada y pueden escribirse con los mismos formatos que
+la exportación.
+
+Reportes disponibles (ver ``REPORTES``):
+
+- ``semilleros_por_grupo``: semilleros por grupo y estado
+- ``entregables_por_tipo``: entregables por tipo y estado
+- ``investigadores_por_semillero``: estudiantes y tutores de cada semillero
+- ``carga_tutores``: semilleros, estudiantes y entregables pendientes por tutor
+
+Uso desde la línea de comandos::
+
+    python -m services.reports carga_tutores [--salida reporte.csv] [--formato csv|jsonl] [--tiempo-maximo 5]
+"""
+import argparse
+import sqlite3
+from datetime import datetime, timezone
+
+from db.database import Database
+from services.cache import CacheTTL
+from services.exportacion import ESCRITORES
+
+# nombre -> (descripción, consulta)
+REPORTES = {
+    "semilleros_por_grupo": (
+        "Semilleros por grupo de investigación y estado",
+        """
+        SELECT NULLIF(r.grupo_id, 0) AS grupo_id, COALESCE(g.nombre, 'Sin grupo') AS grupo,
+               NULLIF(r.status, '') AS estado, r.cantidad AS semilleros
+        FROM resumen_semilleros r
+        LEFT JOIN grupos_investigacion g ON g.id = r.grupo_id
+        ORDER BY grupo, estado
+        """,
+    ),
+    "entregables_por_tipo": (
+        "Entregables por tipo y estado",
+        """
+        SELECT NULLIF(r.tipo, '') AS tipo, NULLIF(r.estado, '') AS estado, r.cantidad AS entregables
+        FROM resumen_entregables r
+        ORDER BY r.tipo, r.estado
+        """,
+    ),
+    "investigadores_por_semillero": (
+        "Estudiantes y tutores de cada semillero",
+        """
+        SELECT s.semillero_id, s.nombre AS semillero,
+               IFNULL(e.cantidad, 0) AS estudiantes,
+               IFNULL(t.cantidad, 0) AS tutores,
+               IFNULL(e.cantidad, 0) + IFNULL(t.cantidad, 0) AS total
+        FROM semilleros s
+        LEFT JOIN resumen_investigadores e ON e.semillero_id = s.semillero_id AND e.tipo = 'estudiante'
+        LEFT JOIN resumen_investigadores t ON t.semillero_id = s.semillero_id AND t.tipo = 'tutor'
+        ORDER BY s.nombre, s.semillero_id
+        """,
+    ),
+    "carga_tutores": (
+        "Semilleros, estudiantes y entregables pendientes a cargo de cada tutor",
+        # Un mismo tutor aparece una vez por semillero en investigadores;
+        # se identifica por nombre sin distinguir mayúsculas
+        """
+        WITH tutores AS (
+            SELECT DISTINCT nombre COLLATE NOCASE AS tutor, semillero_id
+            FROM investigadores
+            WHERE tipo = 'tutor'
+        ),
+        estudiantes AS (
+            SELECT semillero_id, COUNT(*) AS cantidad
+            FROM investigadores
+            WHERE tipo = 'estudiante'
+            GROUP BY semillero_id
+        ),
+        pendientes AS (
+            SELECT semillero_id, COUNT(*) AS cantidad
+            FROM entregables
+            WHERE estado = 'pendiente'
+            GROUP BY semillero_id
+        )
+        SELECT t.tutor,
+               COUNT(*) AS semilleros,
+               COALESCE(SUM(e.cantidad), 0) AS estudiantes,
+               COALESCE(SUM(p.cantidad), 0) AS entregables_pendientes
+        FROM tutores t
+        LEFT JOIN estudiantes e ON e.semillero_id = t.semillero_id
+        LEFT JOIN pendientes p ON p.semillero_id = t.semillero_id
+        GROUP BY t.tutor
+        ORDER BY semilleros DESC, estudiantes DESC, t.tutor
+        """,
+    ),
+}
+
+
+class Reporte:
+    """Resultado de un reporte: columnas y filas ya agregadas
+
+    Los reportes en caché se comparten entre llamadas; por eso las filas
+    son tuplas y el objeto no debe modificarse.
+    """
+
+    __slots__ = ("nombre", "descripcion", "columnas", "filas", "generado_en")
+
+    def __init__(self, nombre, descripcion, columnas, filas, generado_en):
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.columnas = tuple(columnas)
+        self.filas = tuple(filas)
+        self.generado_en = generado_en  # UTC, "YYYY-MM-DD HH:MM:SS"
+
+    def __len__(self):
+        return len(self.filas)
+
+    def como_diccionarios(self):
+        """Retorna las filas como diccionarios columna -> valor"""
+        return [dict(zip(self.columnas, fila)) for fila in self.filas]
+
+    def __str__(self):
+        anchos = [
+            max([len(str(columna))] + [len(str(fila[posicion])) for fila in self.filas])
+            for posicion, columna in enumerate(self.columnas)
+        ]
+        lineas = [
+            "  ".join(str(columna).ljust(ancho) for columna, ancho in zip(self.columnas, anchos)),
+            "  ".join("-" * ancho for ancho in anchos),
+        ]
+        lineas.extend(
+            "  ".join(str(valor).ljust(ancho) for valor, ancho in zip(fila, anchos))
+            for fila in self.filas
+        )
+        return "\n".join(lineas)
+
+
+class ReporteService:
+    """Genera los reportes institucionales
+
+    Los reportes se guardan en caché durante ``cache_ttl`` segundos: las
+    cifras pueden quedar así de desactualizadas, a cambio de no recalcular
+    las agregaciones en cada consulta. ``tiempo_maximo`` interrumpe las
+    consultas que tarden demasiado en bases de datos grandes.
+    """
+
+    def __init__(self, database=None, cache_ttl=60, tiempo_maximo=None):
+        """
+        Args:
+            database (Database, optional): Base de datos; por defecto la del proyecto
+            cache_ttl (float, optional): Segundos de vigencia de cada reporte; None = sin expiración
+            tiempo_maximo (float, optional): Segundos máximos por consulta; None = sin límite
+        """
+        self.db = database or Database()
+        self.tiempo_maximo = tiempo_maximo
+        self._cache = CacheTTL(ttl=cache_ttl)
+
+    def disponibles(self):
+        """Retorna los reportes disponibles como {nombre: descripción}"""
+        return {nombre: descripcion for nombre, (descripcion, _) in REPORTES.items()}
+
+    def invalidar_cache(self, nombre=None):
+        """Descarta un reporte en caché, o todos si no se indica nombre"""
+        self._cache.invalidar(nombre)
+
+    def generar(self, nombre, usar_cache=True, tiempo_maximo=None):
+        """Genera un reporte
+
+        Args:
+            nombre (str): Nombre del reporte (ver ``REPORTES``)
+            usar_cache (bool): Reutilizar el último resultado si sigue vigente
+            tiempo_maximo (float, optional): Límite en segundos solo para esta llamada
+
+        Returns:
+            Reporte: Columnas y filas del reporte
+
+        Raises:
+            ValueError: Si el reporte no existe
+            TimeoutError: Si la consulta supera el tiempo máximo
+        """
+        if nombre not in REPORTES:
+            raise ValueError(f"Reporte no válido: {nombre}. Debe ser uno de: {', '.join(REPORTES)}")
+
+        limite = tiempo_maximo if tiempo_maximo is not None else self.tiempo_maximo
+        if not usar_cache:
+            reporte = self._calcular(nombre, limite)
+            self._cache.guardar(nombre, reporte)
+            return reporte
+        return self._cache.obtener(nombre, lambda: self._calcular(nombre, limite))
+
+    def _calcular(self, nombre, tiempo_maximo):
+        descripcion, query = REPORTES[nombre]
+        generado_en = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        columnas, filas = self.db.execute_query(query, fetch='tuplas', tiempo_maximo=tiempo_maximo)
+        return Reporte(nombre, descripcion, columnas, filas, generado_en)
+
+    def exportar(self, nombre, ruta, formato="csv", usar_cache=True):
+        """Genera un reporte y lo escribe en un archivo
+
+        Args:
+            nombre (str): Nombre del reporte
+            ruta (str): Archivo de destino
+            formato (str): 'csv', 'jsonl' o 'columnar'
+            usar_cache (bool): Reutilizar el último resultado si sigue vigente
+
+        Returns:
+            Reporte: El reporte escrito
+        """
+        if formato not in ESCRITORES:
+            raise ValueError(f"Formato no soportado: {formato}. Debe ser uno de: {', '.join(ESCRITORES)}")
+
+        reporte = self.generar(nombre, usar_cache=usar_cache)
+        with ESCRITORES[formato](ruta) as salida:
+            salida.escribir(list(reporte.columnas), list(reporte.filas))
+        return reporte
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera reportes de semilleros")
+    parser.add_argument("reporte", choices=list(REPORTES))
+    parser.add_argument("--salida", help="Archivo de destino; por defecto se muestra en pantalla")
+    parser.add_argument("--formato", choices=list(ESCRITORES), default="csv")
+    parser.add_argument("--tiempo-maximo", type=float, help="Segundos máximos de la consulta")
+    parser.add_argument("--db", default="db/semilleros.db", help="Ruta de la base de datos")
+    args = parser.parse_args(argv)
+
+    db = Database(args.db)
+    service = ReporteService(db, tiempo_maximo=args.tiempo_maximo)
+    try:
+        if args.salida:
+            reporte = service.exportar(args.reporte, args.salida, args.formato)
+            print(f"{reporte.descripcion}: {len(reporte)} filas escritas en {args.salida}")
+        else:
+            reporte = service.generar(args.reporte)
+            print(reporte.descripcion)
+            print(reporte)
+    except (TimeoutError, sqlite3.Error) as e:
+        print(f"Error al generar el reporte: {e}")
+    finally:
+        db.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Contadores leídos de las tablas de resumen mantenidas por triggers.
+
+Las tablas ``resumen_*`` (ver ``db.esquema.RESUMENES``) guardan cuántas
+filas de la tabla de origen hay por cada combinación de claves, por
+ejemplo semilleros por grupo y estado. Los triggers las actualizan en cada
+inserción, borrado o cambio de clave, así que un contador se lee con una
+búsqueda por clave primaria en lugar de un recorrido de la tabla.
+
+Si los resúmenes llegan a desviarse (p. ej. por escrituras hechas con los
+triggers desactivados o con otra versión del esquema), ``verificar`` los
+compara con un conteo completo y ``reconstruir`` los recalcula.
+
+Uso desde la línea de comandos::
+
+    python -m services.resumenes verificar [--reparar]
+    python -m services.resumenes reconstruir
+"""
+import argparse
+
+from db.database import Database
+from db.esquema import RESUMENES, sql_conteo_resumen
+
+
+class ResumenService:
+    """Consulta, verifica y reconstruye las tablas de resumen"""
+
+    def __init__(self, database=None):
+        self.db = database or Database()
+
+    @staticmethod
+    def _claves(resumen):
+        if resumen not in RESUMENES:
+            raise ValueError(f"Resumen no válido: {resumen}. Debe ser uno de: {', '.join(RESUMENES)}")
+        return [columna for columna, _, _ in RESUMENES[resumen][1]]
+
+    def contar(self, resumen, **filtros):
+        """Retorna el número de filas de origen que cumplen los filtros
+
+        Ejemplo::
+
+            service.contar("resumen_semilleros", grupo_id=1, status="activo")
+            service.contar("resumen_entregables", estado="pendiente")
+
+        Args:
+            resumen (str): Nombre de la tabla de resumen
+            **filtros: Valores de las claves del resumen; las omitidas se suman.
+                Las filas con la clave en NULL se cuentan con 0 o '' (ver ``RESUMENES``)
+
+        Returns:
+            int: Cantidad de filas
+        """
+        claves = self._claves(resumen)
+        desconocidas = set(filtros) - set(claves)
+        if desconocidas:
+            raise ValueError(f"Claves no válidas para {resumen}: {', '.join(sorted(desconocidas))}")
+
+        # Los filtros se aplican en el orden de la clave primaria para aprovecharla
+        condiciones = [f"{columna} = ?" for columna in claves if columna in filtros]
+        params = tuple(filtros[columna] for columna in claves if columna in filtros)
+        query = f"SELECT TOTAL(cantidad) FROM {resumen}"
+        if condiciones:
+            query += " WHERE " + " AND ".join(condiciones)
+        return int(self.db.execute_query(query, params, fetch='one')[0])
+
+    def conteos(self, resumen):
+        """Retorna todos los contadores de un resumen
+
+        Returns:
+            dict: tupla de valores de las claves -> cantidad
+        """
+        claves = self._claves(resumen)
+        _, filas = self.db.execute_query(
+            f"SELECT {', '.join(claves)}, cantidad FROM {resumen}", fetch='tuplas'
+        )
+        return {fila[:-1]: fila[-1] for fila in filas}
+
+    def verificar(self, resumenes=None):
+        """Compara los resúmenes con un conteo completo de las tablas de origen
+
+        Args:
+            resumenes (list, optional): Subconjunto de ``RESUMENES``; por defecto todos
+
+        Returns:
+            dict: resumen -> lista de (claves, cantidad esperada, cantidad registrada)
+            con las diferencias encontradas; vacía si el resumen está al día
+        """
+        diferencias = {}
+        for resumen in resumenes or RESUMENES:
+            self._claves(resumen)
+            _, filas = self.db.execute_query(sql_conteo_resumen(resumen), fetch='tuplas')
+            esperados = {fila[:-1]: fila[-1] for fila in filas}
+            registrados = self.conteos(resumen)
+
+            diferencias[resumen] = [
+                (claves, esperados.get(claves, 0), registrados.get(claves, 0))
+                for claves in sorted(esperados.keys() | registrados.keys(), key=repr)
+                if esperados.get(claves, 0) != registrados.get(claves, 0)
+            ]
+        return diferencias
+
+    def reconstruir(self, resumenes=None):
+        """Recalcula los resúmenes desde las tablas de origen
+
+        Cada resumen se vacía y se vuelve a llenar en una transacción, de modo
+        que los lectores nunca ven un resumen a medio reconstruir.
+
+        Args:
+            resumenes (list, optional): Subconjunto de ``RESUMENES``; por defecto todos
+
+        Returns:
+            dict: resumen -> número de filas del resumen reconstruido
+        """
+        filas = {}
+        for resumen in resumenes or RESUMENES:
+            self._claves(resumen)
+            with self.db.transaction():
+                self.db.execute_query(f"DELETE FROM {resumen}")
+                filas[resumen] = self.db.execute_query(
+                    f"INSERT INTO {resumen} {sql_conteo_resumen(resumen)}", fetch='rowcount'
+                )
+        return filas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifica o reconstruye las tablas de resumen")
+    parser.add_argument("accion", choices=["verificar", "reconstruir"])
+    parser.add_argument("--reparar", action="store_true", help="Reconstruir los resúmenes con diferencias")
+    parser.add_argument("--db", default="db/semilleros.db", help="Ruta de la base de datos")
+    args = parser.parse_args(argv)
+
+    db = Database(args.db)
+    service = ResumenService(db)
+
+    if args.accion == "reconstruir":
+        for resumen, filas in service.reconstruir().items():
+            print(f"{resumen}: reconstruido ({filas} filas)")
+    else:
+        desviados = []
+        for resumen, diferencias in service.verificar().items():
+            if not diferencias:
+                print(f"{resumen}: correcto")
+                continue
+            desviados.append(resumen)
+            print(f"{resumen}: {len(diferencias)} diferencias")
+            for claves, esperado, registrado in diferencias:
+                print(f"  {claves}: esperado {esperado}, registrado {registrado}")
+
+        if desviados and args.reparar:
+            service.reconstruir(desviados)
+            print(f"Reconstruidos: {', '.join(desviados)}")
+
+    db.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,35 @@
-import json
+import weakref
+from datetime import date, datetime
+
+from db.mapeo import compilar, mapear, normalizar_campos
 from models.semillero import Semillero
 from models.investigador import Investigador
+from services.busqueda import buscar
+from services.paginacion import paginar
+from services.trazas import rastreable
 
 
+@rastreable(internos=(
+    "_guardar_objetivos", "_guardar_investigadores", "_completar", "_cargar_objetivos_lote",
+    "_cargar_investigadores_lote",
+))
 class SemilleroService:
     """Lógica de negocio para semilleros de investigación"""
 
+    # Máximo de IDs por consulta IN al cargar relaciones en lote
+    TAMANO_LOTE_IN = 500
+
+    # Columnas cuyo nombre difiere del atributo del modelo
+    CAMPOS = {"semillero_id": "id"}
+
+    # Criterios de orden de ``filtrar`` -> columna SQL (el ID desempata)
+    ORDENES = {
+        "nombre": "s.nombre",
+        "estado": "s.status",
+        "creado_en": "s.creado_en",
+        "actualizado_en": "s.actualizado_en",
+    }
+
     def __init__(self, database):
         self.db = database
 
@@ -26,32 +50,47 @@ class SemilleroService:
         # Insertar el semillero en la base de datos
         query = """
             INSERT INTO semilleros 
-            (nombre, objetivo_principal, objetivos_especificos, grupo_id, status) 
-            VALUES (?, ?, ?, ?, ?)
+            (nombre, objetivo_principal, grupo_id, status) 
+            VALUES (?, ?, ?, ?)
         """
 
-        # Convertir lista de objetivos a JSON para almacenar
-        objetivos_json = json.dumps(semillero.objetivos_especificos)
-
         params = (
             semillero.nombre,
             semillero.objetivo_principal,
-            objetivos_json,
             semillero.grupo_id,
             semillero.status
         )
 
-        semillero_id = self.db.execute_query(query, params)
+        # El semillero y sus investigadores se guardan en una sola transacción:
+        # o se crea completo o no se crea nada
+        with self.db.transaction():
+            semillero_id = self.db.execute_query(query, params)
 
-        # Si se creó correctamente, añadir los investigadores
-        if semillero_id:
-            self._guardar_investigadores(semillero_id, semillero.estudiantes, "estudiante")
-            self._guardar_investigadores(semillero_id, semillero.tutores, "tutor")
+            # Si se creó correctamente, añadir los objetivos y los investigadores
+            if semillero_id:
+                self._guardar_objetivos(semillero_id, semillero.objetivos_especificos)
+                self._guardar_investigadores(semillero_id, semillero.estudiantes, "estudiante")
+                self._guardar_investigadores(semillero_id, semillero.tutores, "tutor")
 
+        if semillero_id:
             return semillero_id, []
 
         return None, ["Error al crear el semillero en la base de datos"]
 
+    def _guardar_objetivos(self, semillero_id, objetivos):
+        """Guarda los objetivos específicos de un semillero conservando su orden
+
+        Args:
+            semillero_id (int): ID del semillero
+            objetivos (list): Lista de objetivos específicos
+        """
+        params_list = [(semillero_id, posicion, objetivo) for posicion, objetivo in enumerate(objetivos)]
+        if params_list:
+            self.db.execute_many(
+                "INSERT INTO semillero_objetivos (semillero_id, posicion, objetivo) VALUES (?, ?, ?)",
+                params_list
+            )
+
     def _guardar_investigadores(self, semillero_id, investigadores, tipo):
         """Guarda los investigadores asociados a un semillero
 
@@ -109,14 +148,10 @@ class SemilleroService:
 
         Retorna True si se actualizó al menos una fila, False en caso contrario.
         """
-        # Convertir la lista de objetivos a JSON
-        objetivos_json = json.dumps(objetivos_especificos)
-
         query = """
             UPDATE semilleros
             SET nombre = ?,
                 objetivo_principal = ?,
-                objetivos_especificos = ?,
                 grupo_id = ?,
                 status = ?
             WHERE semillero_id = ?;
@@ -124,13 +159,18 @@ class SemilleroService:
         params = (
             nombre,
             objetivo_principal,
-            objetivos_json,
             grupo_id,
             status,
             semillero_id
         )
         try:
-            filas_afectadas = self.db.execute_query(query, params)
+            with self.db.transaction():
+                filas_afectadas = self.db.execute_query(query, params, fetch='rowcount')
+                if filas_afectadas > 0:
+                    self.db.execute_query(
+                        "DELETE FROM semillero_objetivos WHERE semillero_id = ?", (semillero_id,)
+                    )
+                    self._guardar_objetivos(semillero_id, objetivos_especificos)
             return (filas_afectadas > 0)
         except Exception as e:
             print(f"Error al editar el semillero: {e}")
@@ -140,7 +180,8 @@ class SemilleroService:
     def eliminar_semillero(self, semillero_id):
         """
         Borra de la base de datos el semillero cuyo semillero_id fue pasado como parámetro.
-        Primero elimina investigadores asociados, luego el semillero en sí.
+        Primero elimina sus objetivos e investigadores, luego el semillero en sí, todo
+        dentro de una misma transacción.
 
         Args:
             semillero_id (int): ID del semillero a eliminar.
@@ -148,156 +189,187 @@ class SemilleroService:
         Returns:
             bool: True si se borró el semillero (al menos una fila afectada), False en caso contrario.
         """
-        # 1) Eliminar TODOS los investigadores cuyo semillero_id coincide:
+        query_objetivos = """
+            DELETE FROM semillero_objetivos
+            WHERE semillero_id = ?
+        """
         query_investigadores = """
             DELETE FROM investigadores
             WHERE semillero_id = ?
         """
-        try:
-            # Ejecutamos el delete; asumimos que execute_query devuelve cursor o rowcount
-            self.db.execute_query(query_investigadores, (semillero_id,))
-        except Exception as e:
-            # Podrías loguear e ignorar (porque tal vez no haya investigadores asociados) o propagar el error
-            # Por simplicidad, lo imprimimos y seguimos
-            print(f"Advertencia al eliminar investigadores asociados: {e}")
-
-        # 2) Ahora eliminamos el semillero:
         query_semillero = """
             DELETE FROM semilleros
             WHERE semillero_id = ?
         """
+        # Los borrados forman una unidad atómica: si el semillero no se puede
+        # eliminar (por ejemplo, tiene un entregable asociado) sus objetivos e
+        # investigadores se conservan
         try:
-            resultado = self.db.execute_query(query_semillero, (semillero_id,))
-            # Dependiendo de tu implementación de execute_query:
-            # - Si retorna rowcount: usar `return resultado > 0`
-            # - Si retorna None pero ejecuta commit, hacemos luego un SELECT para revisar
-            if isinstance(resultado, int):
-                return (resultado > 0)
-            else:
-                # Si tu execute_query no devuelve rowcount, puedes ejecutar:
-                # cursor = self.db.execute_query(query_semillero, (semillero_id,))
-                # return cursor.rowcount > 0
-                return True
+            with self.db.transaction():
+                self.db.execute_query(query_objetivos, (semillero_id,))
+                self.db.execute_query(query_investigadores, (semillero_id,))
+                resultado = self.db.execute_query(query_semillero, (semillero_id,), fetch='rowcount')
+            return (resultado > 0)
         except Exception as e:
             print(f"Error al eliminar el semillero: {e}")
             return False
 
-    def obtener_todos(self):
+    def obtener_todos(self, prefetch=None):
         """Obtiene todos los semilleros de investigación
 
+            Args:
+                prefetch (iterable, optional): Relaciones a cargar de inmediato
+                    ('objetivos', 'investigadores'); las demás se cargan al primer acceso
+
             Returns:
                 list: Lista de objetos Semillero
             """
-        # Primero verificamos la estructura de la tabla
-        query_estructura = """
-                PRAGMA table_info(semilleros)
-            """
-        estructura = self.db.execute_query(query_estructura, fetch='all')
-
-        # Basado en la estructura, ajustamos la consulta
-        # Suponiendo que la columna se llama 'objetivos' en lugar de 'objetivos_especificos'
         query = """
-                SELECT s.semillero_id, s.nombre, s.objetivo_principal, s.objetivos_especificos, 
+                SELECT s.semillero_id, s.nombre, s.objetivo_principal,
                 s.grupo_id, g.nombre as grupo_nombre, s.status
                 FROM semilleros s
                 LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
                 ORDER BY s.nombre
             """
 
-        resultados = self.db.execute_query(query, fetch='all')
+        semilleros = self.db.consultar_modelos(query, clase=Semillero, campos=self.CAMPOS)
 
-        semilleros = []
-        for row in resultados:
-            # Convertir el JSON a lista (ajustamos el nombre de la columna)
-            objetivos = json.loads(row['objetivos_especificos'])
+        # Los objetivos e investigadores de todos los semilleros se cargan en
+        # lote, ahora o en el primer acceso a cualquiera de ellos
+        self._completar(semilleros, prefetch)
 
-            semillero = Semillero(
-                id=row['semillero_id'],
-                nombre=row['nombre'],
-                objetivo_principal=row['objetivo_principal'],
-                objetivos_especificos=objetivos,  # Mantenemos el nombre del atributo del objeto
-                grupo_id=row['grupo_id'],
-                status=row['status']
-            )
+        return semilleros
 
-            semillero.grupo_nombre = row['grupo_nombre']
+    def iter_todos(self, tamano_lote=500, prefetch=None):
+        """Recorre todos los semilleros sin cargarlos todos en memoria
 
-            # Cargar investigadores asociados
-            self._cargar_investigadores(semillero)
+        Las filas se leen del cursor en bloques de ``tamano_lote`` y las
+        relaciones se cargan por bloque (una consulta por bloque y relación),
+        de modo que la memoria usada no depende del tamaño de la tabla.
+        Mientras dura el recorrido se usan dos conexiones del pool.
 
-            semilleros.append(semillero)
+        Args:
+            tamano_lote (int): Semilleros leídos y completados por bloque
+            prefetch (iterable, optional): Relaciones a cargar de inmediato
+                ('objetivos', 'investigadores'); las demás se cargan al primer acceso
 
-        return semilleros
+        Yields:
+            Semillero: Semilleros ordenados por nombre
+        """
+        query = """
+            SELECT s.semillero_id, s.nombre, s.objetivo_principal,
+                   s.grupo_id, g.nombre as grupo_nombre, s.status
+            FROM semilleros s
+            LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+            ORDER BY s.nombre, s.semillero_id
+        """
+        filas = self.db.execute_query(query, fetch='iter', tamano_lote=tamano_lote)
 
-    def obtener_por_id(self, semillero_id):
-        """Obtiene un semillero por su ID
+        mapeador = None
+        lote = []
+        for row in filas:
+            if mapeador is None:
+                mapeador = compilar(Semillero, tuple(row.keys()), normalizar_campos(self.CAMPOS))
+            lote.append(mapeador.uno(row))
+            if len(lote) >= tamano_lote:
+                self._completar(lote, prefetch)
+                yield from lote
+                lote = []
+
+        if lote:
+            self._completar(lote, prefetch)
+            yield from lote
+
+    def obtener_pagina(self, tamano=50, cursor=None, prefetch=None):
+        """Obtiene una página de semilleros ordenados por nombre
+
+        Usa paginación por cursor: el costo de cada página es el mismo sin
+        importar cuántas haya antes, y solo se mantiene una página en memoria.
 
         Args:
-            semillero_id (int): ID del semillero
+            tamano (int): Número de semilleros por página
+            cursor (str, optional): Cursor retornado por la página anterior
+            prefetch (iterable, optional): Relaciones a cargar de inmediato
+                ('objetivos', 'investigadores'); las demás se cargan al primer acceso
 
         Returns:
-            Semillero: Objeto Semillero o None si no existe
+            tuple: (lista de Semillero, cursor de la siguiente página o None)
         """
         query = """
-            SELECT s.semillero_id, s.nombre, s.objetivo_principal, s.objetivos_especificos, 
-                   s.grupo_id, s.status, g.nombre as grupo_nombre
+            SELECT s.semillero_id, s.nombre, s.objetivo_principal,
+                   s.grupo_id, g.nombre as grupo_nombre, s.status
             FROM semilleros s
-            JOIN grupos_investigacion g ON s.grupo_id = g.id
-            WHERE s.semillero_id = ?
+            LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
         """
+        orden = [("s.nombre", "nombre"), ("s.semillero_id", "semillero_id")]
+        filas, siguiente = paginar(self.db, query, orden, tamano, cursor)
 
-        row = self.db.execute_query(query, (semillero_id,), fetch='one')
+        semilleros = mapear(filas, Semillero, self.CAMPOS)
+        self._completar(semilleros, prefetch)
 
-        if not row:
-            return None
+        return semilleros, siguiente
 
-        # Convertir el JSON a lista
-        objetivos = json.loads(row['objetivos_especificos'])
+    def buscar(self, texto, tamano=20, pagina=1, prefetch=None):
+        """Busca semilleros por nombre, objetivo principal y objetivos específicos
 
-        semillero = Semillero(
-            id=row['id'],
-            nombre=row['nombre'],
-            objetivo_principal=row['objetivo_principal'],
-            objetivos_especificos=objetivos,
-            grupo_id=row['grupo_id'],
-            status=row['status']
-        )
+        Usa el índice de texto completo ``semilleros_fts``: los resultados se
+        ordenan por relevancia, cada palabra se busca como prefijo y no se
+        distinguen mayúsculas ni tildes.
 
-        semillero.grupo_nombre = row['grupo_nombre']
+        Args:
+            texto (str): Texto a buscar
+            tamano (int): Resultados por página
+            pagina (int): Número de página, empezando en 1
+            prefetch (iterable, optional): Relaciones a cargar de inmediato
+                ('objetivos', 'investigadores'); las demás se cargan al primer acceso
 
-        # Cargar investigadores asociados
-        self._cargar_investigadores(semillero)
+        Returns:
+            tuple: (lista de Semillero, número de la siguiente página o None)
+        """
+        query = """
+            SELECT s.semillero_id, s.nombre, s.objetivo_principal,
+                   s.grupo_id, g.nombre as grupo_nombre, s.status
+            FROM semilleros_fts f
+            JOIN semilleros s ON s.semillero_id = f.rowid
+            LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+            WHERE semilleros_fts MATCH ?
+            ORDER BY f.rank
+        """
+        filas, siguiente = buscar(self.db, query, texto, tamano, pagina)
 
-        return semillero
+        semilleros = mapear(filas, Semillero, self.CAMPOS)
+        self._completar(semilleros, prefetch)
 
-    def _cargar_investigadores(self, semillero):
-        """Carga los investigadores asociados a un semillero
+        return semilleros, siguiente
+
+    def obtener_por_id(self, semillero_id, prefetch=None):
+        """Obtiene un semillero por su ID
 
         Args:
-            semillero (Semillero): Objeto Semillero al que cargar los investigadores
+            semillero_id (int): ID del semillero
+            prefetch (iterable, optional): Relaciones a cargar de inmediato
+                ('objetivos', 'investigadores'); las demás se cargan al primer acceso
+
+        Returns:
+            Semillero: Objeto Semillero o None si no existe
         """
         query = """
-            SELECT id, nombre, tipo, email
-            FROM investigadores
-            WHERE semillero_id = ?
-            ORDER BY tipo, nombre
+            SELECT s.semillero_id, s.nombre, s.objetivo_principal,
+                   s.grupo_id, s.status, g.nombre as grupo_nombre
+            FROM semilleros s
+            JOIN grupos_investigacion g ON s.grupo_id = g.id
+            WHERE s.semillero_id = ?
         """
 
-        resultados = self.db.execute_query(query, (semillero.id,), fetch='all')
+        semillero = self.db.consultar_modelos(query, (semillero_id,), Semillero, self.CAMPOS, uno=True)
 
-        for row in resultados:
-            investigador = Investigador(
-                id=row['id'],
-                nombre=row['nombre'],
-                tipo=row['tipo'],
-                email=row['email'],
-                semillero_id=semillero.id
-            )
+        if not semillero:
+            return None
 
-            if row['tipo'] == 'estudiante':
-                semillero.estudiantes.append(investigador)
-            elif row['tipo'] == 'tutor':
-                semillero.tutores.append(investigador)
+        # Cargar objetivos e investigadores asociados
+        self._completar([semillero], prefetch)
+
+        return semillero
 
     def cambiar_status(self, semillero_id, nuevo_status):
         """Cambia el estado de un semillero
@@ -309,25 +381,27 @@ class SemilleroService:
         Returns:
             bool: True si se cambió correctamente, False en caso contrario
         """
-        if nuevo_status not in ['activo', 'pendiente']:
+        if nuevo_status not in Semillero.ESTADOS:
             return False
 
-        query = "UPDATE semilleros SET status = ? WHERE id = ?"
+        query = "UPDATE semilleros SET status = ? WHERE semillero_id = ?"
         self.db.execute_query(query, (nuevo_status, semillero_id))
 
         return True
 
-    def obtener_por_grupo(self, grupo_id):
+    def obtener_por_grupo(self, grupo_id, prefetch=None):
         """Obtiene los semilleros asociados a un grupo de investigación
 
         Args:
             grupo_id (int): ID del grupo de investigación
+            prefetch (iterable, optional): Relaciones a cargar de inmediato
+                ('objetivos', 'investigadores'); las demás se cargan al primer acceso
 
         Returns:
             list: Lista de objetos Semillero
         """
         query = """
-            SELECT s.id, s.nombre, s.objetivo_principal, s.objetivos_especificos, 
+            SELECT s.semillero_id, s.nombre, s.objetivo_principal,
                    s.grupo_id, s.status, g.nombre as grupo_nombre
             FROM semilleros s
             JOIN grupos_investigacion g ON s.grupo_id = g.id
@@ -335,26 +409,269 @@ class SemilleroService:
             ORDER BY s.nombre
         """
 
-        resultados = self.db.execute_query(query, (grupo_id,), fetch='all')
+        semilleros = self.db.consultar_modelos(query, (grupo_id,), Semillero, self.CAMPOS)
+        self._completar(semilleros, prefetch)
 
-        semilleros = []
-        for row in resultados:
-            # Convertir el JSON a lista
-            objetivos = json.loads(row['objetivos_especificos'])
+        return semilleros
+
+    def obtener_por_objetivo(self, objetivo, prefetch=None):
+        """Obtiene los semilleros que tienen un objetivo específico dado
+
+        La comparación es exacta salvo mayúsculas/minúsculas y usa el índice
+        sobre ``semillero_objetivos.objetivo``.
+
+        Args:
+            objetivo (str): Objetivo específico a buscar
+            prefetch (iterable, optional): Relaciones a cargar de inmediato
+                ('objetivos', 'investigadores'); las demás se cargan al primer acceso
 
-            semillero = Semillero(
-                id=row['id'],
-                nombre=row['nombre'],
-                objetivo_principal=row['objetivo_principal'],
-                objetivos_especificos=objetivos,
-                grupo_id=row['grupo_id'],
-                status=row['status']
+        Returns:
+            list: Lista de objetos Semillero ordenados por nombre
+        """
+        query = """
+            SELECT s.semillero_id, s.nombre, s.objetivo_principal,
+                   s.grupo_id, s.status, g.nombre as grupo_nombre
+            FROM semilleros s
+            LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+            WHERE s.semillero_id IN (
+                SELECT semillero_id FROM semillero_objetivos WHERE objetivo = ?
             )
+            ORDER BY s.nombre
+        """
 
-            semillero.grupo_nombre = row['grupo_nombre']
-            semilleros.append(semillero)
+        semilleros = self.db.consultar_modelos(query, (objetivo.strip(),), Semillero, self.CAMPOS)
+        self._completar(semilleros, prefetch)
 
         return semilleros
-    
 
-    
\ No newline at end of file
+    def filtrar(self, status=None, grupo_id=None, tutor=None, objetivo=None, creado_desde=None,
+                creado_hasta=None, orden="nombre", descendente=False, limite=None, prefetch=None):
+        """Obtiene los semilleros que cumplen todos los filtros indicados
+
+        Los filtros y el orden se resuelven en SQL: cada filtro tiene un índice
+        (parcial en el caso del estado y del tutor), de modo que, por ejemplo,
+        los semilleros pendientes de un grupo se leen directamente del índice
+        sin recorrer el resto.
+
+        Ejemplo::
+
+            service.filtrar(status="pendiente", grupo_id=3)
+            service.filtrar(tutor="Dra. Rojas", orden="creado_en", descendente=True, limite=10)
+
+        Args:
+            status (str | list, optional): Estado o lista de estados (ver ``Semillero.ESTADOS``)
+            grupo_id (int, optional): ID del grupo de investigación
+            tutor (str, optional): Nombre de un tutor (exacto, sin distinguir mayúsculas)
+            objetivo (str, optional): Objetivo específico (exacto, sin distinguir mayúsculas)
+            creado_desde (str | date | datetime, optional): Creados en esta fecha o después (UTC)
+            creado_hasta (str | date | datetime, optional): Creados antes de esta fecha (UTC)
+            orden (str): Criterio de ``ORDENES``
+            descendente (bool): Invertir el orden
+            limite (int, optional): Número máximo de semilleros
+            prefetch (iterable, optional): Relaciones a cargar de inmediato
+                ('objetivos', 'investigadores'); las demás se cargan al primer acceso
+
+        Returns:
+            list: Lista de objetos Semillero
+
+        Raises:
+            ValueError: Si el estado o el orden no son válidos
+        """
+        if orden not in self.ORDENES:
+            raise ValueError(f"Orden no válido: {orden}. Debe ser uno de: {', '.join(self.ORDENES)}")
+
+        condiciones, params = [], []
+        if status is not None:
+            estados = sorted({status} if isinstance(status, str) else set(status))
+            if not estados or set(estados) - set(Semillero.ESTADOS):
+                raise ValueError(f"Estado no válido. Debe ser uno de: {', '.join(Semillero.ESTADOS)}")
+            # Los estados ya validados van como literales: con un parámetro ?
+            # SQLite no puede usar los índices parciales por estado
+            literales = ", ".join(f"'{estado}'" for estado in estados)
+            condiciones.append(f"s.status = {literales}" if len(estados) == 1 else f"s.status IN ({literales})")
+        if grupo_id is not None:
+            condiciones.append("s.grupo_id = ?")
+            params.append(grupo_id)
+        if tutor is not None:
+            condiciones.append(
+                "s.semillero_id IN (SELECT semillero_id FROM investigadores "
+                "WHERE tipo = 'tutor' AND nombre = ? COLLATE NOCASE)"
+            )
+            params.append(tutor.strip())
+        if objetivo is not None:
+            condiciones.append("s.semillero_id IN (SELECT semillero_id FROM semillero_objetivos WHERE objetivo = ?)")
+            params.append(objetivo.strip())
+        if creado_desde is not None:
+            condiciones.append("s.creado_en >= ?")
+            params.append(self._marca(creado_desde))
+        if creado_hasta is not None:
+            condiciones.append("s.creado_en < ?")
+            params.append(self._marca(creado_hasta))
+
+        direccion = "DESC" if descendente else "ASC"
+        query = """
+            SELECT s.semillero_id, s.nombre, s.objetivo_principal,
+                   s.grupo_id, s.status, g.nombre as grupo_nombre
+            FROM semilleros s
+            LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+        """
+        if condiciones:
+            query += " WHERE " + " AND ".join(condiciones)
+        query += f" ORDER BY {self.ORDENES[orden]} {direccion}, s.semillero_id {direccion}"
+        if limite is not None:
+            query += " LIMIT ?"
+            params.append(limite)
+
+        semilleros = self.db.consultar_modelos(query, tuple(params), Semillero, self.CAMPOS)
+        self._completar(semilleros, prefetch)
+
+        return semilleros
+
+    @staticmethod
+    def _marca(valor):
+        """Convierte una fecha en el texto con que se guardan las marcas de tiempo"""
+        if isinstance(valor, datetime):
+            return valor.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        if isinstance(valor, date):
+            return valor.isoformat()
+        return valor
+
+    def _cargar_investigadores(self, semillero):
+        """Carga los investigadores asociados a un semillero
+
+        Args:
+            semillero (Semillero): Objeto Semillero al que cargar los investigadores
+        """
+        self._cargar_investigadores_lote([semillero])
+
+    def prefetch(self, semilleros, relaciones=None):
+        """Carga en lote las relaciones pendientes de un conjunto de semilleros
+
+        Solo consulta los semilleros que aún no tienen cargada cada relación,
+        con una consulta por relación (y por cada ``TAMANO_LOTE_IN`` IDs).
+
+        Args:
+            semilleros (list): Objetos Semillero a completar
+            relaciones (iterable, optional): 'objetivos' y/o 'investigadores';
+                por defecto ambas
+        """
+        for relacion in self._validar_relaciones(relaciones or Semillero.RELACIONES):
+            pendientes = [semillero for semillero in semilleros if not semillero.cargado(relacion)]
+            if pendientes:
+                self._cargar_relacion(relacion, pendientes)
+
+    def _cargar_relacion(self, relacion, semilleros):
+        if relacion == "objetivos":
+            self._cargar_objetivos_lote(semilleros)
+        else:
+            self._cargar_investigadores_lote(semilleros)
+
+    @staticmethod
+    def _validar_relaciones(relaciones):
+        relaciones = list(relaciones)
+        desconocidas = set(relaciones) - set(Semillero.RELACIONES)
+        if desconocidas:
+            raise ValueError(f"Relaciones no válidas: {', '.join(sorted(desconocidas))}")
+        return relaciones
+
+    def _completar(self, semilleros, prefetch=None):
+        """Carga las relaciones de ``prefetch`` y difiere las demás
+
+        Las relaciones diferidas comparten un cargador para todo el conjunto:
+        el primer acceso en cualquier semillero las carga en todos. El
+        cargador guarda referencias débiles para no formar un ciclo con los
+        semilleros, que así se liberan en cuanto dejan de usarse.
+
+        Args:
+            semilleros (list): Objetos Semillero recién construidos
+            prefetch (iterable, optional): Relaciones a cargar de inmediato
+        """
+        prefetch = self._validar_relaciones(prefetch or ())
+        diferidas = [relacion for relacion in Semillero.RELACIONES if relacion not in prefetch]
+
+        if diferidas and semilleros:
+            referencias = [weakref.ref(semillero) for semillero in semilleros]
+
+            def cargar(relacion):
+                vivos = [semillero for semillero in (ref() for ref in referencias) if semillero is not None]
+                self.prefetch(vivos, [relacion])
+
+            for semillero in semilleros:
+                semillero.diferir(cargar, diferidas)
+
+        for relacion in prefetch:
+            self._cargar_relacion(relacion, semilleros)
+
+    def _lotes_ids(self, semilleros):
+        """Divide los IDs de los semilleros en lotes de ``TAMANO_LOTE_IN``
+
+        Returns:
+            tuple: (diccionario ID -> Semillero, lista de tuplas de IDs)
+        """
+        por_id = {semillero.id: semillero for semillero in semilleros}
+        ids = list(por_id)
+        # SQLite limita el número de parámetros por sentencia
+        lotes = [tuple(ids[inicio:inicio + self.TAMANO_LOTE_IN])
+                 for inicio in range(0, len(ids), self.TAMANO_LOTE_IN)]
+        return por_id, lotes
+
+    def _cargar_objetivos_lote(self, semilleros):
+        """Carga los objetivos específicos de varios semilleros con una consulta por lote
+
+        Args:
+            semilleros (list): Objetos Semillero a los que cargar los objetivos
+        """
+        por_id, lotes = self._lotes_ids(semilleros)
+        for semillero in semilleros:
+            semillero.objetivos_especificos = []
+
+        for lote in lotes:
+            marcadores = ", ".join("?" * len(lote))
+            query = f"""
+                SELECT semillero_id, objetivo
+                FROM semillero_objetivos
+                WHERE semillero_id IN ({marcadores})
+                ORDER BY semillero_id, posicion
+            """
+            for row in self.db.execute_query(query, lote, fetch='all'):
+                por_id[row['semillero_id']].objetivos_especificos.append(row['objetivo'])
+
+    def _cargar_investigadores_lote(self, semilleros):
+        """Carga los investigadores de varios semilleros con una consulta por lote
+
+        En lugar de una consulta por semillero (N+1), se consultan todos los
+        investigadores del conjunto con una lista IN y se reparten en memoria.
+
+        Args:
+            semilleros (list): Objetos Semillero a los que cargar los investigadores
+        """
+        por_id, lotes = self._lotes_ids(semilleros)
+        for semillero in semilleros:
+            semillero.estudiantes = []
+            semillero.tutores = []
+
+        for lote in lotes:
+            marcadores = ", ".join("?" * len(lote))
+            query = f"""
+                SELECT id, nombre, tipo, email, semillero_id
+                FROM investigadores
+                WHERE semillero_id IN ({marcadores})
+                ORDER BY semillero_id, tipo, nombre
+            """
+
+            resultados = self.db.execute_query(query, lote, fetch='all')
+
+            for row in resultados:
+                semillero = por_id[row['semillero_id']]
+                investigador = Investigador(
+                    id=row['id'],
+                    nombre=row['nombre'],
+                    tipo=row['tipo'],
+                    email=row['email'],
+                    semillero_id=semillero.id
+                )
+
+                if row['tipo'] == 'estudiante':
+                    semillero.estudiantes.append(investigador)
+                elif row['tipo'] == 'tutor':
+                    semillero.tutores.append(investigador)
@@ -0,0 +1,244 @@
+"""Trazas de tiempo de las operaciones de los servicios.
+
+Las clases marcadas con ``@rastreable`` (los servicios de grupos, semilleros
+y entregables, y ``Database``) se instrumentan solo mientras hay un trazador
+activo: ``activar`` reemplaza sus métodos por envolturas que abren un span
+(intervalo con nombre, inicio y duración) y ``desactivar`` restaura los
+métodos originales. Sin trazador activo no queda ningún costo añadido.
+
+Los spans se anidan por hilo: la llamada a ``SemilleroService.obtener_todos``
+contiene los spans de ``Database.consultar_modelos`` (y dentro, la consulta
+en ``Database.execute_query``) y de la carga de relaciones. El tiempo propio
+de un span es su duración menos la de sus hijos; el de
+``Database.consultar_modelos``, por ejemplo, es la construcción de modelos.
+
+Las trazas se exportan en el formato de eventos de Chrome (Trace Event
+Format), que abren chrome://tracing y https://ui.perfetto.dev::
+
+    with trazar("trazas.json") as trazador:
+        SemilleroService(db).obtener_todos()
+    print(trazador.formatear_resumen())
+
+Los métodos generadores (``iter_todos``) no se instrumentan: su ejecución se
+intercala con la del llamador y no forma un intervalo anidable.
+"""
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from db.database import Database
+
+# clase -> (categoría, métodos o None para todos los públicos, métodos internos, función de detalle)
+_CLASES = {}
+# (clase, nombre) -> método original, mientras hay un trazador activo
+_ORIGINALES = {}
+_activo = None
+
+
+class Trazador:
+    """Registra los spans de las operaciones instrumentadas"""
+
+    def __init__(self):
+        self._inicio = time.perf_counter_ns()
+        self._spans = []  # (nombre, categoría, inicio ns, duración ns, propio ns, hilo, detalle)
+        self._local = threading.local()  # Pila de duraciones de los hijos del span abierto en cada hilo
+
+    @contextmanager
+    def span(self, nombre, categoria="app", detalle=None):
+        """Mide el bloque como un span hijo del span abierto en el hilo actual
+
+        Args:
+            nombre (str): Nombre del span, p. ej. 'SemilleroService.obtener_todos'
+            categoria (str): Categoría ('servicio', 'db', ...)
+            detalle (dict, optional): Datos adicionales del span (p. ej. la sentencia SQL)
+        """
+        pila = getattr(self._local, "pila", None)
+        if pila is None:
+            pila = self._local.pila = []
+        pila.append(0)
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter_ns() - inicio
+            hijos = pila.pop()
+            if pila:
+                pila[-1] += duracion
+            # list.append es atómico: no hace falta un lock entre hilos
+            self._spans.append(
+                (nombre, categoria, inicio, duracion, duracion - hijos, threading.get_ident(), detalle)
+            )
+
+    def __len__(self):
+        return len(self._spans)
+
+    def eventos(self):
+        """Retorna los spans como eventos completos ('X') del Trace Event Format"""
+        pid = os.getpid()
+        return [
+            {
+                "name": nombre,
+                "cat": categoria,
+                "ph": "X",
+                "ts": (inicio - self._inicio) / 1000,  # microsegundos
+                "dur": duracion / 1000,
+                "pid": pid,
+                "tid": hilo,
+                "args": detalle or {},
+            }
+            for nombre, categoria, inicio, duracion, _, hilo, detalle in sorted(self._spans, key=lambda s: s[2])
+        ]
+
+    def exportar(self, ruta):
+        """Guarda las trazas en ``ruta`` en formato JSON de Chrome
+
+        Returns:
+            int: Número de spans exportados
+        """
+        import json
+
+        eventos = self.eventos()
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, archivo, ensure_ascii=False)
+        return len(eventos)
+
+    def resumen(self):
+        """Agrega los spans por nombre
+
+        Returns:
+            list: (nombre, cantidad, total ms, propio ms), de mayor a menor tiempo total
+        """
+        acumulado = {}
+        for nombre, _, _, duracion, propio, _, _ in self._spans:
+            cantidad, total, total_propio = acumulado.get(nombre, (0, 0, 0))
+            acumulado[nombre] = (cantidad + 1, total + duracion, total_propio + propio)
+        filas = [
+            (nombre, cantidad, total / 1e6, propio / 1e6)
+            for nombre, (cantidad, total, propio) in acumulado.items()
+        ]
+        filas.sort(key=lambda fila: fila[2], reverse=True)
+        return filas
+
+    def formatear_resumen(self, limite=30):
+        """Texto con el resumen por nombre: llamadas, tiempo total y tiempo propio"""
+        lineas = [f"{'llamadas':>9} {'total ms':>11} {'propio ms':>11}  operación"]
+        lineas += [
+            f"{cantidad:>9} {total:>11.2f} {propio:>11.2f}  {nombre}"
+            for nombre, cantidad, total, propio in self.resumen()[:limite]
+        ]
+        return "\n".join(lineas)
+
+
+def rastreable(categoria="servicio", metodos=None, internos=(), detalle=None):
+    """Decorador de clase: registra sus métodos para instrumentarlos al activar las trazas
+
+    Args:
+        categoria (str): Categoría de los spans de la clase
+        metodos (iterable, optional): Métodos a instrumentar; por defecto todos los públicos
+        internos (iterable): Métodos privados que también se instrumentan, para
+            desglosar las operaciones
+        detalle (callable, optional): Función (args, kwargs) -> dict con datos del span
+    """
+    def registrar(clase):
+        _CLASES[clase] = (categoria, metodos, tuple(internos), detalle)
+        if _activo is not None:
+            # La clase se importó con las trazas ya activas
+            _instalar(clase)
+        return clase
+
+    return registrar
+
+
+def _metodos(clase, metodos, internos):
+    """Nombres de los métodos a instrumentar; por defecto las funciones públicas que no son generadores"""
+    if metodos is not None:
+        return list(metodos) + list(internos)
+
+    # Solo al activar las trazas: inspect tarda en importarse
+    import inspect
+
+    publicos = [
+        nombre for nombre, valor in vars(clase).items()
+        if not nombre.startswith("_") and inspect.isfunction(valor) and not inspect.isgeneratorfunction(valor)
+    ]
+    return publicos + list(internos)
+
+
+def _envolver(funcion, nombre, categoria, detalle):
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        trazador = _activo
+        if trazador is None:
+            return funcion(*args, **kwargs)
+        with trazador.span(nombre, categoria, detalle(args, kwargs) if detalle else None):
+            return funcion(*args, **kwargs)
+
+    return envoltura
+
+
+def _instalar(clase):
+    categoria, metodos, internos, detalle = _CLASES[clase]
+    for nombre in _metodos(clase, metodos, internos):
+        if (clase, nombre) in _ORIGINALES:
+            continue
+        original = vars(clase)[nombre]
+        _ORIGINALES[(clase, nombre)] = original
+        setattr(clase, nombre, _envolver(original, f"{clase.__name__}.{nombre}", categoria, detalle))
+
+
+def activar(trazador=None):
+    """Instrumenta las clases registradas y empieza a registrar spans
+
+    Args:
+        trazador (Trazador, optional): Trazador a usar; por defecto uno nuevo
+
+    Returns:
+        Trazador: El trazador activo
+    """
+    global _activo
+    _activo = trazador or Trazador()
+    for clase in _CLASES:
+        _instalar(clase)
+    return _activo
+
+
+def desactivar():
+    """Restaura los métodos originales y retorna el trazador que estaba activo"""
+    global _activo
+    trazador, _activo = _activo, None
+    for (clase, nombre), original in _ORIGINALES.items():
+        setattr(clase, nombre, original)
+    _ORIGINALES.clear()
+    return trazador
+
+
+def activo():
+    """Retorna el trazador activo, o None"""
+    return _activo
+
+
+@contextmanager
+def trazar(ruta=None):
+    """Activa las trazas durante el bloque y, si se indica ``ruta``, las exporta al salir"""
+    trazador = activar()
+    try:
+        yield trazador
+    finally:
+        desactivar()
+        if ruta:
+            trazador.exportar(ruta)
+
+
+def _detalle_sql(args, kwargs):
+    """Sentencia SQL de una llamada a Database (primer argumento después de self)"""
+    query = args[1] if len(args) > 1 else kwargs.get("query", "")
+    return {"sql": " ".join(str(query).split())[:300]}
+
+
+rastreable(
+    "db",
+    metodos=("execute_query", "execute_many", "consultar_modelos", "consultar_columnas"),
+    detalle=_detalle_sql,
+)(Database)
@@ -0,0 +1,44 @@
+"""Clases base de las pruebas que usan archivos y bases de datos temporales."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from db.database import Database
+
+
+class PruebaConDirectorio(unittest.TestCase):
+    """Crea un directorio temporal por prueba (``self.directorio``) y lo borra al terminar
+
+    ``self.db_path`` es la ruta de la base de datos dentro del directorio,
+    que estas pruebas crean por su cuenta.
+    """
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directorio, ignore_errors=True)
+        self.db_path = os.path.join(self.directorio, "test.db")
+
+
+class PruebaConBaseDeDatos(PruebaConDirectorio):
+    """Abre ``self.db`` en el directorio temporal y la cierra al terminar
+
+    Atributos de clase:
+        clase_db: Clase de la base de datos (una subclase de Database, por ejemplo)
+        opciones_db (dict): Argumentos adicionales para crearla
+        cargar_grupos (bool): Cargar los grupos de investigación iniciales
+    """
+
+    clase_db = Database
+    opciones_db = {}
+    cargar_grupos = False
+
+    def setUp(self):
+        super().setUp()
+        self.db = self.clase_db(self.db_path, **self.opciones_db)
+        # Se cierra la base abierta al final de la prueba, aunque la prueba la reemplace
+        self.addCleanup(lambda: self.db.cerrar())
+        if self.cargar_grupos:
+            from services.grupo_service import GrupoService
+
+            GrupoService(self.db).cargar_datos_iniciales()
@@ -0,0 +1,114 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from benchmarks.arranque import PRESUPUESTO_MS, RAIZ, medir
+from db import database
+from db.database import Database
+from test.base import PruebaConDirectorio
+
+
+class TestArranque(PruebaConDirectorio):
+    def _abrir(self):
+        db = Database(self.db_path)
+        self.addCleanup(db.cerrar)
+        return db
+
+    def _main(self):
+        return subprocess.run(
+            [sys.executable, os.path.join(RAIZ, "main.py")],
+            input="0\n", text=True, capture_output=True, check=True, cwd=RAIZ,
+            env=dict(os.environ, SEMILLEROS_DB=self.db_path),
+        ).stdout
+
+    def test_segunda_apertura_sin_ddl(self):
+        self.assertTrue(self._abrir().esquema_actualizado)
+        self.assertFalse(self._abrir().esquema_actualizado)
+
+    def test_sincroniza_si_cambia_el_esquema(self):
+        db = self._abrir()
+        db.execute_query("DROP TRIGGER trg_semilleros_insertado")
+
+        db = self._abrir()
+        self.assertTrue(db.esquema_actualizado)
+        existe = db.execute_query(
+            "SELECT 1 FROM sqlite_master WHERE name = 'trg_semilleros_insertado'", fetch='one'
+        )
+        self.assertIsNotNone(existe)
+
+        # Una huella distinta equivale a un cambio en db.esquema
+        db.execute_query("UPDATE metadatos SET valor = 'otra' WHERE clave = 'huella_esquema'")
+        self.assertTrue(self._abrir().esquema_actualizado)
+        self.assertFalse(self._abrir().esquema_actualizado)
+
+    def test_reintenta_indices_que_no_se_pudieron_crear(self):
+        db = self._abrir()
+        db.execute_query("DROP INDEX uq_grupos_identificador")
+        db.execute_many(
+            "INSERT INTO grupos_investigacion (nombre, identificador) VALUES (?, ?)",
+            [("A", "COL0000001"), ("B", "COL0000001")],
+        )
+
+        # Con duplicados el índice falla y no se guarda la huella: se reintenta en cada apertura
+        self.assertTrue(self._abrir().esquema_actualizado)
+        db = self._abrir()
+        self.assertTrue(db.esquema_actualizado)
+
+        db.execute_query("UPDATE grupos_investigacion SET identificador = 'COL0000002' WHERE nombre = 'B'")
+        db = self._abrir()
+        self.assertTrue(db.esquema_actualizado)
+        existe = db.execute_query(
+            "SELECT 1 FROM sqlite_master WHERE name = 'uq_grupos_identificador'", fetch='one'
+        )
+        self.assertIsNotNone(existe)
+        self.assertFalse(self._abrir().esquema_actualizado)
+
+    def test_error_al_sincronizar_revierte_y_devuelve_la_conexion(self):
+        db = self._abrir()
+        antes = db.execute_query("SELECT valor FROM metadatos WHERE clave = 'huella_esquema'", fetch='one')[0]
+        libres = db.pool.estadisticas()["libres"]
+
+        with mock.patch.dict(database.TRIGGERS, {"trg_roto": "CREATE TRIGGER trg_roto SINTAXIS INVALIDA"}):
+            with self.assertRaises(Exception):
+                db.sincronizar_esquema()
+
+        self.assertEqual(db.pool.estadisticas()["libres"], libres)
+        self.assertFalse(db.en_transaccion())
+        despues = db.execute_query("SELECT valor FROM metadatos WHERE clave = 'huella_esquema'", fetch='one')[0]
+        self.assertEqual(despues, antes)
+
+    def test_carga_grupos_solo_la_primera_vez(self):
+        self.assertIn("Se han cargado 8 grupos", self._main())
+        self.assertNotIn("Se han cargado", self._main())
+
+    def test_carga_grupos_en_base_creada_por_otro_programa(self):
+        subprocess.run(
+            [sys.executable, "-m", "db.migraciones", "--db", self.db_path],
+            text=True, capture_output=True, check=True, cwd=RAIZ,
+        )
+        self.assertFalse(self._abrir().esquema_actualizado)
+
+        self.assertIn("Se han cargado 8 grupos", self._main())
+        total = self._abrir().execute_query("SELECT COUNT(*) FROM grupos_investigacion", fetch='one')[0]
+        self.assertEqual(total, 8)
+
+    def test_main_no_importa_servicios(self):
+        salida = subprocess.run(
+            [sys.executable, "-c", "import sys, main; print(sorted(m for m in sys.modules if m.startswith('services')))"],
+            text=True, capture_output=True, check=True, cwd=RAIZ,
+        ).stdout
+        self.assertEqual(salida.strip(), "[]")
+
+    @unittest.skipUnless(
+        os.environ.get("SEMILLEROS_MEDIR_ARRANQUE"),
+        "mide tiempos reales; activar con SEMILLEROS_MEDIR_ARRANQUE=1 (o usar python -m benchmarks.arranque)",
+    )
+    def test_arranque_dentro_del_presupuesto(self):
+        resultados = medir(repeticiones=3)
+        self.assertLess(resultados["siguientes"] * 1000, PRESUPUESTO_MS)
+
+
+if __name__ == "__main__":
+    unittest.main()
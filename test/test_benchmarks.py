@@ -0,0 +1,108 @@
+import inspect
+import os
+import unittest
+
+from benchmarks import servicios
+from benchmarks.datos import GeneradorDatos
+from db.database import Database
+from models.entregable import Entregable
+from models.semillero import Semillero
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.resumenes import ResumenService
+from services.semillero_service import SemilleroService
+from test.base import PruebaConDirectorio
+
+TABLAS = ("grupos_investigacion", "semilleros", "semillero_objetivos", "investigadores", "entregables")
+
+
+class TestBenchmarks(PruebaConDirectorio):
+    def _generar(self, nombre, semilla, semilleros=60):
+        ruta = os.path.join(self.directorio, nombre)
+        conteo = GeneradorDatos(semilla).generar(ruta, semilleros)
+        db = Database(ruta)
+        self.addCleanup(db.cerrar)
+        return db, conteo
+
+    def _contenido(self, db):
+        return {tabla: db.execute_query(f"SELECT * FROM {tabla} ORDER BY 1", fetch='tuplas') for tabla in TABLAS}
+
+    def test_datos_reproducibles(self):
+        db_a, conteo = self._generar("a.db", 7)
+        db_b, _ = self._generar("b.db", 7)
+        db_c, _ = self._generar("c.db", 8)
+
+        self.assertEqual(self._contenido(db_a), self._contenido(db_b))
+        self.assertNotEqual(self._contenido(db_a), self._contenido(db_c))
+        self.assertEqual(conteo["semilleros"], 60)
+        self.assertEqual(
+            conteo, {tabla: db_a.execute_query(f"SELECT COUNT(*) FROM {tabla}", fetch='one')[0] for tabla in TABLAS}
+        )
+
+    def test_datos_completos_y_consistentes(self):
+        db, _ = self._generar("datos.db", 3, semilleros=300)
+
+        # Abrir la base generada no vuelve a sincronizar el esquema
+        self.assertFalse(db.esquema_actualizado)
+        self.assertFalse(any(ResumenService(db).verificar().values()))
+
+        estados = {fila[0] for fila in db.execute_query("SELECT DISTINCT estado FROM entregables", fetch='all')}
+        self.assertEqual(estados, set(Entregable.ESTADOS))
+        status = {fila[0] for fila in db.execute_query("SELECT DISTINCT status FROM semilleros", fetch='all')}
+        self.assertEqual(status, set(Semillero.ESTADOS))
+
+        semillero = SemilleroService(db).obtener_por_id(1)
+        self.assertTrue(semillero.objetivos_especificos)
+        self.assertTrue(semillero.estudiantes and semillero.tutores)
+        palabra = semillero.objetivo_principal.split()[0]
+        self.assertTrue(SemilleroService(db).buscar(palabra)[0])
+
+    def test_base_existente(self):
+        self._generar("datos.db", 1)
+        with self.assertRaises(ValueError):
+            GeneradorDatos(1).generar(os.path.join(self.directorio, "datos.db"), 10)
+
+    def test_un_caso_por_metodo_publico(self):
+        for clase in (GrupoService, SemilleroService, EntregableService):
+            publicos = {
+                f"{clase.__name__}.{nombre}" for nombre, valor in vars(clase).items()
+                if not nombre.startswith("_") and inspect.isfunction(inspect.unwrap(valor))
+            }
+            self.assertLessEqual(publicos, set(servicios.CASOS))
+
+    def test_ejecuta_todos_los_casos(self):
+        datos = servicios.medir(40, semilla=2, repeticiones=2, directorio=self.directorio)
+        self.assertEqual(set(datos["casos"]), set(servicios.CASOS))
+        for resultado in datos["casos"].values():
+            self.assertLessEqual(resultado["min_ms"], resultado["mediana_ms"])
+            self.assertLessEqual(resultado["mediana_ms"], resultado["max_ms"])
+        self.assertEqual(datos["entorno"]["filas"]["semilleros"], 40)
+        # La base generada se reutiliza y los casos no la modifican
+        db = Database(os.path.join(self.directorio, "datos_40_2.db"))
+        self.addCleanup(db.cerrar)
+        self.assertEqual(db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0], 40)
+
+    def test_caso_no_valido(self):
+        db, _ = self._generar("datos.db", 1)
+        with self.assertRaises(ValueError):
+            servicios.ejecutar(db, casos=["SemilleroService.no_existe"])
+
+    def test_comparar_detecta_regresiones(self):
+        base = {"casos": {
+            "A.lento": {"mediana_ms": 10.0}, "A.igual": {"mediana_ms": 10.0},
+            "A.ruido": {"mediana_ms": 0.01}, "A.eliminado": {"mediana_ms": 1.0},
+        }}
+        actual = {"casos": {
+            "A.lento": {"mediana_ms": 15.0}, "A.igual": {"mediana_ms": 11.0},
+            "A.ruido": {"mediana_ms": 0.03}, "A.nuevo": {"mediana_ms": 1.0},
+        }}
+        filas = {fila[0]: fila for fila in servicios.comparar(actual, base, tolerancia=0.2)}
+        self.assertEqual(set(filas), {"A.lento", "A.igual", "A.ruido"})
+        self.assertTrue(filas["A.lento"][4])
+        self.assertAlmostEqual(filas["A.lento"][3], 0.5)
+        self.assertFalse(filas["A.igual"][4])
+        self.assertFalse(filas["A.ruido"][4])
+
+
+if __name__ == "__main__":
+    unittest.main()
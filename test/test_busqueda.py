@@ -0,0 +1,104 @@
+import unittest
+
+from db.database import Database
+from models.entregable import Entregable
+from models.semillero import Semillero
+from services.busqueda import consulta_fts
+from services.entregable_service import EntregableService
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestBusqueda(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.service = SemilleroService(self.db)
+
+        self.energia = self._crear("Semillero de Energías Renovables", "Estudiar paneles solares", ["Eficiencia"])
+        self.software = self._crear("Semillero de Software", "Desarrollo ágil", ["Energías limpias en centros de datos"])
+        self.otro = self._crear("Semillero de Lingüística", "Análisis del discurso", ["Corpus"])
+
+    def _crear(self, nombre, objetivo, objetivos):
+        semillero = Semillero(
+            nombre=nombre, objetivo_principal=objetivo, objetivos_especificos=objetivos, grupo_id=1
+        )
+        semillero.estudiantes = ["Ana", "Luis"]
+        semillero.tutores = ["Dra. Rojas"]
+        return self.service.crear_semillero(semillero)[0]
+
+    def _ids(self, texto, **kwargs):
+        return [s.id for s in self.service.buscar(texto, **kwargs)[0]]
+
+    def test_consulta_fts(self):
+        self.assertEqual(consulta_fts("energía solar"), '"energía"* "solar"*')
+        self.assertEqual(consulta_fts('" OR ( NEAR'), '"OR"* "NEAR"*')
+        self.assertIsNone(consulta_fts("  ¿? "))
+
+    def test_busqueda_ordenada_por_relevancia(self):
+        # El nombre pesa más que los objetivos específicos
+        self.assertEqual(self._ids("energias"), [self.energia, self.software])
+        self.assertEqual(self._ids("ENERG"), [self.energia, self.software])
+        self.assertEqual(self._ids("discurso"), [self.otro])
+        self.assertEqual(self._ids("semillero solares"), [self.energia])
+        self.assertEqual(self._ids("inexistente"), [])
+        self.assertEqual(self._ids("***"), [])
+
+        semillero = self.service.buscar("software")[0][0]
+        self.assertEqual(len(semillero.estudiantes), 2)
+
+    def test_paginacion(self):
+        primera, siguiente = self.service.buscar("semillero", tamano=2)
+        self.assertEqual(len(primera), 2)
+        self.assertEqual(siguiente, 2)
+        segunda, siguiente = self.service.buscar("semillero", tamano=2, pagina=2)
+        self.assertEqual(len(segunda), 1)
+        self.assertIsNone(siguiente)
+
+    def test_indice_sincronizado_por_triggers(self):
+        self.service.editar_semillero(
+            self.otro, "Semillero de Robótica", "Construir robots", ["Visión artificial"], 1, "activo"
+        )
+        self.assertEqual(self._ids("discurso"), [])
+        self.assertEqual(self._ids("vision"), [self.otro])
+
+        self.service.eliminar_semillero(self.otro)
+        self.assertEqual(self._ids("robotica"), [])
+
+    def test_indexa_datos_existentes(self):
+        self.db.execute_query("DROP TABLE semilleros_fts")
+        for trigger in ("insertado", "modificado", "eliminado"):
+            self.db.execute_query(f"DROP TRIGGER trg_semilleros_fts_{trigger}")
+            self.db.execute_query(f"DROP TRIGGER trg_semillero_objetivos_fts_{trigger}")
+        self.db.execute_query(
+            "INSERT INTO semilleros (nombre, objetivo_principal, objetivos_especificos, grupo_id) "
+            "VALUES ('Semillero antiguo', 'Historia', ?, 1)", ('["Documentos coloniales"]',)
+        )
+        # Base de datos anterior a la migración de los objetivos
+        self.db.execute_query("PRAGMA user_version = 2")
+        self.db.cerrar()
+
+        self.db = Database(self.db_path)
+        self.service = SemilleroService(self.db)
+        self.assertEqual(len(self._ids("antiguo")), 1)
+        self.assertEqual(self._ids("coloniales"), self._ids("antiguo"))
+        self.assertEqual(self._ids("corpus"), [self.otro])
+
+    def test_buscar_entregables(self):
+        servicio = EntregableService(self.db)
+        for semillero_id, titulo, descripcion in [
+            (self.energia, "Prototipo de panel solar", "Panel con seguimiento"),
+            (self.software, "Artículo sobre microservicios", "Arquitectura para paneles de control"),
+        ]:
+            servicio.crear_entregable(Entregable(
+                titulo=titulo, descripcion=descripcion, tipo="Prototipo", semillero_id=semillero_id
+            ))
+
+        resultados, _ = servicio.buscar("panel")
+        self.assertEqual([e.semillero_id for e in resultados], [self.energia, self.software])
+        self.assertEqual(resultados[0].semillero_nombre, "Semillero de Energías Renovables")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from db.columnar import ResultadoColumnar
+from test.base import PruebaConBaseDeDatos
+
+
+def resultado(columnas, filas, tamano_lote=2):
+    lotes = [(columnas, filas[i:i + tamano_lote]) for i in range(0, len(filas), tamano_lote)] or [(columnas, [])]
+    return ResultadoColumnar.desde_lotes(lotes)
+
+
+class TestResultadoColumnar(unittest.TestCase):
+    def setUp(self):
+        self.resultado = resultado(
+            ("tipo", "estado", "grupo_id", "nota"),
+            [
+                ("Prototipo", "pendiente", 1, 4.5),
+                ("Artículo científico", "aprobado", 1, None),
+                ("Prototipo", "aprobado", 2, 3),
+                ("Prototipo", "pendiente", 2, 5.0),
+                (None, "rechazado", None, 1.0),
+            ]
+        )
+
+    def test_tipos_de_columna(self):
+        self.assertEqual(self.resultado.tipo("tipo"), "texto")
+        self.assertEqual(self.resultado.tipo("grupo_id"), "entero")
+        self.assertEqual(self.resultado.tipo("nota"), "real")
+        self.assertEqual(len(self.resultado), 5)
+        self.assertEqual(self.resultado.valores("grupo_id"), [1, 1, 2, 2, None])
+        self.assertEqual(self.resultado.valores("nota"), [4.5, None, 3.0, 5.0, 1.0])
+        self.assertEqual(self.resultado.distintos("estado"), ["pendiente", "aprobado", "rechazado"])
+
+    def test_filtrar(self):
+        pendientes = self.resultado.filtrar(estado="pendiente")
+        self.assertEqual(len(pendientes), 2)
+        self.assertEqual(pendientes.valores("grupo_id"), [1, 2])
+
+        varios = self.resultado.filtrar(estado=["aprobado", "rechazado"], grupo_id=lambda g: g != 2)
+        self.assertEqual(list(varios.filas()), [
+            ("Artículo científico", "aprobado", 1, None),
+            (None, "rechazado", None, 1.0),
+        ])
+        self.assertEqual(len(self.resultado.filtrar(tipo=None)), 1)
+
+    def test_agrupar(self):
+        self.assertEqual(self.resultado.contar_por("tipo"), {"Prototipo": 3, "Artículo científico": 1, None: 1})
+        self.assertEqual(
+            self.resultado.contar_por("grupo_id", "estado"),
+            {(1, "pendiente"): 1, (1, "aprobado"): 1, (2, "aprobado"): 1, (2, "pendiente"): 1, (None, "rechazado"): 1}
+        )
+        self.assertEqual(self.resultado.sumar_por("nota", "estado"), {"pendiente": 9.5, "aprobado": 3.0, "rechazado": 1.0})
+
+    def test_tipos_mezclados_y_vacio(self):
+        mezcla = resultado(("valor",), [(None,), (1,), (2.5,), ("x",)])
+        self.assertEqual(mezcla.tipo("valor"), "objeto")
+        self.assertEqual(mezcla.valores("valor"), [None, 1, 2.5, "x"])
+
+        vacio = resultado(("a", "b"), [])
+        self.assertEqual(len(vacio), 0)
+        self.assertEqual(vacio.columnas, ["a", "b"])
+        self.assertEqual(vacio.contar_por("a"), {})
+
+
+class TestConsultarColumnas(PruebaConBaseDeDatos):
+    def test_consultar_columnas(self):
+        self.db.execute_many(
+            "INSERT INTO grupos_investigacion (nombre, campo) VALUES (?, ?)",
+            [(f"Grupo {i}", "Ingeniería" if i % 3 else "Salud") for i in range(100)]
+        )
+        columnas = self.db.consultar_columnas("SELECT id, campo FROM grupos_investigacion", tamano_lote=7)
+        self.assertEqual(len(columnas), 100)
+        self.assertEqual(columnas.contar_por("campo"), {"Salud": 34, "Ingeniería": 66})
+        self.assertEqual(columnas.valores("id"), list(range(1, 101)))
+
+        vacio = self.db.consultar_columnas("SELECT id, campo FROM grupos_investigacion WHERE id < 0")
+        self.assertEqual((len(vacio), vacio.columnas), (0, ["id", "campo"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+import sqlite3
+import threading
+import unittest
+
+from db.database import Database
+from db.migraciones import Migrador
+from db.pool import PoolConexiones
+from test.base import PruebaConBaseDeDatos, PruebaConDirectorio
+
+
+class TestPoolConexiones(PruebaConDirectorio):
+    def test_reutiliza_conexiones(self):
+        pool = PoolConexiones(self.db_path, tamano=2)
+        with pool.conexion() as conn1:
+            pass
+        with pool.conexion() as conn2:
+            pass
+        self.assertIs(conn1, conn2)
+        self.assertEqual(pool.estadisticas()["creadas"], 1)
+        pool.cerrar()
+
+    def test_respeta_tamano_maximo(self):
+        pool = PoolConexiones(self.db_path, tamano=1, timeout=0.05)
+        conn = pool.obtener()
+        with self.assertRaises(RuntimeError):
+            pool.obtener()
+        pool.devolver(conn)
+        pool.cerrar()
+
+    def test_descarta_conexiones_danadas(self):
+        pool = PoolConexiones(self.db_path, tamano=1, intervalo_verificacion=0)
+        conn = pool.obtener()
+        pool.devolver(conn)
+        conn.close()
+
+        nueva = pool.obtener()
+        self.assertIsNot(nueva, conn)
+        nueva.execute("SELECT 1")
+        pool.devolver(nueva)
+        pool.cerrar()
+
+
+class TestDatabase(PruebaConBaseDeDatos):
+    opciones_db = {"pool_size": 3}
+
+    def test_consultas_reutilizan_el_pool(self):
+        for i in range(50):
+            self.db.execute_query(
+                "INSERT INTO grupos_investigacion (nombre, identificador) VALUES (?, ?)",
+                (f"Grupo {i}", f"COL{i:04d}")
+            )
+        total = self.db.execute_query("SELECT COUNT(*) FROM grupos_investigacion", fetch='one')[0]
+        self.assertEqual(total, 50)
+        self.assertEqual(self.db.pool.estadisticas()["creadas"], 1)
+
+    def test_claves_foraneas_activas(self):
+        fila = self.db.execute_query("PRAGMA foreign_keys", fetch='one')
+        self.assertEqual(fila[0], 1)
+
+    def test_uso_concurrente(self):
+        errores = []
+
+        def trabajador(n):
+            try:
+                for i in range(20):
+                    self.db.execute_query(
+                        "INSERT INTO grupos_investigacion (nombre) VALUES (?)", (f"G{n}-{i}",)
+                    )
+                    self.db.execute_query("SELECT COUNT(*) FROM grupos_investigacion", fetch='one')
+            except Exception as e:
+                errores.append(e)
+
+        hilos = [threading.Thread(target=trabajador, args=(n,)) for n in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(errores, [])
+        self.assertLessEqual(self.db.pool.estadisticas()["creadas"], 3)
+        total = self.db.execute_query("SELECT COUNT(*) FROM grupos_investigacion", fetch='one')[0]
+        self.assertEqual(total, 80)
+
+
+class TestTransacciones(PruebaConBaseDeDatos):
+    def _contar_grupos(self):
+        return self.db.execute_query("SELECT COUNT(*) FROM grupos_investigacion", fetch='one')[0]
+
+    def test_confirma_al_salir(self):
+        with self.db.transaction():
+            self.db.execute_query("INSERT INTO grupos_investigacion (nombre) VALUES ('A')")
+            self.db.execute_many("INSERT INTO grupos_investigacion (nombre) VALUES (?)", [("B",), ("C",)])
+            self.assertTrue(self.db.en_transaccion())
+        self.assertFalse(self.db.en_transaccion())
+        self.assertEqual(self._contar_grupos(), 3)
+
+    def test_revierte_ante_error(self):
+        with self.assertRaises(ValueError):
+            with self.db.transaction():
+                self.db.execute_query("INSERT INTO grupos_investigacion (nombre) VALUES ('A')")
+                raise ValueError("fallo")
+        self.assertEqual(self._contar_grupos(), 0)
+
+    def test_savepoint_anidado(self):
+        with self.db.transaction():
+            self.db.execute_query("INSERT INTO grupos_investigacion (nombre) VALUES ('A')")
+            with self.assertRaises(ValueError):
+                with self.db.transaction():
+                    self.db.execute_query("INSERT INTO grupos_investigacion (nombre) VALUES ('B')")
+                    raise ValueError("fallo interno")
+            self.db.execute_query("INSERT INTO grupos_investigacion (nombre) VALUES ('C')")
+
+        nombres = [fila['nombre'] for fila in self.db.execute_query(
+            "SELECT nombre FROM grupos_investigacion ORDER BY nombre", fetch='all')]
+        self.assertEqual(nombres, ["A", "C"])
+
+
+class TestPerfiles(PruebaConDirectorio):
+    def test_perfil_por_defecto(self):
+        db = Database(self.db_path)
+        configuracion = db.configuracion_efectiva()
+        db.cerrar()
+
+        self.assertEqual(configuracion["perfil"], "durable")
+        self.assertEqual(configuracion["efectiva"]["journal_mode"], "wal")
+        self.assertEqual(configuracion["efectiva"]["synchronous"], 2)  # FULL
+        self.assertEqual(configuracion["efectiva"]["busy_timeout"], 5000)
+
+    def test_perfil_fast_con_sobrescritura(self):
+        db = Database(self.db_path, perfil="fast", pragmas={"cache_size": -1000})
+        efectiva = db.configuracion_efectiva()["efectiva"]
+        db.cerrar()
+
+        self.assertEqual(efectiva["synchronous"], 1)  # NORMAL
+        self.assertEqual(efectiva["temp_store"], 2)  # MEMORY
+        self.assertEqual(efectiva["cache_size"], -1000)
+
+    def test_perfil_solo_lectura(self):
+        Database(self.db_path).cerrar()
+        db = Database(self.db_path, perfil="readonly-analytics")
+        self.assertEqual(db.configuracion_efectiva()["efectiva"]["query_only"], 1)
+        with self.assertRaises(sqlite3.OperationalError):
+            db.execute_query("INSERT INTO grupos_investigacion (nombre) VALUES ('A')")
+        db.cerrar()
+
+    def test_perfil_solo_lectura_no_migra(self):
+        # Base nueva: no se puede crear el esquema en solo lectura
+        with self.assertRaisesRegex(ValueError, "perfil de escritura"):
+            Database(self.db_path, perfil="readonly-analytics")
+
+        # Índices desactualizados no impiden abrirla: se omite la sincronización
+        Database(self.db_path).cerrar()
+        escritura = Database(self.db_path)
+        escritura.execute_query("DROP INDEX idx_semilleros_grupo_nombre")
+        escritura.cerrar()
+        db = Database(self.db_path, perfil="readonly-analytics")
+        self.assertFalse(db.esquema_actualizado)
+        self.assertEqual(db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0], 0)
+        db.cerrar()
+
+    def test_pool_de_una_conexion_no_valido(self):
+        with self.assertRaisesRegex(ValueError, "pool_size"):
+            Database(self.db_path, pool_size=1)
+
+    def test_perfil_invalido(self):
+        with self.assertRaises(ValueError):
+            Database(self.db_path, perfil="turbo")
+        with self.assertRaises(ValueError):
+            Database(self.db_path, pragmas={"cache_size": "1; DROP TABLE semilleros"})
+
+
+class TestMigracionObjetivos(PruebaConDirectorio):
+    def test_traslada_objetivos_json_por_lotes(self):
+        db = Database(self.db_path)
+        db.execute_query("INSERT INTO grupos_investigacion (nombre) VALUES ('G')")
+        db.execute_many(
+            "INSERT INTO semilleros (semillero_id, nombre, objetivos_especificos, grupo_id) VALUES (?, ?, ?, 1)",
+            [(i, f"S{i}", f'["Objetivo {i}", "Común", ""]') for i in range(1, 8)]
+            + [(20, "Texto plano", "Sin formato JSON"), (21, "Vacío", "[]")]
+        )
+
+        # Simula una base de datos anterior a la migración de los objetivos
+        db.execute_query("PRAGMA user_version = 2")
+        Migrador(db, tamano_lote=3, progreso=None).migrar()
+
+        filas = db.execute_query(
+            "SELECT semillero_id, posicion, objetivo FROM semillero_objetivos ORDER BY semillero_id, posicion",
+            fetch='all'
+        )
+        self.assertEqual(len(filas), 15)
+        self.assertEqual(tuple(filas[0]), (1, 0, "Objetivo 1"))
+        self.assertEqual(tuple(filas[1]), (1, 1, "Común"))
+        self.assertEqual(tuple(filas[-1]), (20, 0, "Sin formato JSON"))
+
+        pendientes = db.execute_query(
+            "SELECT COUNT(*) FROM semilleros WHERE objetivos_especificos IS NOT NULL", fetch='one'
+        )[0]
+        self.assertEqual(pendientes, 0)
+
+        # El índice de búsqueda refleja los objetivos trasladados
+        fila = db.execute_query(
+            "SELECT rowid FROM semilleros_fts WHERE semilleros_fts MATCH 'formato'", fetch='one'
+        )
+        self.assertEqual(fila[0], 20)
+        db.cerrar()
+
+    def test_reemplaza_triggers_modificados(self):
+        Database(self.db_path).cerrar()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP TRIGGER trg_semilleros_fts_modificado")
+        conn.execute(
+            "CREATE TRIGGER trg_semilleros_fts_modificado AFTER UPDATE ON semilleros BEGIN SELECT 1; END"
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(self.db_path)
+        sql = db.execute_query(
+            "SELECT sql FROM sqlite_master WHERE name = 'trg_semilleros_fts_modificado'", fetch='one'
+        )[0]
+        db.cerrar()
+        self.assertIn("UPDATE semilleros_fts", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
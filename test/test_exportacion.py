@@ -0,0 +1,88 @@
+import csv
+import json
+import os
+import unittest
+
+from models.semillero import Semillero
+from services.exportacion import Exportador, leer_columnar
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestExportacion(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.service = SemilleroService(self.db)
+        for i in range(5):
+            self._crear(f"Semillero {i}")
+        self.exportador = Exportador(self.db, tamano_lote=2)
+
+    def _crear(self, nombre):
+        semillero = Semillero(
+            nombre=nombre, objetivo_principal="Objetivo", objetivos_especificos=["Ñandú"], grupo_id=1
+        )
+        semillero.estudiantes = ["Ana", "Luis"]
+        semillero.tutores = ["Dra. Rojas"]
+        return self.service.crear_semillero(semillero)[0]
+
+    def _destino(self, nombre):
+        return os.path.join(self.directorio, nombre)
+
+    def test_exportar_jsonl(self):
+        manifiesto = self.exportador.exportar(self._destino("jsonl"))
+        self.assertEqual(manifiesto["filas"], {"grupos": 8, "semilleros": 5, "objetivos": 5, "investigadores": 15, "entregables": 0})
+
+        with open(self._destino("jsonl/semilleros.jsonl"), encoding="utf-8") as archivo:
+            filas = [json.loads(linea) for linea in archivo]
+        self.assertEqual([f["nombre"] for f in filas], [f"Semillero {i}" for i in range(5)])
+        self.assertIsNotNone(filas[0]["actualizado_en"])
+
+    def test_exportar_csv(self):
+        self.exportador.exportar(self._destino("csv"), formato="csv", entidades=["grupos"])
+        with open(self._destino("csv/grupos.csv"), encoding="utf-8", newline="") as archivo:
+            filas = list(csv.DictReader(archivo))
+        self.assertEqual(len(filas), 8)
+        self.assertEqual(filas[0]["identificador"], "COL0011599")
+
+    def test_exportar_columnar(self):
+        self.exportador.exportar(self._destino("col"), formato="columnar")
+        columnas = leer_columnar(self._destino("col/investigadores.scol"))
+        self.assertEqual(len(columnas["id"]), 15)
+        self.assertEqual(columnas["id"], sorted(columnas["id"]))
+        self.assertEqual(columnas["email"], [""] * 15)
+        self.assertEqual(columnas["programa"], [None] * 15)
+
+        objetivos = leer_columnar(self._destino("col/objetivos.scol"))
+        self.assertEqual(objetivos["objetivo"][:1], ["Ñandú"])
+        self.assertEqual(objetivos["posicion"][:1], [0])
+
+        vacio = leer_columnar(self._destino("col/entregables.scol"))
+        self.assertEqual(vacio, {})
+
+    def test_exportacion_incremental(self):
+        # Fechar los datos iniciales en el pasado: la comparación es inclusiva
+        # y todo se crea dentro del mismo milisegundo
+        for tabla in ("grupos_investigacion", "semilleros", "investigadores"):
+            self.db.execute_query(f"UPDATE {tabla} SET actualizado_en = '2000-01-01 00:00:00.000'")
+        primera = self.exportador.exportar(self._destino("completa"))
+
+        nuevo_id = self._crear("Semillero nuevo")
+        self.service.cambiar_status(1, "activo")
+
+        incremental = self.exportador.exportar(self._destino("incremental"), desde=primera["hasta"])
+        self.assertEqual(incremental["filas"]["grupos"], 0)
+        self.assertEqual(incremental["filas"]["semilleros"], 2)
+        self.assertEqual(incremental["filas"]["investigadores"], 3)
+
+        with open(self._destino("incremental/semilleros.jsonl"), encoding="utf-8") as archivo:
+            ids = sorted(json.loads(linea)["semillero_id"] for linea in archivo)
+        self.assertEqual(ids, [1, nuevo_id])
+
+        with self.assertRaises(ValueError):
+            self.exportador.exportar(self._destino("x"), formato="parquet")
+
+
+if __name__ == "__main__":
+    unittest.main()
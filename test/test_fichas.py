@@ -0,0 +1,80 @@
+import os
+import unittest
+
+from models.entregable import Entregable
+from models.semillero import Semillero
+from services.entregable_service import EntregableService
+from services.fichas import GeneradorFichas
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestGeneradorFichas(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.destino = os.path.join(self.directorio, "fichas")
+        self.semilleros = SemilleroService(self.db)
+        self.entregables = EntregableService(self.db)
+
+        self.ids = []
+        for numero in range(7):
+            semillero = Semillero(
+                nombre=f"Semillero <{numero}>",
+                objetivo_principal="Objetivo & alcance",
+                objetivos_especificos=[f"Objetivo {numero}.1", f"Objetivo {numero}.2"],
+                grupo_id=numero % 3 + 1,
+            )
+            semillero.estudiantes = [
+                {"nombre": "Ana", "email": "ana@test.com"},
+                {"nombre": "Luis", "email": "luis@test.com"},
+            ]
+            semillero.tutores = [{"nombre": "Dra. Rojas", "email": "rojas@test.com"}]
+            semillero_id, errores = self.semilleros.crear_semillero(semillero)
+            self.assertEqual(errores, [])
+            self.ids.append(semillero_id)
+
+        entregable = Entregable(
+            titulo="Artículo", descripcion="Resultados", tipo="Artículo científico", semillero_id=self.ids[0]
+        )
+        self.entregables.crear_entregable(entregable)
+
+    def _leer(self, semillero_id, extension="txt"):
+        with open(os.path.join(self.destino, f"semillero_{semillero_id}.{extension}"), encoding="utf-8") as archivo:
+            return archivo.read()
+
+    def test_contenido_igual_a_detalles(self):
+        total = GeneradorFichas(self.db, procesos=1, tamano_lote=3).generar(self.destino)
+        self.assertEqual(total, 7)
+        self.assertEqual(len(os.listdir(self.destino)), 7)
+
+        for semillero_id in self.ids:
+            semillero = self.semilleros.obtener_por_id(semillero_id)
+            self.assertIn(semillero.detalles(), self._leer(semillero_id))
+
+        ficha = self._leer(self.ids[0])
+        self.assertIn(self.entregables.obtener_por_semillero(self.ids[0]).detalles(), ficha)
+        self.assertIn("Sin entregables asignados", self._leer(self.ids[1]))
+
+    def test_procesos_en_paralelo(self):
+        total = GeneradorFichas(self.db, procesos=2, tamano_lote=2).generar(self.destino)
+        self.assertEqual(total, 7)
+        semillero = self.semilleros.obtener_por_id(self.ids[3])
+        self.assertIn(semillero.detalles(), self._leer(self.ids[3]))
+
+    def test_html_escapa_valores(self):
+        GeneradorFichas(self.db, procesos=1).generar(self.destino, formato="html")
+        ficha = self._leer(self.ids[0], "html")
+        self.assertIn("<dd>Semillero &lt;0&gt;</dd>", ficha)
+        self.assertIn("Objetivo &amp; alcance", ficha)
+        self.assertIn("<li>Objetivo 0.2</li>", ficha)
+        self.assertIn("<li>Dra. Rojas (rojas@test.com)</li>", ficha)
+
+    def test_formato_no_valido(self):
+        with self.assertRaises(ValueError):
+            GeneradorFichas(self.db).generar(self.destino, formato="pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
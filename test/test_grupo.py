@@ -32,4 +32,9 @@ class TestGrupo(unittest.TestCase):
         self.assertIn("NOMBRE: Grupo de Investigación Test", detalles)
         self.assertIn("CAMPO: Ingeniería de Software", detalles)
         self.assertIn("IDENTIFICADOR: GIT-001", detalles)
-        self.assertIn("DIRECTOR: Dr. Test", detalles)
\ No newline at end of file
+        self.assertIn("DIRECTOR: Dr. Test", detalles)
+
+    def test_sin_dict_por_instancia(self):
+        self.assertFalse(hasattr(self.grupo, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.grupo.atributo_inexistente = 1
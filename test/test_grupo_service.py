@@ -0,0 +1,72 @@
+import unittest
+
+from models.grupo import Grupo
+from services.grupo_service import GrupoService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestGrupoService(PruebaConBaseDeDatos):
+    def setUp(self):
+        super().setUp()
+        self.consultas = 0
+
+        original = self.db.execute_query
+
+        def contar(query, params=None, fetch=None, **kwargs):
+            self.consultas += 1
+            return original(query, params, fetch, **kwargs)
+
+        self.db.execute_query = contar
+        self.service = GrupoService(self.db)
+        self.service.cargar_datos_iniciales()
+
+    def test_obtener_todos_usa_cache(self):
+        grupos = self.service.obtener_todos()
+        self.assertEqual(len(grupos), 8)
+
+        self.consultas = 0
+        self.assertEqual(len(self.service.obtener_todos()), 8)
+        # El listado también precarga las búsquedas por ID e identificador
+        self.assertEqual(self.service.obtener_por_id(grupos[0].id).nombre, grupos[0].nombre)
+        self.assertIsNotNone(self.service.obtener_por_identificador("COL0007814"))
+        self.assertEqual(self.consultas, 0)
+
+    def test_obtener_por_id_usa_cache(self):
+        grupo = self.service.obtener_por_id(1)
+        self.consultas = 0
+        self.assertIs(self.service.obtener_por_id(1), grupo)
+        self.assertEqual(self.consultas, 0)
+
+    def test_inexistente_no_se_guarda(self):
+        self.assertIsNone(self.service.obtener_por_id(999))
+        self.consultas = 0
+        self.assertIsNone(self.service.obtener_por_id(999))
+        self.assertEqual(self.consultas, 1)
+
+    def test_crear_grupo_invalida_cache(self):
+        self.assertEqual(len(self.service.obtener_todos()), 8)
+        self.service.crear_grupo(Grupo(nombre="Nuevo", campo="Campo", identificador="COL9999999", director="X"))
+        self.assertEqual(len(self.service.obtener_todos()), 9)
+        self.assertEqual(self.service.obtener_por_identificador("COL9999999").nombre, "Nuevo")
+
+    def test_ttl(self):
+        ahora = [0.0]
+        service = GrupoService(self.db, cache_ttl=60)
+        service._cache._reloj = lambda: ahora[0]
+
+        service.obtener_por_id(1)
+        self.consultas = 0
+        service.obtener_por_id(1)
+        self.assertEqual(self.consultas, 0)
+
+        ahora[0] = 61.0
+        service.obtener_por_id(1)
+        self.assertEqual(self.consultas, 1)
+
+    def test_iter_todos(self):
+        grupos = list(self.service.iter_todos(tamano_lote=3))
+        self.assertEqual([g.id for g in grupos], [g.id for g in self.service.obtener_todos()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import json
+import os
+import unittest
+
+from services.importacion import ImportadorSemilleros
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+def registro(nombre, **cambios):
+    datos = {
+        "nombre": nombre,
+        "objetivo_principal": "Objetivo principal",
+        "objetivos_especificos": ["Objetivo 1", "Objetivo 2"],
+        "grupo_id": 1,
+        "estudiantes": [{"nombre": f"{nombre} E1", "email": "e1@test.com"}, f"{nombre} E2"],
+        "tutores": [{"nombre": f"{nombre} T1", "email": "t1@test.com"}],
+    }
+    datos.update(cambios)
+    return datos
+
+
+class TestImportacion(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.importador = ImportadorSemilleros(self.db, tamano_lote=3)
+
+    def _escribir(self, nombre, contenido):
+        ruta = os.path.join(self.directorio, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_importar_jsonl_con_errores(self):
+        lineas = [json.dumps(registro(f"Semillero {i}")) for i in range(7)]
+        lineas.insert(2, json.dumps(registro("Sin tutores", tutores=[])))
+        lineas.insert(4, "{esto no es json")
+        lineas.append(json.dumps(registro("Grupo inexistente", grupo_id=99)))
+        lineas.append(json.dumps(registro("Por identificador", grupo_id=None, grupo_identificador="COL0007814")))
+        ruta = self._escribir("semilleros.jsonl", "\n".join(lineas))
+
+        resultado = self.importador.importar(ruta)
+
+        self.assertEqual(resultado.importados, 8)
+        self.assertEqual([numero for numero, _ in resultado.errores], [3, 5, 10])
+        self.assertIn("Debe tener uno o dos tutores", resultado.errores[0][1])
+
+        semilleros = {s.nombre: s for s in SemilleroService(self.db).obtener_todos()}
+        self.assertEqual(len(semilleros), 8)
+        for nombre, semillero in semilleros.items():
+            self.assertEqual([e.nombre for e in semillero.estudiantes], [f"{nombre} E1", f"{nombre} E2"])
+            self.assertEqual([t.nombre for t in semillero.tutores], [f"{nombre} T1"])
+        self.assertEqual(semilleros["Por identificador"].grupo_id, 4)
+
+    def test_campos_con_tipo_incorrecto(self):
+        incorrectos = [
+            {"objetivos_especificos": 5},
+            {"estudiantes": 3},
+            {"nombre": 123},
+            {"objetivo_principal": 123},
+            {"tutores": {"nombre": "x"}},
+            {"grupo_id": None, "grupo_identificador": ["COL0007814"]},
+        ]
+        lineas = [json.dumps(registro("Antes"))]
+        for numero, cambios in enumerate(incorrectos):
+            datos = registro(f"Incorrecto {numero}")
+            datos.update(cambios)
+            lineas.append(json.dumps(datos))
+        lineas.append(json.dumps(registro("Después", tutores="Dra. Rojas")))
+
+        resultado = self.importador.importar(self._escribir("semilleros.jsonl", "\n".join(lineas)))
+
+        self.assertEqual(resultado.importados, 2)
+        self.assertEqual([numero for numero, _ in resultado.errores], [2, 3, 4, 5, 6, 7])
+        self.assertEqual(resultado.errores[0][1], ["El campo objetivos_especificos debe ser texto o lista"])
+        self.assertEqual(resultado.errores[2][1], ["El campo nombre debe ser texto"])
+        self.assertEqual(resultado.errores[4][1], ["El campo tutores debe ser texto o lista"])
+        self.assertEqual(resultado.errores[5][1], ["El campo grupo_identificador debe ser texto"])
+
+        semilleros = {s.nombre: s for s in SemilleroService(self.db).obtener_todos()}
+        self.assertEqual(set(semilleros), {"Antes", "Después"})
+        self.assertEqual([t.nombre for t in semilleros["Después"].tutores], ["Dra. Rojas"])
+
+    def test_importar_csv(self):
+        contenido = (
+            "nombre,objetivo_principal,objetivos_especificos,grupo_identificador,status,estudiantes,tutores\n"
+            'Semillero CSV,Objetivo,Obj 1|Obj 2,COL0011599,activo,"Ana, ana@test.com|Luis",Dra. Rojas\n'
+            "Incompleto,,Obj 1,COL0011599,pendiente,Ana|Luis,Tutor\n"
+        )
+        resultado = self.importador.importar(self._escribir("semilleros.csv", contenido))
+
+        self.assertEqual(resultado.importados, 1)
+        self.assertEqual(resultado.errores[0][0], 3)
+
+        semillero = SemilleroService(self.db).obtener_todos()[0]
+        self.assertEqual(semillero.objetivos_especificos, ["Obj 1", "Obj 2"])
+        self.assertEqual(semillero.status, "activo")
+        self.assertEqual(semillero.estudiantes[0].email, "ana@test.com")
+
+    def test_lote_con_fallo_de_base_de_datos(self):
+        # Un trigger rechaza un nombre concreto: el resto del lote debe importarse
+        self.db.execute_query("""
+            CREATE TRIGGER rechazar BEFORE INSERT ON semilleros
+            WHEN NEW.nombre = 'Rechazado'
+            BEGIN SELECT RAISE(ABORT, 'nombre rechazado'); END
+        """)
+        lineas = [json.dumps(registro(n)) for n in ("A", "Rechazado", "B")]
+        resultado = self.importador.importar(self._escribir("semilleros.jsonl", "\n".join(lineas)))
+
+        self.assertEqual(resultado.importados, 2)
+        self.assertEqual(resultado.errores[0][0], 2)
+        self.assertEqual(self.db.execute_query("SELECT COUNT(*) FROM investigadores", fetch='one')[0], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import os
+import unittest
+
+from db.instrumentacion import formatear
+from services import trazas
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestInstrumentacion(PruebaConBaseDeDatos):
+    def setUp(self):
+        super().setUp()
+        self.grupos = GrupoService(self.db)
+        self.grupos.cargar_datos_iniciales()
+
+    def _estadistica(self, instrumentacion, sql):
+        return {estadistica["sql"]: estadistica for estadistica in instrumentacion.estadisticas()}[sql]
+
+    def test_sin_instrumentacion(self):
+        self.assertIsNone(self.db.instrumentacion)
+        self.db.execute_query("SELECT 1", fetch='one')
+        self.assertIsNone(self.db.desinstrumentar())
+
+    def test_estadisticas_por_sentencia(self):
+        instrumentacion = self.db.instrumentar(umbral_lento=None)
+        self.db.execute_query("SELECT * FROM grupos_investigacion", fetch='all')
+        self.db.execute_query("SELECT *   FROM grupos_investigacion", fetch='all')
+        self.db.execute_query("SELECT id FROM grupos_investigacion WHERE id = ?", (1,), fetch='one')
+        list(self.db.execute_query("SELECT id FROM grupos_investigacion", fetch='iter', tamano_lote=3))
+        self.db.execute_many("UPDATE grupos_investigacion SET campo = ? WHERE id = ?", [("A", 1), ("B", 2)])
+
+        # Los espacios se normalizan: ambas consultas son la misma sentencia
+        todos = self._estadistica(instrumentacion, "SELECT * FROM grupos_investigacion")
+        self.assertEqual(todos["cantidad"], 2)
+        self.assertEqual(todos["filas"], 16)
+        self.assertEqual(sum(todos["histograma"].values()), 2)
+        self.assertEqual(todos["llamadores"], {
+            f"{__name__}.TestInstrumentacion.test_estadisticas_por_sentencia": 2
+        })
+        uno = self._estadistica(instrumentacion, "SELECT id FROM grupos_investigacion WHERE id = ?")
+        self.assertEqual(uno["filas"], 1)
+        self.assertEqual(self._estadistica(instrumentacion, "SELECT id FROM grupos_investigacion")["filas"], 8)
+        actualizar = self._estadistica(instrumentacion, "UPDATE grupos_investigacion SET campo = ? WHERE id = ?")
+        self.assertEqual(actualizar["filas"], 2)
+
+        instrumentacion.reiniciar()
+        self.assertEqual(instrumentacion.estadisticas(), [])
+
+    def test_llamador_es_el_metodo_del_servicio(self):
+        instrumentacion = self.db.instrumentar()
+        self.grupos.obtener_por_id(1)
+        llamadores = set()
+        for estadistica in instrumentacion.estadisticas():
+            llamadores.update(estadistica["llamadores"])
+        self.assertTrue(llamadores)
+        self.assertTrue(all(llamador.startswith("services.grupo_service.GrupoService.") for llamador in llamadores))
+
+    def test_llamador_con_trazas_activas(self):
+        instrumentacion = self.db.instrumentar()
+        with trazas.trazar():
+            SemilleroService(self.db).obtener_todos(prefetch=["objetivos"])
+        llamadores = set()
+        for estadistica in instrumentacion.estadisticas():
+            llamadores.update(estadistica["llamadores"])
+        self.assertIn("services.semillero_service.SemilleroService.obtener_todos", llamadores)
+        self.assertFalse(any("trazas" in llamador for llamador in llamadores))
+
+    def test_consultas_lentas_con_plan(self):
+        instrumentacion = self.db.instrumentar(umbral_lento=0, max_lentas=2)
+        self.db.execute_query("SELECT nombre FROM grupos_investigacion ORDER BY nombre", fetch='all')
+        self.db.execute_query("PRAGMA user_version", fetch='one')
+        self.db.execute_query("SELECT * FROM grupos_investigacion WHERE id = ?", (3,), fetch='one')
+
+        lentas = instrumentacion.lentas()
+        self.assertEqual(len(lentas), 2)  # Solo las más recientes
+        self.assertIsNone(lentas[0]["plan"])
+        self.assertEqual(lentas[1]["parametros"], [3])
+        self.assertEqual(len(lentas[1]["plan"]), 1)
+        self.assertTrue(lentas[1]["plan"][0].startswith("SEARCH grupos_investigacion"))
+
+    def test_observador(self):
+        instrumentacion = self.db.instrumentar()
+        vistas = []
+
+        def observador(sql, segundos, filas, llamador):
+            vistas.append((sql, filas))
+
+        instrumentacion.agregar_observador(observador)
+        self.db.execute_query("SELECT COUNT(*) FROM grupos_investigacion", fetch='one')
+        instrumentacion.quitar_observador(observador)
+        self.db.execute_query("SELECT 1", fetch='one')
+        self.assertEqual(vistas, [("SELECT COUNT(*) FROM grupos_investigacion", 1)])
+
+    def test_volcado(self):
+        instrumentacion = self.db.instrumentar(umbral_lento=0)
+        self.grupos.obtener_todos()
+        ruta = os.path.join(self.directorio, "volcado.json")
+        instrumentacion.volcar(ruta)
+
+        with open(ruta, encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        self.assertEqual(datos["umbral_lento_ms"], 0)
+        self.assertTrue(datos["consultas"])
+        self.assertIn("grupos_investigacion", formatear(datos))
+
+    def test_orden_no_valido(self):
+        with self.assertRaises(ValueError):
+            self.db.instrumentar().estadisticas(orden="x")
+
+
+if __name__ == "__main__":
+    unittest.main()
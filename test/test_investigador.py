@@ -30,4 +30,7 @@ class TestInvestigador(unittest.TestCase):
             email="smith@test.com",
             semillero_id=1
         )
-        self.assertEqual(investigador_tutor.tipo, "tutor")
\ No newline at end of file
+        self.assertEqual(investigador_tutor.tipo, "tutor")
+
+    def test_sin_dict_por_instancia(self):
+        self.assertFalse(hasattr(self.investigador, "__dict__"))
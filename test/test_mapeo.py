@@ -0,0 +1,74 @@
+import unittest
+
+from db.mapeo import compilar, mapear
+from models.entregable import Entregable
+from models.grupo import Grupo
+from models.semillero import Semillero
+from test.base import PruebaConBaseDeDatos
+
+
+class TestMapeo(unittest.TestCase):
+    def test_construye_por_posicion(self):
+        mapeador = compilar(Grupo, ("id", "nombre", "identificador"))
+        grupos = mapeador.todos([(1, "Uno", "COL1"), (2, "Dos", "COL2")])
+        self.assertEqual([(g.id, g.nombre, g.identificador) for g in grupos], [(1, "Uno", "COL1"), (2, "Dos", "COL2")])
+        self.assertEqual(grupos[0].director, "")
+
+    def test_renombra_asigna_atributos_e_ignora_columnas(self):
+        mapeador = compilar(
+            Semillero,
+            ("semillero_id", "nombre", "grupo_nombre", "actualizado_en"),
+            (("semillero_id", "id"),)
+        )
+        semillero = mapeador.uno((7, "Semillero", "Grupo", "2025-01-01"))
+        self.assertEqual(semillero.id, 7)
+        self.assertEqual(semillero.grupo_nombre, "Grupo")
+        self.assertEqual(semillero.objetivos_especificos, [])
+
+    def test_una_sola_columna(self):
+        self.assertEqual([g.nombre for g in compilar(Grupo, ("nombre",)).todos([("A",), ("B",)])], ["A", "B"])
+
+    def test_nombre_invalido(self):
+        with self.assertRaises(ValueError):
+            compilar(Grupo, ("id", "nombre); import os; ("))
+
+    def test_reutiliza_el_mapeador(self):
+        self.assertIs(compilar(Grupo, ("id", "nombre")), compilar(Grupo, ("id", "nombre")))
+
+
+class TestConsultarModelos(PruebaConBaseDeDatos):
+    def setUp(self):
+        super().setUp()
+        self.db.execute_many(
+            "INSERT INTO grupos_investigacion (nombre, campo, identificador) VALUES (?, 'Campo', ?)",
+            [(f"Grupo {i}", f"COL{i}") for i in range(3)]
+        )
+
+    def test_consultar_modelos(self):
+        query = "SELECT id, nombre, campo, identificador FROM grupos_investigacion ORDER BY id"
+        grupos = self.db.consultar_modelos(query, clase=Grupo)
+        self.assertEqual([g.identificador for g in grupos], ["COL0", "COL1", "COL2"])
+        self.assertEqual(len(self.db._mapeadores), 1)
+
+        self.db.consultar_modelos(query, clase=Grupo)
+        self.assertEqual(len(self.db._mapeadores), 1)
+
+        uno = self.db.consultar_modelos(query + " LIMIT 1", clase=Grupo, uno=True)
+        self.assertEqual(uno.nombre, "Grupo 0")
+        self.assertIsNone(self.db.consultar_modelos(
+            "SELECT id, nombre FROM grupos_investigacion WHERE id = ?", (999,), Grupo, uno=True
+        ))
+
+    def test_mapear_filas_row(self):
+        filas = self.db.execute_query(
+            "SELECT id, 'Título' AS titulo, 'Prototipo' AS tipo, 'x' AS semillero_nombre "
+            "FROM grupos_investigacion ORDER BY id", fetch='all'
+        )
+        entregables = mapear(filas, Entregable)
+        self.assertEqual(len(entregables), 3)
+        self.assertEqual(entregables[0].semillero_nombre, "x")
+        self.assertEqual(mapear([], Entregable), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
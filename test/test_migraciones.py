@@ -0,0 +1,132 @@
+import json
+import os
+import sqlite3
+import unittest
+
+from db.database import Database
+from db.migraciones import VERSION_ACTUAL, Migrador
+from test.base import PruebaConDirectorio
+
+# Esquema de las primeras versiones: sin objetivo principal, marcas de fecha
+# ni tabla de objetivos
+ESQUEMA_ANTIGUO = """
+    CREATE TABLE grupos_investigacion (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nombre TEXT NOT NULL,
+        facultad TEXT,
+        area_conocimiento TEXT,
+        director TEXT,
+        campo TEXT,
+        identificador TEXT
+    );
+    CREATE TABLE semilleros (
+        semillero_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nombre TEXT NOT NULL,
+        objetivos_especificos TEXT,
+        grupo_id INTEGER,
+        status TEXT DEFAULT 'pendiente',
+        FOREIGN KEY (grupo_id) REFERENCES grupos_investigacion(id)
+    );
+"""
+
+
+class TestMigraciones(PruebaConDirectorio):
+    def setUp(self):
+        super().setUp()
+        self.avance = []
+
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(ESQUEMA_ANTIGUO)
+        conn.execute("INSERT INTO grupos_investigacion (nombre) VALUES ('Grupo')")
+        conn.executemany(
+            "INSERT INTO semilleros (nombre, objetivos_especificos, grupo_id) VALUES (?, ?, 1)",
+            [(f"Semillero {numero}", json.dumps([f"Objetivo {numero}.1", f"Objetivo {numero}.2"]))
+             for numero in range(7)],
+        )
+        conn.commit()
+        conn.close()
+        self.db = Database(self.db_path, migrar=False)
+
+    def tearDown(self):
+        self.db.cerrar()
+
+    def _progreso(self, migracion, paso, hechos, total):
+        self.avance.append((migracion.version, hechos, total))
+
+    def _columnas(self, tabla):
+        return [fila[1] for fila in self.db.execute_query(f"PRAGMA table_info({tabla})", fetch='all')]
+
+    def test_base_nueva_en_version_actual(self):
+        db = Database(os.path.join(self.directorio, "nueva.db"))
+        try:
+            self.assertEqual(Migrador(db).version(), VERSION_ACTUAL)
+            self.assertEqual(Migrador(db).migrar(), [])
+        finally:
+            db.cerrar()
+
+    def test_actualiza_base_antigua(self):
+        self.db.cerrar()
+        self.db = Database(self.db_path)
+
+        self.assertEqual(Migrador(self.db).version(), VERSION_ACTUAL)
+        self.assertIn("objetivo_principal", self._columnas("semilleros"))
+        self.assertEqual(
+            self.db.execute_query("SELECT COUNT(*) FROM semillero_objetivos", fetch='one')[0], 14
+        )
+        pendientes = self.db.execute_query(
+            "SELECT COUNT(*) FROM semilleros WHERE creado_en IS NULL OR actualizado_en IS NULL "
+            "OR objetivos_especificos IS NOT NULL",
+            fetch='one',
+        )[0]
+        self.assertEqual(pendientes, 0)
+        # Los objetos derivados se crean después de las migraciones
+        self.assertEqual(self.db.execute_query("SELECT COUNT(*) FROM resumen_semilleros", fetch='one')[0], 1)
+
+    def test_rellenos_por_lotes_con_progreso(self):
+        Migrador(self.db, tamano_lote=3, progreso=self._progreso).migrar()
+        traslado = [(hechos, total) for version, hechos, total in self.avance if version == 3]
+        self.assertEqual(traslado, [(0, 7), (3, 7), (6, 7), (7, 7)])
+
+    def test_simular_no_modifica(self):
+        pendientes = Migrador(self.db, progreso=self._progreso).migrar(simular=True)
+
+        self.assertEqual([version for version, _, _ in pendientes], list(range(1, VERSION_ACTUAL + 1)))
+        self.assertIn("Agregar la columna semilleros.objetivo_principal", pendientes[0][2])
+        self.assertEqual(Migrador(self.db).version(), 0)
+        self.assertNotIn("objetivo_principal", self._columnas("semilleros"))
+        self.assertEqual(self.avance, [])
+
+    def test_hasta_una_version(self):
+        aplicadas = Migrador(self.db, progreso=None).migrar(hasta=2)
+        self.assertEqual([version for version, _, _ in aplicadas], [1, 2])
+        self.assertEqual(Migrador(self.db).version(), 2)
+        self.assertNotIn("creado_en", self._columnas("semilleros"))
+
+    def test_reanuda_relleno_interrumpido(self):
+        def interrumpir(migracion, paso, hechos, total):
+            if migracion.version == 3 and hechos > 0:
+                raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            Migrador(self.db, tamano_lote=3, progreso=interrumpir).migrar()
+
+        # El primer lote quedó confirmado, pero la versión no avanzó
+        self.assertEqual(Migrador(self.db).version(), 2)
+        self.assertEqual(
+            self.db.execute_query("SELECT COUNT(*) FROM semillero_objetivos", fetch='one')[0], 6
+        )
+
+        Migrador(self.db, tamano_lote=3, progreso=self._progreso).migrar()
+        self.assertIn((3, 0, 4), self.avance)
+        self.assertEqual(Migrador(self.db).version(), VERSION_ACTUAL)
+        objetivos = self.db.execute_query(
+            "SELECT objetivo FROM semillero_objetivos WHERE semillero_id = 1 ORDER BY posicion", fetch='all'
+        )
+        self.assertEqual([fila[0] for fila in objetivos], ["Objetivo 0.1", "Objetivo 0.2"])
+        self.assertEqual(
+            self.db.execute_query("SELECT COUNT(*) FROM semillero_objetivos", fetch='one')[0], 14
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.paginacion import codificar_cursor
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestPaginacion(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.service = SemilleroService(self.db)
+
+        # Nombres repetidos para comprobar el desempate por ID
+        self.db.execute_many(
+            "INSERT INTO semilleros (nombre, objetivo_principal, objetivos_especificos, grupo_id) "
+            "VALUES (?, 'Objetivo', '[]', 1)",
+            [(f"Semillero {i % 40:02d}",) for i in range(125)]
+        )
+        self.db.execute_many(
+            "INSERT INTO investigadores (nombre, tipo, semillero_id) VALUES (?, 'estudiante', ?)",
+            [(f"Estudiante {i}", i) for i in range(1, 126)]
+        )
+
+    def test_recorre_todas_las_paginas(self):
+        vistos = []
+        cursor = None
+        paginas = 0
+        while True:
+            semilleros, cursor = self.service.obtener_pagina(tamano=20, cursor=cursor)
+            paginas += 1
+            self.assertLessEqual(len(semilleros), 20)
+            for semillero in semilleros:
+                self.assertEqual(len(semillero.estudiantes), 1)
+            vistos.extend(semilleros)
+            if cursor is None:
+                break
+
+        self.assertEqual(paginas, 7)
+        self.assertEqual(len({s.id for s in vistos}), 125)
+        claves = [(s.nombre, s.id) for s in vistos]
+        self.assertEqual(claves, sorted(claves))
+
+    def test_pagina_exacta_sin_cursor_siguiente(self):
+        semilleros, cursor = self.service.obtener_pagina(tamano=125)
+        self.assertEqual(len(semilleros), 125)
+        self.assertIsNone(cursor)
+
+    def test_cursor_invalido(self):
+        with self.assertRaises(ValueError):
+            self.service.obtener_pagina(cursor="no-es-un-cursor")
+        with self.assertRaises(ValueError):
+            self.service.obtener_pagina(cursor=codificar_cursor(["solo un valor"]))
+        with self.assertRaises(ValueError):
+            self.service.obtener_pagina(cursor=codificar_cursor([{"a": 1}, 2]))
+        with self.assertRaises(ValueError):
+            self.service.obtener_pagina(cursor=codificar_cursor(["Semillero", [1]]))
+        with self.assertRaises(ValueError):
+            self.service.obtener_pagina(tamano=0)
+
+    def test_consulta_de_pagina_usa_indice(self):
+        query = """
+            EXPLAIN QUERY PLAN
+            SELECT s.semillero_id FROM semilleros s
+            WHERE (s.nombre, s.semillero_id) > (?, ?)
+            ORDER BY s.nombre, s.semillero_id LIMIT 21
+        """
+        plan = [fila['detail'] for fila in self.db.execute_query(query, ("Semillero 10", 5), fetch='all')]
+        self.assertTrue(any("idx_semilleros_nombre" in paso for paso in plan), plan)
+        self.assertFalse(any("TEMP B-TREE" in paso for paso in plan), plan)
+
+    def test_grupos_y_entregables(self):
+        grupos, cursor = GrupoService(self.db).obtener_pagina(tamano=5)
+        self.assertEqual(len(grupos), 5)
+        resto, cursor = GrupoService(self.db).obtener_pagina(tamano=5, cursor=cursor)
+        self.assertEqual(len(resto), 3)
+        self.assertIsNone(cursor)
+
+        self.db.execute_many(
+            "INSERT INTO entregables (titulo, descripcion, tipo, semillero_id) VALUES (?, 'D', 'Prototipo', ?)",
+            [(f"Entregable {i}", i) for i in range(1, 11)]
+        )
+        entregables, cursor = EntregableService(self.db).obtener_pagina(tamano=6)
+        self.assertEqual(len(entregables), 6)
+        self.assertIsNotNone(entregables[0].semillero_nombre)
+        resto, _ = EntregableService(self.db).obtener_pagina(tamano=6, cursor=cursor)
+        self.assertEqual(len(resto), 4)
+
+        propios, _ = EntregableService(self.db).obtener_pagina(semillero_id=3)
+        self.assertEqual([e.semillero_id for e in propios], [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+
+from db.database import Database
+from db.esquema import INDICES, sql_conteo_resumen
+from models.entregable import Entregable
+from models.semillero import Semillero
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.reports import REPORTES
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class DatabaseRegistro(Database):
+    """Database que registra cada sentencia ejecutada por los servicios"""
+
+    def __init__(self, *args, **kwargs):
+        self.consultas = []
+        super().__init__(*args, **kwargs)
+
+    def execute_query(self, query, params=None, fetch=None, **kwargs):
+        self.consultas.append((query, params))
+        return super().execute_query(query, params, fetch, **kwargs)
+
+    def execute_many(self, query, params_list):
+        params_list = list(params_list)
+        if params_list:
+            self.consultas.append((query, params_list[0]))
+        return super().execute_many(query, params_list)
+
+
+class TestPlanesDeConsulta(PruebaConBaseDeDatos):
+    """Verifica con EXPLAIN QUERY PLAN que las rutas de búsqueda usan índices"""
+
+    clase_db = DatabaseRegistro
+
+    def setUp(self):
+        super().setUp()
+        self.grupo_service = GrupoService(self.db)
+        self.semillero_service = SemilleroService(self.db)
+        self.entregable_service = EntregableService(self.db)
+
+        self.grupo_service.cargar_datos_iniciales()
+        semillero = Semillero(
+            nombre="Semillero Plan",
+            objetivo_principal="Objetivo",
+            objetivos_especificos=["Objetivo 1"],
+            grupo_id=1
+        )
+        semillero.estudiantes = ["Ana", "Luis"]
+        semillero.tutores = ["Dra. Rojas"]
+        self.semillero_id, _ = self.semillero_service.crear_semillero(semillero)
+
+        # Sin ANALYZE: con tablas de pocas filas el planificador preferiría un
+        # SCAN; sin estadísticas asume tablas grandes, como en producción
+        self.db.consultas.clear()
+
+    def _capturar(self, operacion):
+        """Ejecuta la operación y retorna las sentencias que emitió"""
+        self.db.consultas.clear()
+        operacion()
+        return list(self.db.consultas)
+
+    def _plan(self, query, params):
+        filas = self.db.execute_query("EXPLAIN QUERY PLAN " + query, params, fetch='all')
+        return [fila['detail'] for fila in filas]
+
+    def assertSinScan(self, operacion):
+        consultas = self._capturar(operacion)
+        self.assertTrue(consultas, "La operación no emitió ninguna consulta")
+        for query, params in consultas:
+            if query.lstrip().upper().startswith(("INSERT", "PRAGMA")):
+                continue
+            plan = self._plan(query, params)
+            scans = [paso for paso in plan if paso.startswith("SCAN")]
+            self.assertEqual(scans, [], f"SCAN en ruta crítica:\n{query}\nPlan: {plan}")
+
+    def test_indices_declarados_existen(self):
+        filas = self.db.execute_query(
+            "SELECT name FROM sqlite_master WHERE type = 'index'", fetch='all'
+        )
+        existentes = {fila['name'] for fila in filas}
+        for nombre in INDICES:
+            self.assertIn(nombre, existentes)
+
+    def test_identificador_es_unico(self):
+        with self.assertRaises(Exception):
+            self.grupo_service.crear_grupo(self.grupo_service.obtener_por_id(1))
+
+    def test_grupo_por_id(self):
+        self.assertSinScan(lambda: self.grupo_service.obtener_por_id(1))
+
+    def test_grupo_por_identificador(self):
+        self.assertSinScan(lambda: self.grupo_service.obtener_por_identificador("COL0007814"))
+
+    def test_semillero_por_id(self):
+        self.assertSinScan(lambda: self.semillero_service.obtener_por_id(self.semillero_id))
+
+    def test_semilleros_por_grupo(self):
+        self.assertSinScan(lambda: self.semillero_service.obtener_por_grupo(1))
+
+    def test_semilleros_por_objetivo(self):
+        self.assertSinScan(lambda: self.semillero_service.obtener_por_objetivo("Objetivo 1"))
+
+    def test_filtrar_semilleros(self):
+        # Los pendientes de un grupo se leen del índice parcial, ya ordenados por nombre
+        self.assertSinScan(lambda: self.semillero_service.filtrar(status="pendiente", grupo_id=1))
+        self.assertSinScan(lambda: self.semillero_service.filtrar(status="activo", grupo_id=1))
+        self.assertSinScan(lambda: self.semillero_service.filtrar(tutor="Dra. Rojas"))
+        self.assertSinScan(lambda: self.semillero_service.filtrar(objetivo="Objetivo 1"))
+
+        consultas = self._capturar(lambda: self.semillero_service.filtrar(status="pendiente", grupo_id=1))
+        plan = self._plan(*consultas[0])
+        self.assertIn("SEARCH s USING INDEX idx_semilleros_pendientes (grupo_id=?)", plan)
+        self.assertFalse([paso for paso in plan if "TEMP B-TREE" in paso], plan)
+
+    def test_cargar_investigadores(self):
+        semillero = Semillero(id=self.semillero_id)
+        self.assertSinScan(lambda: self.semillero_service._cargar_investigadores(semillero))
+
+    def test_cambiar_status(self):
+        self.assertSinScan(lambda: self.semillero_service.cambiar_status(self.semillero_id, "activo"))
+
+    def test_editar_semillero(self):
+        self.assertSinScan(lambda: self.semillero_service.editar_semillero(
+            self.semillero_id, "Otro nombre", "Objetivo", ["Objetivo 1"], 1, "activo"
+        ))
+
+    def test_eliminar_semillero(self):
+        self.assertSinScan(lambda: self.semillero_service.eliminar_semillero(self.semillero_id))
+
+    def test_entregables(self):
+        entregable = Entregable(
+            titulo="Artículo", descripcion="Descripción", tipo="Artículo científico",
+            semillero_id=self.semillero_id
+        )
+        self.assertSinScan(lambda: self.entregable_service.crear_entregable(entregable))
+        self.assertSinScan(lambda: self.entregable_service.obtener_por_semillero(self.semillero_id))
+        self.assertSinScan(lambda: self.entregable_service.cambiar_estado(entregable.id, "aprobado"))
+
+    def test_reporte_entregables_por_tipo(self):
+        # El reporte lee la tabla de resumen en el orden de su clave, sin tocar entregables
+        plan = self._plan(REPORTES["entregables_por_tipo"][1], None)
+        self.assertEqual(plan, ["SCAN r"])
+
+    def test_verificar_resumen_entregables(self):
+        # El conteo completo agrupa recorriendo solo el índice
+        plan = self._plan(sql_conteo_resumen("resumen_entregables"), None)
+        self.assertIn("SCAN entregables USING COVERING INDEX idx_entregables_tipo_estado", plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import csv
+import os
+import unittest
+from unittest import mock
+
+from services.reports import REPORTES, ReporteService
+from test.base import PruebaConBaseDeDatos
+
+CONSULTA_LENTA = """
+    WITH RECURSIVE contador(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM contador)
+    SELECT COUNT(*) FROM contador
+"""
+
+
+class TestReporteService(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.service = ReporteService(self.db)
+
+        semilleros = [
+            (1, "Alfa", 1, "activo"),
+            (2, "Beta", 1, "activo"),
+            (3, "Gamma", 1, "pendiente"),
+            (4, "Delta", 2, "activo"),
+            (5, "Épsilon", None, "pendiente"),
+        ]
+        self.db.execute_many(
+            "INSERT INTO semilleros (semillero_id, nombre, grupo_id, status) VALUES (?, ?, ?, ?)", semilleros
+        )
+        investigadores = [
+            ("Ana", "estudiante", 1), ("Luis", "estudiante", 1), ("Dra. Rojas", "tutor", 1),
+            ("Eva", "estudiante", 2), ("dra. rojas", "tutor", 2),
+            ("Dr. Pérez", "tutor", 4),
+        ]
+        self.db.execute_many(
+            "INSERT INTO investigadores (nombre, tipo, semillero_id) VALUES (?, ?, ?)", investigadores
+        )
+        entregables = [
+            ("Informe", "Informe de avance", 1, "pendiente"),
+            ("Artículo", "Artículo científico", 2, "aprobado"),
+            ("Póster", "Póster", 4, "pendiente"),
+        ]
+        self.db.execute_many(
+            "INSERT INTO entregables (titulo, tipo, semillero_id, estado) VALUES (?, ?, ?, ?)", entregables
+        )
+
+    def test_semilleros_por_grupo(self):
+        reporte = self.service.generar("semilleros_por_grupo")
+        conteos = {(fila["grupo_id"], fila["estado"]): fila["semilleros"] for fila in reporte.como_diccionarios()}
+        self.assertEqual(conteos, {(1, "activo"): 2, (1, "pendiente"): 1, (2, "activo"): 1, (None, "pendiente"): 1})
+
+    def test_entregables_por_tipo(self):
+        reporte = self.service.generar("entregables_por_tipo")
+        self.assertEqual(reporte.columnas, ("tipo", "estado", "entregables"))
+        self.assertEqual(reporte.filas, (
+            ("Artículo científico", "aprobado", 1),
+            ("Informe de avance", "pendiente", 1),
+            ("Póster", "pendiente", 1),
+        ))
+
+    def test_investigadores_por_semillero(self):
+        reporte = self.service.generar("investigadores_por_semillero")
+        filas = {fila["semillero"]: (fila["estudiantes"], fila["tutores"], fila["total"])
+                 for fila in reporte.como_diccionarios()}
+        self.assertEqual(filas["Alfa"], (2, 1, 3))
+        self.assertEqual(filas["Beta"], (1, 1, 2))
+        # Los semilleros sin investigadores también aparecen
+        self.assertEqual(filas["Gamma"], (0, 0, 0))
+        self.assertEqual(len(reporte), 5)
+
+    def test_carga_tutores(self):
+        reporte = self.service.generar("carga_tutores")
+        filas = reporte.como_diccionarios()
+        # El mismo tutor con distinta capitalización cuenta como uno
+        self.assertEqual(len(filas), 2)
+        self.assertEqual(filas[0]["semilleros"], 2)
+        self.assertEqual(filas[0]["estudiantes"], 3)
+        self.assertEqual(filas[0]["entregables_pendientes"], 1)
+        self.assertEqual((filas[1]["tutor"], filas[1]["semilleros"]), ("Dr. Pérez", 1))
+
+    def test_cache(self):
+        primero = self.service.generar("entregables_por_tipo")
+        self.db.execute_query(
+            "INSERT INTO entregables (titulo, tipo, semillero_id, estado) VALUES ('Otro', 'Póster', 3, 'pendiente')"
+        )
+        self.assertIs(self.service.generar("entregables_por_tipo"), primero)
+
+        actualizado = self.service.generar("entregables_por_tipo", usar_cache=False)
+        self.assertIn(("Póster", "pendiente", 2), actualizado.filas)
+        self.assertIs(self.service.generar("entregables_por_tipo"), actualizado)
+
+    def test_reporte_no_valido(self):
+        with self.assertRaises(ValueError):
+            self.service.generar("inexistente")
+
+    def test_tiempo_maximo(self):
+        with mock.patch.dict(REPORTES, {"lento": ("Consulta que no termina", CONSULTA_LENTA)}):
+            with self.assertRaises(TimeoutError):
+                self.service.generar("lento", tiempo_maximo=0.05)
+
+        # La conexión vuelve al pool sin el límite
+        self.assertEqual(self.db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0], 5)
+
+    def test_exportar_csv(self):
+        ruta = os.path.join(self.directorio, "tutores.csv")
+        self.service.exportar("carga_tutores", ruta)
+
+        with open(ruta, encoding="utf-8", newline="") as archivo:
+            filas = list(csv.reader(archivo))
+        self.assertEqual(filas[0], ["tutor", "semilleros", "estudiantes", "entregables_pendientes"])
+        self.assertEqual(len(filas), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
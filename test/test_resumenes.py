@@ -0,0 +1,97 @@
+import unittest
+
+from db.database import Database
+from models.semillero import Semillero
+from services.resumenes import ResumenService
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestResumenes(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.semilleros = SemilleroService(self.db)
+        self.service = ResumenService(self.db)
+
+    def _crear(self, nombre, grupo_id=1, estudiantes=("Ana", "Luis")):
+        semillero = Semillero(
+            nombre=nombre, objetivo_principal="Objetivo", objetivos_especificos=["Objetivo 1"], grupo_id=grupo_id
+        )
+        semillero.estudiantes = list(estudiantes)
+        semillero.tutores = ["Dra. Rojas"]
+        semillero_id, errores = self.semilleros.crear_semillero(semillero)
+        self.assertEqual(errores, [])
+        return semillero_id
+
+    def _sin_diferencias(self):
+        for nombre, diferencias in self.service.verificar().items():
+            self.assertEqual(diferencias, [], nombre)
+
+    def test_insertar_modificar_eliminar(self):
+        alfa = self._crear("Alfa", estudiantes=("Ana", "Luis", "Eva"))
+        beta = self._crear("Beta")
+        self._crear("Gamma", grupo_id=2)
+
+        self.assertEqual(self.service.contar("resumen_semilleros", grupo_id=1), 2)
+        self.assertEqual(self.service.contar("resumen_semilleros", status="pendiente"), 3)
+        self.assertEqual(self.service.contar("resumen_investigadores", semillero_id=alfa, tipo="estudiante"), 3)
+
+        self.semilleros.cambiar_status(beta, "activo")
+        self.assertEqual(self.service.contar("resumen_semilleros", grupo_id=1, status="activo"), 1)
+        self.assertEqual(self.service.contar("resumen_semilleros", grupo_id=1, status="pendiente"), 1)
+
+        self.semilleros.eliminar_semillero(alfa)
+        self.assertEqual(self.service.contar("resumen_semilleros", grupo_id=1), 1)
+        self.assertEqual(self.service.contar("resumen_investigadores", semillero_id=alfa), 0)
+        # Las combinaciones que llegan a cero se eliminan del resumen
+        self.assertNotIn((alfa, "estudiante"), self.service.conteos("resumen_investigadores"))
+        self._sin_diferencias()
+
+    def test_entregables_y_nulos(self):
+        semillero_id = self._crear("Alfa")
+        self.db.execute_many(
+            "INSERT INTO entregables (titulo, tipo, semillero_id, estado) VALUES (?, ?, ?, ?)",
+            [("A", "Póster", semillero_id, "pendiente"), ("B", "Póster", semillero_id, None)],
+        )
+        self.db.execute_query("UPDATE entregables SET estado = 'aprobado' WHERE titulo = 'A'")
+
+        self.assertEqual(self.service.conteos("resumen_entregables"), {("Póster", "aprobado"): 1, ("Póster", ""): 1})
+        self.assertEqual(self.service.contar("resumen_entregables", tipo="Póster"), 2)
+        self._sin_diferencias()
+
+    def test_verificar_y_reconstruir(self):
+        self._crear("Alfa")
+        self._crear("Beta")
+        self.db.execute_query("UPDATE resumen_semilleros SET cantidad = 7")
+        self.db.execute_query("DELETE FROM resumen_investigadores")
+
+        diferencias = self.service.verificar()
+        self.assertEqual(diferencias["resumen_semilleros"], [((1, "pendiente"), 2, 7)])
+        self.assertEqual(len(diferencias["resumen_investigadores"]), 4)
+        self.assertEqual(diferencias["resumen_entregables"], [])
+
+        self.service.reconstruir()
+        self._sin_diferencias()
+        self.assertEqual(self.service.contar("resumen_semilleros"), 2)
+
+    def test_carga_inicial_en_base_existente(self):
+        self._crear("Alfa")
+        self.db.execute_query("DROP TABLE resumen_semilleros")
+        self.db.cerrar()
+
+        # Al abrir la base de datos se crea el resumen con los datos existentes
+        self.db = Database(self.db_path)
+        self.service = ResumenService(self.db)
+        self.assertEqual(self.service.contar("resumen_semilleros", grupo_id=1), 1)
+
+    def test_claves_no_validas(self):
+        with self.assertRaises(ValueError):
+            self.service.contar("resumen_semilleros", tipo="x")
+        with self.assertRaises(ValueError):
+            self.service.contar("inexistente")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,4 +35,22 @@ class TestSemillero(unittest.TestCase):
         detalles = self.semillero.detalles()
         self.assertIn("NOMBRE: Semillero Test", detalles)
         self.assertIn("ESTADO: PENDIENTE", detalles)
-        self.assertIn("OBJETIVO PRINCIPAL: Objetivo principal de prueba", detalles)
\ No newline at end of file
+        self.assertIn("OBJETIVO PRINCIPAL: Objetivo principal de prueba", detalles)
+
+    def test_sin_dict_por_instancia(self):
+        self.assertFalse(hasattr(self.semillero, "__dict__"))
+
+    def test_relaciones_diferidas(self):
+        cargas = []
+
+        def cargar(relacion):
+            cargas.append(relacion)
+            self.semillero.estudiantes = ["Ana", "Luis"]
+            self.semillero.tutores = ["Dra. Rojas"]
+
+        self.semillero.diferir(cargar, ["investigadores"])
+        self.assertFalse(self.semillero.cargado("investigadores"))
+        self.assertEqual(cargas, [])
+        self.assertEqual(len(self.semillero.estudiantes), 2)
+        self.assertEqual(len(self.semillero.tutores), 1)
+        self.assertEqual(cargas, ["investigadores"])
@@ -0,0 +1,224 @@
+import tracemalloc
+import unittest
+from datetime import date
+
+from models.semillero import Semillero
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestSemilleroService(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.service = SemilleroService(self.db)
+
+    def _nuevo_semillero(self, nombre="Semillero Test"):
+        semillero = Semillero(
+            nombre=nombre,
+            objetivo_principal="Objetivo principal",
+            objetivos_especificos=["Objetivo 1", "Objetivo 2"],
+            grupo_id=1
+        )
+        semillero.estudiantes = [
+            {"nombre": "Ana", "email": "ana@test.com"},
+            {"nombre": "Luis", "email": "luis@test.com"},
+        ]
+        semillero.tutores = [{"nombre": "Dra. Rojas", "email": "rojas@test.com"}]
+        return semillero
+
+    def _contar(self, tabla):
+        return self.db.execute_query(f"SELECT COUNT(*) FROM {tabla}", fetch='one')[0]
+
+    def test_crear_semillero(self):
+        semillero_id, errores = self.service.crear_semillero(self._nuevo_semillero())
+        self.assertEqual(errores, [])
+        self.assertIsNotNone(semillero_id)
+        self.assertEqual(self._contar("semilleros"), 1)
+        self.assertEqual(self._contar("investigadores"), 3)
+
+    def test_crear_semillero_es_atomico(self):
+        # Si falla el guardado de los tutores no debe quedar nada escrito
+        original = self.service._guardar_investigadores
+
+        def guardar_con_fallo(semillero_id, investigadores, tipo):
+            if tipo == "tutor":
+                raise RuntimeError("fallo al guardar tutores")
+            original(semillero_id, investigadores, tipo)
+
+        self.service._guardar_investigadores = guardar_con_fallo
+        with self.assertRaises(RuntimeError):
+            self.service.crear_semillero(self._nuevo_semillero())
+
+        self.assertEqual(self._contar("semilleros"), 0)
+        self.assertEqual(self._contar("investigadores"), 0)
+
+    def test_editar_semillero(self):
+        semillero_id, _ = self.service.crear_semillero(self._nuevo_semillero())
+        exito = self.service.editar_semillero(
+            semillero_id, "Nuevo nombre", "Nuevo objetivo", ["Otro objetivo"], 2, "activo"
+        )
+        self.assertTrue(exito)
+        fila = self.db.execute_query(
+            "SELECT nombre, status FROM semilleros WHERE semillero_id = ?", (semillero_id,), fetch='one'
+        )
+        self.assertEqual(fila['nombre'], "Nuevo nombre")
+        self.assertEqual(fila['status'], "activo")
+        self.assertEqual(self.service.obtener_por_id(semillero_id).objetivos_especificos, ["Otro objetivo"])
+        self.assertFalse(self.service.editar_semillero(9999, "x", "y", ["z"], 1, "activo"))
+
+    def test_obtener_por_objetivo(self):
+        primero, _ = self.service.crear_semillero(self._nuevo_semillero("B"))
+        otro = self._nuevo_semillero("A")
+        otro.objetivos_especificos = ["objetivo 2", "Objetivo 3"]
+        segundo, _ = self.service.crear_semillero(otro)
+
+        encontrados = self.service.obtener_por_objetivo("Objetivo 2")
+        self.assertEqual([s.id for s in encontrados], [segundo, primero])
+        self.assertEqual(encontrados[0].objetivos_especificos, ["objetivo 2", "Objetivo 3"])
+        self.assertEqual([s.id for s in self.service.obtener_por_objetivo("Objetivo 1")], [primero])
+        self.assertEqual(self.service.obtener_por_objetivo("Objetivo"), [])
+
+    def test_filtrar(self):
+        ids = {}
+        for nombre, grupo_id, tutor in (("C", 1, "Dra. Rojas"), ("A", 1, "Dr. Pérez"), ("B", 2, "Dra. Rojas")):
+            semillero = self._nuevo_semillero(nombre)
+            semillero.grupo_id = grupo_id
+            semillero.tutores = [{"nombre": tutor, "email": ""}]
+            ids[nombre], _ = self.service.crear_semillero(semillero)
+        self.service.cambiar_status(ids["B"], "activo")
+        self.db.execute_query("UPDATE semilleros SET creado_en = '2024-06-01 10:00:00.000' WHERE nombre = 'C'")
+
+        def nombres(**filtros):
+            return [s.nombre for s in self.service.filtrar(**filtros)]
+
+        self.assertEqual(nombres(), ["A", "B", "C"])
+        self.assertEqual(nombres(status="pendiente", grupo_id=1), ["A", "C"])
+        self.assertEqual(nombres(status=["activo", "pendiente"], grupo_id=2), ["B"])
+        self.assertEqual(nombres(tutor="dra. rojas"), ["B", "C"])
+        self.assertEqual(nombres(tutor="dra. rojas", status="pendiente"), ["C"])
+        self.assertEqual(nombres(objetivo="objetivo 1", grupo_id=2), ["B"])
+        self.assertEqual(nombres(creado_hasta="2025-01-01"), ["C"])
+        self.assertEqual(nombres(creado_desde=date(2025, 1, 1), orden="nombre", descendente=True), ["B", "A"])
+        self.assertEqual(nombres(orden="creado_en", limite=1), ["C"])
+
+        semillero = self.service.filtrar(grupo_id=2)[0]
+        self.assertEqual(semillero.grupo_nombre, "GRUPO DE INVESTIGACIÓN EN AMBIENTES SOSTENIBLES")
+        self.assertEqual(len(semillero.estudiantes), 2)
+
+        with self.assertRaises(ValueError):
+            self.service.filtrar(status="archivado")
+        with self.assertRaises(ValueError):
+            self.service.filtrar(orden="grupo")
+
+    def test_eliminar_semillero(self):
+        semillero_id, _ = self.service.crear_semillero(self._nuevo_semillero())
+        self.assertTrue(self.service.eliminar_semillero(semillero_id))
+        self.assertEqual(self._contar("semilleros"), 0)
+        self.assertEqual(self._contar("semillero_objetivos"), 0)
+        self.assertEqual(self._contar("investigadores"), 0)
+        self.assertFalse(self.service.eliminar_semillero(semillero_id))
+
+    def test_obtener_todos_carga_investigadores_en_lote(self):
+        for i in range(5):
+            self.service.crear_semillero(self._nuevo_semillero(f"Semillero {i}"))
+
+        consultas = []
+        original = self.db.execute_query
+
+        def contar(query, params=None, fetch=None, **kwargs):
+            consultas.append(query)
+            return original(query, params, fetch, **kwargs)
+
+        self.db.execute_query = contar
+        semilleros = self.service.obtener_todos()
+
+        self.assertEqual(len(semilleros), 5)
+        self.assertEqual(len(consultas), 1)  # las relaciones se cargan al primer acceso
+        for semillero in semilleros:
+            self.assertEqual([e.nombre for e in semillero.estudiantes], ["Ana", "Luis"])
+            self.assertEqual([t.nombre for t in semillero.tutores], ["Dra. Rojas"])
+            self.assertEqual(semillero.objetivos_especificos, ["Objetivo 1", "Objetivo 2"])
+        self.assertEqual(len(consultas), 3)  # semilleros + investigadores + objetivos
+
+    def test_prefetch(self):
+        for i in range(3):
+            self.service.crear_semillero(self._nuevo_semillero(f"Semillero {i}"))
+
+        consultas = []
+        original = self.db.execute_query
+
+        def contar(query, params=None, fetch=None, **kwargs):
+            consultas.append(query)
+            return original(query, params, fetch, **kwargs)
+
+        self.db.execute_query = contar
+        semilleros = self.service.obtener_todos(prefetch=["investigadores"])
+        self.assertEqual(len(consultas), 2)
+        self.assertTrue(all(s.cargado("investigadores") and not s.cargado("objetivos") for s in semilleros))
+
+        self.service.prefetch(semilleros)
+        self.assertEqual(len(consultas), 3)
+        self.assertEqual(semilleros[2].objetivos_especificos, ["Objetivo 1", "Objetivo 2"])
+        self.assertEqual(len(consultas), 3)
+
+        with self.assertRaises(ValueError):
+            self.service.obtener_todos(prefetch=["entregables"])
+
+    def test_obtener_por_id_y_por_grupo(self):
+        semillero_id, _ = self.service.crear_semillero(self._nuevo_semillero())
+
+        semillero = self.service.obtener_por_id(semillero_id)
+        self.assertEqual(semillero.id, semillero_id)
+        self.assertEqual(semillero.objetivos_especificos, ["Objetivo 1", "Objetivo 2"])
+        self.assertEqual(len(semillero.estudiantes), 2)
+        self.assertIsNotNone(semillero.grupo_nombre)
+
+        por_grupo = self.service.obtener_por_grupo(1)
+        self.assertEqual([s.id for s in por_grupo], [semillero_id])
+        self.assertEqual(len(por_grupo[0].tutores), 1)
+        self.assertEqual(self.service.obtener_por_grupo(2), [])
+
+    def test_iter_todos(self):
+        for i in range(7):
+            self.service.crear_semillero(self._nuevo_semillero(f"Semillero {i}"))
+
+        iterador = self.service.iter_todos(tamano_lote=3)
+        primero = next(iterador)
+        self.assertEqual(primero.nombre, "Semillero 0")
+        self.assertEqual(len(primero.estudiantes), 2)
+
+        resto = list(iterador)
+        self.assertEqual([s.nombre for s in resto], [f"Semillero {i}" for i in range(1, 7)])
+        self.assertTrue(all(len(s.tutores) == 1 for s in resto))
+
+        # Al agotarse el generador las conexiones vuelven al pool
+        estadisticas = self.db.pool.estadisticas()
+        self.assertEqual(estadisticas["libres"], estadisticas["creadas"])
+
+    def test_iter_todos_memoria_acotada(self):
+        self.db.execute_many(
+            "INSERT INTO semilleros (nombre, objetivo_principal, objetivos_especificos, grupo_id) "
+            "VALUES (?, ?, '[\"Objetivo\"]', 1)",
+            [(f"Semillero {i:05d}", "x" * 200) for i in range(5000)]
+        )
+
+        def pico(operacion):
+            tracemalloc.start()
+            operacion()
+            _, maximo = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return maximo
+
+        def recorrer():
+            for _ in self.service.iter_todos(tamano_lote=200):
+                pass
+
+        pico_lista = pico(self.service.obtener_todos)
+        pico_iterador = pico(recorrer)
+        self.assertLess(pico_iterador * 4, pico_lista)
+
+
+if __name__ == "__main__":
+    unittest.main()
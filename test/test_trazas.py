@@ -0,0 +1,97 @@
+import json
+import os
+import unittest
+
+from db.database import Database
+from models.entregable import Entregable
+from models.semillero import Semillero
+from services import trazas
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+from test.base import PruebaConBaseDeDatos
+
+
+class TestTrazas(PruebaConBaseDeDatos):
+    cargar_grupos = True
+
+    def setUp(self):
+        super().setUp()
+        self.semilleros = SemilleroService(self.db)
+        self.entregables = EntregableService(self.db)
+
+        for numero in range(3):
+            semillero = Semillero(
+                nombre=f"Semillero {numero}", objetivo_principal="Objetivo",
+                objetivos_especificos=["Objetivo 1"], grupo_id=1,
+            )
+            semillero.estudiantes = ["Ana", "Luis"]
+            semillero.tutores = ["Dra. Rojas"]
+            self.semilleros.crear_semillero(semillero)
+
+    def tearDown(self):
+        trazas.desactivar()
+
+    def _spans(self, trazador, nombre):
+        return [evento for evento in trazador.eventos() if evento["name"] == nombre]
+
+    def test_sin_trazador_no_hay_envolturas(self):
+        original = vars(SemilleroService)["obtener_todos"]
+        with trazas.trazar():
+            self.assertIsNot(vars(SemilleroService)["obtener_todos"], original)
+            # Los generadores no se instrumentan
+            self.assertFalse(hasattr(vars(SemilleroService)["iter_todos"], "__wrapped__"))
+        self.assertIs(vars(SemilleroService)["obtener_todos"], original)
+        self.assertFalse(hasattr(vars(Database)["execute_query"], "__wrapped__"))
+        self.assertIsNone(trazas.activo())
+
+    def test_spans_anidados_con_desglose(self):
+        with trazas.trazar() as trazador:
+            self.semilleros.obtener_todos(prefetch=["objetivos", "investigadores"])
+
+        (raiz,) = self._spans(trazador, "SemilleroService.obtener_todos")
+        hijos = [
+            evento for evento in trazador.eventos()
+            if evento is not raiz and raiz["ts"] <= evento["ts"] <= raiz["ts"] + raiz["dur"]
+        ]
+        nombres = {evento["name"] for evento in hijos}
+        self.assertLessEqual({
+            "Database.consultar_modelos", "Database.execute_query",
+            "SemilleroService._cargar_objetivos_lote", "SemilleroService._cargar_investigadores_lote",
+        }, nombres)
+        consulta = self._spans(trazador, "Database.consultar_modelos")[0]
+        self.assertIn("FROM semilleros s", consulta["args"]["sql"])
+
+        resumen = {nombre: (cantidad, total, propio) for nombre, cantidad, total, propio in trazador.resumen()}
+        cantidad, total, propio = resumen["SemilleroService.obtener_todos"]
+        self.assertEqual(cantidad, 1)
+        self.assertLess(propio, total)
+        self.assertEqual(resumen["Database.execute_query"][0], 3)
+        self.assertIn("SemilleroService.obtener_todos", trazador.formatear_resumen())
+
+    def test_crear_entregable(self):
+        semillero_id = self.semilleros.obtener_todos()[0].id
+        with trazas.trazar() as trazador:
+            self.entregables.crear_entregable(Entregable(
+                titulo="Artículo", descripcion="Resultados", tipo="Artículo científico", semillero_id=semillero_id
+            ))
+        self.assertEqual(len(self._spans(trazador, "EntregableService.crear_entregable")), 1)
+        self.assertEqual(len(self._spans(trazador, "Database.execute_query")), 2)
+
+    def test_exporta_formato_chrome(self):
+        ruta = os.path.join(self.directorio, "trazas.json")
+        with trazas.trazar(ruta):
+            GrupoService(self.db).obtener_por_id(1)
+
+        with open(ruta, encoding="utf-8") as archivo:
+            eventos = json.load(archivo)["traceEvents"]
+        self.assertTrue(eventos)
+        for evento in eventos:
+            self.assertEqual(evento["ph"], "X")
+            self.assertLessEqual({"name", "cat", "ts", "dur", "pid", "tid", "args"}, set(evento))
+        self.assertEqual(eventos[0]["name"], "GrupoService.obtener_por_id")
+        self.assertEqual(eventos[0]["cat"], "servicio")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,12 +11,42 @@ import json
 
 
 class Menu:
-    """Menú principal de la aplicación"""
-
-    def __init__(self, grupo_service, semillero_service, entregable_service):
-        self.grupo_service = grupo_service
-        self.semillero_service = semillero_service
-        self.entregable_service = entregable_service
+    """Menú principal de la aplicación
+
+    Los servicios se importan y construyen la primera vez que una opción del
+    menú los usa, para que el menú principal aparezca cuanto antes.
+    """
+
+    def __init__(self, db):
+        """
+        Args:
+            db (Database): Base de datos de la aplicación
+        """
+        self.db = db
+        self._grupo_service = None
+        self._semillero_service = None
+        self._entregable_service = None
+
+    @property
+    def grupo_service(self):
+        if self._grupo_service is None:
+            from services.grupo_service import GrupoService
+            self._grupo_service = GrupoService(self.db)
+        return self._grupo_service
+
+    @property
+    def semillero_service(self):
+        if self._semillero_service is None:
+            from services.semillero_service import SemilleroService
+            self._semillero_service = SemilleroService(self.db)
+        return self._semillero_service
+
+    @property
+    def entregable_service(self):
+        if self._entregable_service is None:
+            from services.entregable_service import EntregableService
+            self._entregable_service = EntregableService(self.db)
+        return self._entregable_service
 
     def mostrar_menu(self):
         """Muestra el menú principal de la aplicación"""
@@ -121,16 +151,8 @@ class Menu:
 
     def _listar_semilleros(self):
         """Muestra la lista de todos los semilleros disponibles (activos y pendientes)"""
-        # Obtener todos los semilleros
-        semilleros = self.semillero_service.obtener_todos()
-
-        if not semilleros:
-            print("\nNo hay semilleros registrados en el sistema.")
-            input("\nPresione Enter para continuar...")
-            return False
-
-        # Filtrar semilleros activos y pendientes
-        semilleros_validos = [s for s in semilleros if s.status in ["activo", "pendiente"]]
+        # Solo semilleros activos y pendientes, filtrados y ordenados en la base de datos
+        semilleros_validos = self.semillero_service.filtrar(status=["activo", "pendiente"])
 
         if not semilleros_validos:
             print("\nNo hay semilleros activos o pendientes en el sistema.")
@@ -142,11 +164,10 @@ class Menu:
         print("-" * 70)
 
         for semillero in semilleros_validos:
-            # Obtener nombre del grupo asociado
-            grupo = self.grupo_service.obtener_por_id(semillero.grupo_id)
-            grupo_nombre = grupo.nombre if grupo else "Grupo no encontrado"
+            # El nombre del grupo viene en la misma consulta
+            grupo_nombre = semillero.grupo_nombre or "Grupo no encontrado"
 
-            estado = semillero.status.upper()   
+            estado = semillero.status.upper()
             print(f"{semillero.id:<5} {semillero.nombre:<30} {estado:<10} {grupo_nombre:<20}")
 
         print("-" * 70)
@@ -300,15 +321,8 @@ class Menu:
     
     def _eliminar_semillero(self):
         """ Permite al usuario seleccionar un semillero (por ID) y eliminarlo """
-        semilleros = self.semillero_service.obtener_todos()
-        if not semilleros:
-            print("\nNo hay semilleros registrados en el sistema.")
-            input("\nPresione Enter para continuar...")
-            return False
-
-        # (Opcional) Solo mostrar semilleros activos/pendientes. Si quieres listar
-        # todos, comenta la siguiente línea:
-        semilleros = [s for s in semilleros if s.status in ["activo", "pendiente"]]
+        # Solo semilleros activos y pendientes, filtrados en la base de datos
+        semilleros = self.semillero_service.filtrar(status=["activo", "pendiente"])
 
         if not semilleros:
             print("\nNo hay semilleros activos o pendientes para eliminar.")
@@ -320,10 +334,9 @@ class Menu:
         print(f"{'ID':<5} {'NOMBRE':<30} {'ESTADO':<10} {'GRUPO':<20}")
         print("-" * 70)
         for sem in semilleros:
-            grupo = self.grupo_service.obtener_por_id(sem.grupo_id)
-            grupo_nombre = grupo.nombre if grupo else "Grupo no encontrado"
+            grupo_nombre = sem.grupo_nombre or "Grupo no encontrado"
             estado = sem.status.upper()
-            print(f"{sem.semillero_id:<5} {sem.nombre:<30} {estado:<10} {grupo_nombre:<20}")
+            print(f"{sem.id:<5} {sem.nombre:<30} {estado:<10} {grupo_nombre:<20}")
         print("-" * 70)
 
         # Pedir al usuario el ID a eliminar (o Enter para volver)
@@ -369,8 +382,13 @@ class Menu:
         return exito
 
     def _ver_detalles_semillero(self):
-        """Permite seleccionar y ver los detalles de un semillero"""
-        semilleros = self.semillero_service.obtener_todos()
+        """Permite buscar un semillero por texto y ver sus detalles"""
+        texto = input("\nTexto a buscar (nombre u objetivos, Enter para ver los primeros): ").strip()
+        if texto:
+            semilleros, _ = self.semillero_service.buscar(texto, tamano=50)
+        else:
+            semilleros, _ = self.semillero_service.obtener_pagina(tamano=50)
+
         if mostrar_lista_semilleros(semilleros):
             semillero_id = solicitar_id_semillero()
             if semillero_id is not None: